@@ -0,0 +1,33 @@
+"""Benchmarks for the conversions between graphs and SciPy sparse arrays.
+
+These time `to_scipy_sparse_array` and `from_scipy_sparse_array` on random
+graphs of up to a million edges, with and without edge weights.
+
+Run with ``asv run`` from the ``benchmarks`` directory.
+"""
+import random
+
+import networkx as nx
+
+
+class ConvertScipy:
+    """Conversions of random graphs to and from CSR arrays."""
+
+    params = ([10_000, 1_000_000], [False, True])
+    param_names = ["number_of_edges", "weighted"]
+
+    def setup(self, number_of_edges, weighted):
+        G = nx.gnm_random_graph(number_of_edges // 10, number_of_edges, seed=42)
+        if weighted:
+            rng = random.Random(42)
+            for u, v, d in G.edges(data=True):
+                d["weight"] = rng.random()
+        self.G = G
+        self.weight = "weight" if weighted else None
+        self.A = nx.to_scipy_sparse_array(G, weight=self.weight)
+
+    def time_to_scipy_sparse_array(self, number_of_edges, weighted):
+        nx.to_scipy_sparse_array(self.G, weight=self.weight)
+
+    def time_from_scipy_sparse_array(self, number_of_edges, weighted):
+        nx.from_scipy_sparse_array(self.A)
@@ -0,0 +1,123 @@
+"""Micro-benchmarks for the node wrappers built by `Node.wraps`.
+
+Every node stored in a graph is wrapped, so these time the operations that
+algorithms perform on nodes all the time: hashing and comparing them in
+dict lookups, reading attributes through the wrapper, and wrapping the
+nodes of the edges added to a graph.
+
+Run with ``asv run`` from the ``benchmarks`` directory.
+"""
+import random
+
+import networkx as nx
+from networkx.classes.components import Node
+
+
+class Slotted:
+    __slots__ = ["a"]
+
+    def __init__(self, a):
+        self.a = a
+
+
+class Keyed:
+    __slots__ = ["a"]
+
+    def __init__(self, a):
+        self.a = a
+
+    def __hash__(self):
+        return hash(self.a)
+
+    def __eq__(self, other):
+        return isinstance(other, Keyed) and self.a == other.a
+
+
+class NodeLookup:
+    """Dict lookups of plain and wrapped nodes of different types."""
+
+    params = (["int", "str", "tuple", "slotted", "keyed"], [False, True])
+    param_names = ["node_type", "wrapped"]
+    number_of_nodes = 10_000
+
+    def setup(self, node_type, wrapped):
+        make = {
+            "int": int,
+            "str": str,
+            "tuple": lambda i: (i, i),
+            "slotted": Slotted,
+            "keyed": Keyed,
+        }[node_type]
+        self.plain = [make(i) for i in range(self.number_of_nodes)]
+        self.wrapped = [Node.wraps(n) for n in self.plain]
+        self.nodes = self.wrapped if wrapped else self.plain
+        # graphs store wrapped nodes as keys
+        self.adj = dict.fromkeys(self.wrapped)
+
+    def time_lookup(self, node_type, wrapped):
+        adj = self.adj
+        for n in self.nodes:
+            adj[n]
+
+    def time_contains(self, node_type, wrapped):
+        adj = self.adj
+        for n in self.nodes:
+            n in adj
+
+    def time_build_dict(self, node_type, wrapped):
+        dict.fromkeys(self.nodes)
+
+
+class NodeAttributes:
+    """Attribute access and wrapping of nodes."""
+
+    number_of_nodes = 10_000
+
+    def setup(self):
+        self.ints = list(range(self.number_of_nodes))
+        self.slotted = [Slotted(i) for i in self.ints]
+        self.wrapped_ints = [Node.wraps(n) for n in self.ints]
+        self.wrapped_slotted = [Node.wraps(n) for n in self.slotted]
+
+    def time_ref(self):
+        for n in self.wrapped_ints:
+            n.ref
+
+    def time_int_attribute(self):
+        for n in self.wrapped_ints:
+            n.real
+
+    def time_slot_attribute(self):
+        for n in self.wrapped_slotted:
+            n.a
+
+    def time_wraps_int(self):
+        wraps = Node.wraps
+        for n in self.ints:
+            wraps(n)
+
+    def time_wraps_slotted(self):
+        wraps = Node.wraps
+        for n in self.slotted:
+            wraps(n)
+
+
+class AddEdges:
+    """Building graphs from edge lists, which wraps both nodes of every edge."""
+
+    params = (["Graph", "DiGraph"], ["int", "str", "tuple"])
+    param_names = ["graph_type", "node_type"]
+    number_of_edges = 100_000
+
+    def setup(self, graph_type, node_type):
+        make = {"int": int, "str": str, "tuple": lambda i: (i, i)}[node_type]
+        n = self.number_of_edges // 4
+        rng = random.Random(42)
+        self.edges = [
+            (make(rng.randrange(n)), make(rng.randrange(n)))
+            for _ in range(self.number_of_edges)
+        ]
+        self.graph_class = getattr(nx, graph_type)
+
+    def time_add_edges_from(self, graph_type, node_type):
+        self.graph_class().add_edges_from(self.edges)
@@ -1,6 +1,10 @@
-from networkx.utils import not_implemented_for, py_random_state
+import math
+from array import array
 
-__all__ = ["average_clustering"]
+import networkx as nx
+from networkx.utils import not_implemented_for, np_random_state, py_random_state
+
+__all__ = ["average_clustering", "transitivity", "triangles", "clustering"]
 
 
 @py_random_state(2)
@@ -62,3 +66,454 @@ def average_clustering(G, trials=1000, seed=None):
         if u in G[v]:
             triangles += 1
     return triangles / trials
+
+
+@np_random_state("seed")
+def transitivity(G, epsilon=0.01, delta=0.1, seed=None):
+    r"""Estimates the transitivity of G by wedge sampling.
+
+    The transitivity is the fraction of closed wedges (paths of length two,
+    the "triads" of :func:`~networkx.algorithms.cluster.transitivity`).
+    Wedges are sampled uniformly at random in growing batches until the
+    estimate is within `epsilon` of the transitivity with probability at
+    least ``1 - delta`` [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph or iterable of edges
+        An undirected graph, or the edges of one as pairs of nodes (any
+        further items, like edge data, are ignored). The edges are read once
+        into compact arrays, so they can be streamed from a file for graphs
+        too large to build, for instance with
+        :func:`~networkx.readwrite.edgelist.read_edgelist_batches`.
+        Self loops and repeated edges are ignored.
+
+    epsilon : float, optional (default=0.01)
+        Maximum absolute error of the estimate.
+
+    delta : float, optional (default=0.1)
+        Maximum probability that the error exceeds `epsilon`, or that the
+        transitivity is outside the confidence interval.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    t : float
+        Approximated transitivity.
+
+    interval : tuple
+        The bounds of a confidence interval of the transitivity at level
+        ``1 - delta``, of width at most ``2 * epsilon``.
+
+    Raises
+    ------
+    ValueError
+        If `epsilon` or `delta` are not in the open interval (0, 1).
+
+    NetworkXNotImplemented
+        If `G` is directed.
+
+    Notes
+    -----
+    After each batch of wedges, whose size doubles every time, the empirical
+    Bernstein bound [2]_ on the error is checked, and the sampling stops once
+    it is below `epsilon`. The bound is small when the transitivity is close
+    to 0 or 1. The sampling never takes more than the
+    $\ln(4 / \delta) / (2 \epsilon^2)$ wedges the Hoeffding bound requires,
+    and graphs with fewer wedges are counted exactly.
+
+    See Also
+    --------
+    networkx.algorithms.cluster.transitivity
+    triangles
+
+    References
+    ----------
+    .. [1] Schank, Thomas, and Dorothea Wagner. Approximating clustering
+       coefficient and transitivity. Universität Karlsruhe, Fakultät für
+       Informatik, 2004.
+       https://doi.org/10.5445/IR/1000001239
+    .. [2] Andreas Maurer and Massimiliano Pontil:
+       Empirical Bernstein Bounds and Sample Variance Penalization.
+       Proceedings of COLT, 2009.
+       https://arxiv.org/abs/0907.3740
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation
+    >>> G = nx.complete_graph(5)
+    >>> approximation.transitivity(G)
+    (1.0, (1.0, 1.0))
+    >>> G = nx.barabasi_albert_graph(2000, 5, seed=42)
+    >>> t, (low, high) = approximation.transitivity(G, epsilon=0.01, seed=42)
+    >>> low <= nx.transitivity(G) <= high
+    True
+    """
+    _check_bounds(epsilon, delta)
+    _, indptr, indices, keys = _adjacency_arrays(G)
+    wedges = _wedges(indptr)
+    closed, total, error = _estimate(
+        indptr, indices, keys, wedges, None, epsilon, delta, seed
+    )
+    if total[0] == 0:
+        return 0.0, (0.0, 0.0)
+    t = closed[0] / total[0]
+    return t, (max(0.0, t - error[0]), min(1.0, t + error[0]))
+
+
+@np_random_state("seed")
+def triangles(G, epsilon=0.01, delta=0.1, seed=None):
+    r"""Estimates the number of triangles in G by wedge sampling.
+
+    Every triangle closes three wedges, so the number of triangles is a
+    third of the number of wedges, which is known exactly from the degrees,
+    times the transitivity estimated by :func:`transitivity`.
+
+    Parameters
+    ----------
+    G : NetworkX graph or iterable of edges
+        An undirected graph, or the edges of one as pairs of nodes (any
+        further items, like edge data, are ignored). The edges are read once
+        into compact arrays, so they can be streamed from a file for graphs
+        too large to build. Self loops and repeated edges are ignored.
+
+    epsilon : float, optional (default=0.01)
+        Maximum absolute error of the estimated transitivity. The error of
+        the number of triangles is at most `epsilon` times a third of the
+        number of wedges.
+
+    delta : float, optional (default=0.1)
+        Maximum probability that the error exceeds its bound, or that the
+        number of triangles is outside the confidence interval.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    T : float
+        Approximated number of triangles in the graph.
+
+    interval : tuple
+        The bounds of a confidence interval of the number of triangles at
+        level ``1 - delta``.
+
+    Raises
+    ------
+    ValueError
+        If `epsilon` or `delta` are not in the open interval (0, 1).
+
+    NetworkXNotImplemented
+        If `G` is directed.
+
+    See Also
+    --------
+    networkx.algorithms.cluster.triangles
+    transitivity
+
+    Examples
+    --------
+    Triangles can be counted from edges streamed from a file:
+
+    >>> from networkx.algorithms import approximation
+    >>> nx.write_edgelist(nx.complete_graph(5), "test.edgelist", data=False)
+    >>> batches = nx.read_edgelist_batches("test.edgelist", nodetype=int)
+    >>> edges = (e for batch in batches for e in batch)
+    >>> approximation.triangles(edges)
+    (10.0, (10.0, 10.0))
+    """
+    _check_bounds(epsilon, delta)
+    _, indptr, indices, keys = _adjacency_arrays(G)
+    wedges = _wedges(indptr)
+    closed, total, error = _estimate(
+        indptr, indices, keys, wedges, None, epsilon, delta, seed
+    )
+    if total[0] == 0:
+        return 0.0, (0.0, 0.0)
+    t = closed[0] / total[0]
+    scale = wedges.sum() / 3
+    low, high = max(0.0, t - error[0]), min(1.0, t + error[0])
+    return t * scale, (low * scale, high * scale)
+
+
+@np_random_state("seed")
+def clustering(G, nodes=None, epsilon=0.05, delta=0.1, seed=None):
+    r"""Estimates the clustering coefficient of nodes by wedge sampling.
+
+    The clustering coefficient of a node is the fraction of the wedges
+    centered at the node that are closed, as in
+    :func:`~networkx.algorithms.cluster.clustering`. For each node, wedges
+    are sampled in growing batches until the estimates of all nodes are
+    within `epsilon` of their clustering coefficients with probability at
+    least ``1 - delta``. Nodes with no more wedges than a batch are counted
+    exactly.
+
+    Parameters
+    ----------
+    G : NetworkX graph or iterable of edges
+        An undirected graph, or the edges of one as pairs of nodes (any
+        further items, like edge data, are ignored). The edges are read once
+        into compact arrays, so they can be streamed from a file for graphs
+        too large to build. Self loops and repeated edges are ignored.
+
+    nodes : container of nodes, optional (default=all nodes in G)
+        Estimate the clustering of the nodes in this container.
+
+    epsilon : float, optional (default=0.05)
+        Maximum absolute error of the estimate of any node.
+
+    delta : float, optional (default=0.1)
+        Maximum probability that the error of some node exceeds `epsilon`,
+        or that some clustering coefficient is outside its confidence
+        interval.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    Returns
+    -------
+    clusterc : dictionary
+        Approximated clustering coefficient keyed by node.
+
+    intervals : dictionary
+        The bounds of the confidence interval of each node, which hold
+        together at level ``1 - delta``.
+
+    Raises
+    ------
+    ValueError
+        If `epsilon` or `delta` are not in the open interval (0, 1).
+
+    NetworkXNotImplemented
+        If `G` is directed.
+
+    NodeNotFound
+        If a node in `nodes` is not in `G`.
+
+    Notes
+    -----
+    The errors of the nodes are bounded as in :func:`transitivity`, with
+    `delta` split evenly between the nodes. The number of wedges sampled
+    for a node grows with the logarithm of the number of nodes, and does not
+    depend on its degree.
+
+    See Also
+    --------
+    networkx.algorithms.cluster.clustering
+    average_clustering
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation
+    >>> G = nx.complete_graph(5)
+    >>> G.add_edge(0, 5)
+    >>> clusterc, intervals = approximation.clustering(G)
+    >>> clusterc
+    {0: 0.6, 1: 1.0, 2: 1.0, 3: 1.0, 4: 1.0, 5: 0.0}
+    >>> intervals[0]
+    (0.6, 0.6)
+    """
+    import numpy as np
+
+    _check_bounds(epsilon, delta)
+    nodelist, indptr, indices, keys = _adjacency_arrays(G)
+    if nodes is None:
+        rows = np.arange(len(nodelist))
+    else:
+        index = {v: i for i, v in enumerate(nodelist)}
+        try:
+            if nodes in index:
+                nodes = [nodes]
+        except TypeError:
+            pass
+        try:
+            rows = np.array([index[v] for v in nodes], dtype=np.int64)
+        except KeyError as err:
+            raise nx.NodeNotFound(f"Node {err.args[0]} is not in G") from err
+    wedges = _wedges(indptr)
+    closed, total, error = _estimate(
+        indptr, indices, keys, wedges, rows, epsilon, delta, seed
+    )
+    clusterc = {}
+    intervals = {}
+    for i, c, k, e in zip(rows.tolist(), closed, total, error.tolist()):
+        v = nodelist[i]
+        c = c / k if k else 0.0
+        clusterc[v] = c
+        intervals[v] = (max(0.0, c - e), min(1.0, c + e))
+    return clusterc, intervals
+
+
+def _check_bounds(epsilon, delta):
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon must be in the interval (0, 1)")
+    if not 0 < delta < 1:
+        raise ValueError("delta must be in the interval (0, 1)")
+
+
+def _adjacency_arrays(G):
+    """Returns the nodes, the CSR arrays of the symmetric adjacency without
+    self loops and the sorted keys ``u * n + v`` of its entries.
+
+    `G` is a graph or an iterable of edges, which is read once.
+    """
+    import numpy as np
+
+    if isinstance(G, nx.Graph):
+        if G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for directed type")
+        nodelist = list(G)
+        n = len(nodelist)
+        if n == 0:
+            keys = np.zeros(0, dtype=np.int64)
+        else:
+            A = nx.to_scipy_sparse_array(G, nodelist, weight=None, format="csr")
+            A = A.tocoo()
+            row = A.row.astype(np.int64)
+            col = A.col.astype(np.int64)
+            keys = np.unique(row[row != col] * n + col[row != col])
+    else:
+        index = {}
+        heads = array("q")
+        tails = array("q")
+        for e in G:
+            u, v = e[0], e[1]
+            heads.append(index.setdefault(u, len(index)))
+            tails.append(index.setdefault(v, len(index)))
+        nodelist = list(index)
+        n = len(nodelist)
+        row = np.frombuffer(heads, dtype=np.int64)
+        col = np.frombuffer(tails, dtype=np.int64)
+        edges = row != col
+        row, col = row[edges], col[edges]
+        keys = np.unique(np.concatenate([row * n + col, col * n + row]))
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys // n, minlength=n) if n else [], out=indptr[1:])
+    return nodelist, indptr, keys % n if n else keys, keys
+
+
+def _wedges(indptr):
+    """Returns the number of wedges centered at each node."""
+    import numpy as np
+
+    degrees = np.diff(indptr)
+    return degrees * (degrees - 1) // 2
+
+
+def _closed(keys, n, a, b):
+    """Returns a boolean array telling which pairs ``(a, b)`` are edges."""
+    import numpy as np
+
+    if len(keys) == 0:
+        return np.zeros(len(a), dtype=bool)
+    wanted = (a * n + b).ravel()
+    # searching sorted keys is much faster for large arrays
+    order = np.argsort(wanted)
+    found = np.empty(len(wanted), dtype=bool)
+    pos = np.minimum(np.searchsorted(keys, wanted[order]), len(keys) - 1)
+    found[order] = keys[pos] == wanted[order]
+    return found.reshape(a.shape)
+
+
+def _closed_exact(indptr, indices, keys, rows):
+    """Returns the number of closed wedges centered at each row."""
+    import numpy as np
+
+    n = len(indptr) - 1
+    degrees = indptr[rows + 1] - indptr[rows]
+    closed = np.zeros(len(rows), dtype=np.int64)
+    for d in np.unique(degrees[degrees > 1]).tolist():
+        select = np.flatnonzero(degrees == d)
+        first, second = np.triu_indices(d, 1)
+        # enough rows at once to check about a million wedges
+        step = max(1, 2**20 // len(first))
+        for lo in range(0, len(select), step):
+            chunk = select[lo : lo + step]
+            start = indptr[rows[chunk]][:, None]
+            a = indices[start + first]
+            b = indices[start + second]
+            closed[chunk] = _closed(keys, n, a, b).sum(axis=1)
+    return closed
+
+
+def _estimate(indptr, indices, keys, wedges, rows, epsilon, delta, seed):
+    """Returns the closed wedges, sampled wedges and error bound of each row.
+
+    With `rows` None the wedges of the whole graph are sampled uniformly, and
+    the arrays have a single item. Otherwise the wedges of each row are
+    sampled, and the error bounds hold for all rows together.
+    """
+    import numpy as np
+
+    n = len(indptr) - 1
+    if rows is None:
+        size = 1
+        total_wedges = np.array([wedges.sum()])
+        cumulative = np.cumsum(wedges)
+    else:
+        size = len(rows)
+        total_wedges = wedges[rows]
+    # half of `delta` for the checks after each batch, half for the fallback
+    log_fallback = math.log(4 * max(size, 1) / delta)
+    k_max = math.ceil(log_fallback / (2 * epsilon**2))
+    k = min(k_max, 256)
+    n_checks = 1 + math.ceil(math.log2(k_max / k))
+    log_term = math.log(4 * max(size, 1) * n_checks / delta)
+
+    closed = np.zeros(size, dtype=np.int64)
+    total = np.zeros(size, dtype=np.int64)
+    error = np.zeros(size)
+    # rows with at most k wedges are counted exactly
+    active = np.arange(size)
+    done = 0
+    while len(active):
+        exact = active[total_wedges[active] <= k]
+        if len(exact):
+            if rows is None:
+                closed[:] = _closed_exact(indptr, indices, keys, np.arange(n)).sum()
+            else:
+                closed[exact] = _closed_exact(indptr, indices, keys, rows[exact])
+            total[exact] = total_wedges[exact]
+            error[exact] = 0
+            active = active[total_wedges[active] > k]
+            if not len(active):
+                break
+        batch = k - done
+        # enough rows at once to sample about a million wedges
+        step = max(1, 2**20 // batch)
+        for lo in range(0, len(active), step):
+            chunk = active[lo : lo + step]
+            if rows is None:
+                centers = np.searchsorted(
+                    cumulative, seed.random(batch) * cumulative[-1], side="right"
+                )
+                owner = np.zeros(batch, dtype=np.int64)
+            else:
+                centers = np.repeat(rows[chunk], batch)
+                owner = np.repeat(np.arange(len(chunk)), batch)
+            # two distinct neighbors of each center
+            start = indptr[centers]
+            degree = indptr[centers + 1] - start
+            first = (seed.random(len(centers)) * degree).astype(np.int64)
+            second = (seed.random(len(centers)) * (degree - 1)).astype(np.int64)
+            second += second >= first
+            found = _closed(keys, n, indices[start + first], indices[start + second])
+            closed[chunk] += np.bincount(owner[found], minlength=len(chunk))
+        total[active] = k
+        done = k
+        p = closed[active] / k
+        if k == k_max:
+            error[active] = math.sqrt(log_fallback / (2 * k))
+            break
+        # empirical Bernstein bound of the estimate of each row
+        variance = p * (1 - p) * k / (k - 1)
+        bound = np.sqrt(2 * variance * log_term / k) + 7 * log_term / (3 * (k - 1))
+        error[active] = bound
+        active = active[bound > epsilon]
+        k = min(k_max, 2 * k)
+    return closed.tolist(), total.tolist(), error
@@ -1,4 +1,7 @@
+import pytest
+
 import networkx as nx
+from networkx.algorithms import approximation as approx
 from networkx.algorithms.approximation import average_clustering
 
 # This approximation has to be exact in regular graphs
@@ -39,3 +42,66 @@ def test_complete():
     assert average_clustering(G, trials=len(G) // 2) == 1
     G = nx.complete_graph(7)
     assert average_clustering(G, trials=len(G) // 2) == 1
+
+
+class TestWedgeSampling:
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+        cls.G = nx.powerlaw_cluster_graph(500, 4, 0.5, seed=42)
+
+    def test_exact(self):
+        # graphs with few wedges are counted exactly
+        for G in (nx.petersen_graph(), nx.complete_graph(6), nx.karate_club_graph()):
+            t, interval = approx.transitivity(G, seed=1)
+            assert t == pytest.approx(nx.transitivity(G))
+            assert interval == (t, t)
+            T, interval = approx.triangles(G, seed=1)
+            assert T == pytest.approx(sum(nx.triangles(G).values()) / 3)
+            clusterc, intervals = approx.clustering(G, seed=1)
+            assert clusterc == pytest.approx(nx.clustering(G))
+            assert all(low == high for low, high in intervals.values())
+
+    def test_transitivity(self):
+        expected = nx.transitivity(self.G)
+        for seed in range(3):
+            t, (low, high) = approx.transitivity(self.G, epsilon=0.02, seed=seed)
+            assert abs(t - expected) <= 0.02
+            assert low <= expected <= high
+            assert high - low <= 0.04
+        T, (low, high) = approx.triangles(self.G, epsilon=0.02, seed=1)
+        expected = sum(nx.triangles(self.G).values()) / 3
+        assert low <= expected <= high
+
+    def test_clustering(self):
+        expected = nx.clustering(self.G)
+        clusterc, intervals = approx.clustering(self.G, epsilon=0.1, seed=1)
+        assert clusterc.keys() == expected.keys()
+        for v, c in clusterc.items():
+            assert abs(c - expected[v]) <= 0.1
+            low, high = intervals[v]
+            assert low <= expected[v] <= high
+        clusterc, intervals = approx.clustering(self.G, [0, 1], seed=1)
+        assert list(clusterc) == [0, 1]
+        clusterc, _ = approx.clustering(self.G, 0, seed=1)
+        assert list(clusterc) == [0]
+        with pytest.raises(nx.NodeNotFound):
+            approx.clustering(self.G, [-1])
+
+    def test_edges(self):
+        G = nx.karate_club_graph()
+        edges = list(G.edges()) + [(0, 0), (1, 0)]
+        assert approx.transitivity(iter(edges)) == approx.transitivity(G)
+        assert approx.clustering(iter(edges)) == approx.clustering(G)
+        assert approx.transitivity(iter([])) == (0.0, (0.0, 0.0))
+        t, (low, high) = approx.transitivity(iter(self.G.edges(data=True)), seed=3)
+        assert low <= nx.transitivity(self.G) <= high
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            approx.transitivity(self.G, epsilon=0)
+        with pytest.raises(ValueError):
+            approx.clustering(self.G, delta=1)
+        with pytest.raises(nx.NetworkXNotImplemented):
+            approx.triangles(nx.DiGraph([(0, 1)]))
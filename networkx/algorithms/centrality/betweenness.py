@@ -1,19 +1,33 @@
 """Betweenness centrality measures."""
+import math
 import warnings
-from collections import deque
+from collections import defaultdict, deque
 from heapq import heappop, heappush
 from itertools import count
 
+import networkx as nx
 from networkx.algorithms.shortest_paths.weighted import _weight_function
 from networkx.utils import py_random_state
 from networkx.utils.decorators import not_implemented_for
 
-__all__ = ["betweenness_centrality", "edge_betweenness_centrality", "edge_betweenness"]
+__all__ = [
+    "betweenness_centrality",
+    "approximate_betweenness_centrality",
+    "edge_betweenness_centrality",
+    "edge_betweenness",
+]
 
 
 @py_random_state(5)
 def betweenness_centrality(
-    G, k=None, normalized=True, weight=None, endpoints=False, seed=None
+    G,
+    k=None,
+    normalized=True,
+    weight=None,
+    endpoints=False,
+    seed=None,
+    n_jobs=None,
+    executor=None,
 ):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
@@ -59,6 +73,15 @@ def betweenness_centrality(
         See :ref:`Randomness<randomness>`.
         Note that this is only used if k is not None.
 
+    n_jobs : int, optional (default=None)
+        The number of worker processes to split the source nodes across.
+        None or 1 runs every source in the calling process, -1 uses all
+        CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run chunks of source nodes on instead of a new
+        process pool.
+
     Returns
     -------
     nodes : dictionary
@@ -66,6 +89,7 @@ def betweenness_centrality(
 
     See Also
     --------
+    approximate_betweenness_centrality
     edge_betweenness_centrality
     load_centrality
 
@@ -77,7 +101,14 @@ def betweenness_centrality(
 
     For approximate betweenness calculations set k=#samples to use
     k nodes ("pivots") to estimate the betweenness values. For an estimate
-    of the number of pivots needed see [3]_.
+    of the number of pivots needed see [3]_, or let
+    :func:`approximate_betweenness_centrality` pick the number of pivots
+    for a given error bound.
+
+    With `n_jobs` or `executor` the (sampled) source nodes are split into
+    chunks whose contributions are accumulated separately and then summed.
+    The pivots are drawn before the split, so a given `seed` gives the same
+    result for any number of workers, up to floating point rounding.
 
     For weighted graphs the edge weights must be greater than zero.
     Zero edge weights can produce an infinite number of equal length
@@ -119,22 +150,22 @@ def betweenness_centrality(
        Sociometry 40: 35–41, 1977
        https://doi.org/10.2307/3033543
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         nodes = seed.sample(list(G.nodes()), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        if endpoints:
-            betweenness, _ = _accumulate_endpoints(betweenness, S, P, sigma, s)
-        else:
-            betweenness, _ = _accumulate_basic(betweenness, S, P, sigma, s)
+    if n_jobs is not None or executor is not None:
+        partials = nx.utils.parallel_graph_imap(
+            _betweenness_sources,
+            G,
+            nodes,
+            args=(weight, endpoints),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        betweenness = _sum_partials(dict.fromkeys(G, 0.0), partials)
+    else:
+        betweenness = _betweenness_sources(G, nodes, weight, endpoints)
     # rescaling
     betweenness = _rescale(
         betweenness,
@@ -147,8 +178,183 @@ def betweenness_centrality(
     return betweenness
 
 
+@py_random_state(6)
+def approximate_betweenness_centrality(
+    G,
+    normalized=True,
+    weight=None,
+    endpoints=False,
+    epsilon=0.01,
+    delta=0.1,
+    seed=None,
+    n_jobs=None,
+    executor=None,
+):
+    r"""Compute an approximation of betweenness centrality for nodes with
+    a guaranteed error bound.
+
+    Source nodes ("pivots") are sampled in growing batches, as in
+    `betweenness_centrality` with `k`, until the estimate of every node
+    is within `epsilon` of its normalized betweenness centrality with
+    probability at least ``1 - delta``.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.
+
+    normalized : bool, optional (default=True)
+      If True the betweenness values are normalized as in
+      :func:`betweenness_centrality`.
+
+    weight : None or string, optional (default=None)
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+      Weights are used to calculate weighted shortest paths, so they are
+      interpreted as distances.
+
+    endpoints : bool, optional (default=False)
+      If True include the endpoints in the shortest path counts.
+
+    epsilon : float, optional (default=0.01)
+      Maximum absolute error of the normalized betweenness of any node.
+
+    delta : float, optional (default=0.1)
+      Maximum probability that some node exceeds the error `epsilon`.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    n_jobs : int, optional (default=None)
+        The number of worker processes to split each batch of pivots across.
+        None or 1 runs every source in the calling process, -1 uses all
+        CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run chunks of pivots on instead of a new process pool.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with betweenness centrality as the value.
+
+    Raises
+    ------
+    ValueError
+        If `epsilon` or `delta` are not in the open interval (0, 1).
+
+    See Also
+    --------
+    betweenness_centrality
+
+    Notes
+    -----
+    The normalized betweenness of a node is the mean over all source nodes
+    of a bounded per-source contribution, so it is estimated by the mean
+    over a uniform sample of pivots drawn without replacement [1]_. After
+    each batch, whose size doubles every time, the empirical Bernstein
+    bound [2]_ is checked for every node; it is small when the
+    contributions vary little, which is the case for most nodes of large
+    graphs. The sampling stops early once the bound is below `epsilon`.
+    It never takes more pivots than the Hoeffding bound
+    $R^2 \ln(4n/\delta) / (2\epsilon^2)$ requires, where $R \le 2$ bounds
+    the normalized contributions, and never more than $n$, in which case
+    the result is exact.
+
+    For weighted graphs the edge weights must be greater than zero.
+
+    References
+    ----------
+    .. [1] Ulrik Brandes and Christian Pich:
+       Centrality Estimation in Large Networks.
+       International Journal of Bifurcation and Chaos 17(7):2303-2318, 2007.
+       https://dx.doi.org/10.1142/S0218127407018403
+    .. [2] Andreas Maurer and Massimiliano Pontil:
+       Empirical Bernstein Bounds and Sample Variance Penalization.
+       Proceedings of COLT, 2009.
+       https://arxiv.org/abs/0907.3740
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> bc = nx.approximate_betweenness_centrality(G, epsilon=0.1, seed=1)
+    >>> bc == nx.betweenness_centrality(G)
+    True
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon must be in the interval (0, 1)")
+    if not 0 < delta < 1:
+        raise ValueError("delta must be in the interval (0, 1)")
+    n = len(G)
+    if n == 0:
+        return {}
+    if endpoints:
+        norm, bound = 1 / (n * (n - 1)) if n > 1 else 0, n - 1
+    else:
+        norm, bound = 1 / ((n - 1) * (n - 2)) if n > 2 else 0, n - 2
+    # the normalized betweenness is the mean of `scale` times the
+    # contributions of each source, which are at most `bound`
+    scale = n * norm
+    R = scale * bound
+    # half of `delta` for the checks after each batch, half for the fallback
+    k_max = min(n, math.ceil(R * R * math.log(4 * n / delta) / (2 * epsilon**2)))
+    if k_max == 0:
+        # no node lies on a path between two other nodes
+        return dict.fromkeys(G, 0.0)
+    k = min(k_max, 64)
+    n_checks = 1 + max(0, math.ceil(math.log2(k_max / k)))
+    log_term = math.log(4 * n * n_checks / delta)
+
+    pivots = seed.sample(list(G), k_max)
+    total = dict.fromkeys(G, 0.0)
+    squares = defaultdict(float)
+    done = 0
+    while done < k_max:
+        batch = pivots[done:k]
+        if n_jobs is not None or executor is not None:
+            moments = nx.utils.parallel_graph_imap(
+                _betweenness_moments,
+                G,
+                batch,
+                args=(weight, endpoints),
+                n_jobs=n_jobs,
+                executor=executor,
+            )
+        else:
+            moments = [_betweenness_moments(G, batch, weight, endpoints)]
+        for batch_total, batch_squares in moments:
+            _sum_partials(total, [batch_total])
+            _sum_partials(squares, [batch_squares])
+        done = k
+        if done == k_max:
+            break
+        # empirical Bernstein bound on the normalized estimate of each node;
+        # nodes never reached only contribute the second term
+        variance = max(
+            ((squares[v] - total[v] ** 2 / done) / (done - 1) for v in squares),
+            default=0.0,
+        )
+        error = scale * math.sqrt(2 * max(variance, 0) * log_term / done)
+        error += 7 * R * log_term / (3 * (done - 1))
+        if error <= epsilon:
+            break
+        k = min(k_max, 2 * k)
+
+    return _rescale(
+        total,
+        n,
+        normalized=normalized,
+        directed=G.is_directed(),
+        k=done if done < n else None,
+        endpoints=endpoints,
+    )
+
+
 @py_random_state(4)
-def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=None):
+def edge_betweenness_centrality(
+    G, k=None, normalized=True, weight=None, seed=None, n_jobs=None, executor=None
+):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge $e$ is the sum of the
@@ -188,6 +394,15 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
         See :ref:`Randomness<randomness>`.
         Note that this is only used if k is not None.
 
+    n_jobs : int, optional (default=None)
+        The number of worker processes to split the source nodes across.
+        None or 1 runs every source in the calling process, -1 uses all
+        CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run chunks of source nodes on instead of a new
+        process pool.
+
     Returns
     -------
     edges : dictionary
@@ -206,6 +421,9 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
     Zero edge weights can produce an infinite number of equal length
     paths between pairs of nodes.
 
+    With `n_jobs` or `executor` the (sampled) source nodes are split into
+    chunks whose contributions are accumulated separately and then summed.
+
     References
     ----------
     .. [1]  A Faster Algorithm for Betweenness Centrality. Ulrik Brandes,
@@ -216,21 +434,24 @@ def edge_betweenness_centrality(G, k=None, normalized=True, weight=None, seed=No
        Social Networks 30(2):136-145, 2008.
        https://doi.org/10.1016/j.socnet.2007.11.001
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
-    # b[e]=0 for e in G.edges()
-    betweenness.update(dict.fromkeys(G.edges(), 0.0))
     if k is None:
         nodes = G
     else:
-        nodes = seed.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+        nodes = seed.sample(list(G.nodes()), k)
+    if n_jobs is not None or executor is not None:
+        partials = nx.utils.parallel_graph_imap(
+            _edge_betweenness_sources,
+            G,
+            nodes,
+            args=(weight,),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        betweenness = dict.fromkeys(G, 0.0)
+        betweenness.update(dict.fromkeys(G.edges(wrap=False), 0.0))
+        betweenness = _sum_partials(betweenness, partials)
+    else:
+        betweenness = _edge_betweenness_sources(G, nodes, weight)
     # rescaling
     for n in G:  # remove nodes to only return edges
         del betweenness[n]
@@ -253,6 +474,77 @@ def edge_betweenness(G, k=None, normalized=True, weight=None, seed=None):
 # helpers for betweenness centrality
 
 
+def _betweenness_sources(G, sources, weight, endpoints):
+    """Returns the unscaled betweenness accumulated from `sources`."""
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        if endpoints:
+            betweenness, _ = _accumulate_endpoints(betweenness, S, P, sigma, s)
+        else:
+            betweenness, _ = _accumulate_basic(betweenness, S, P, sigma, s)
+    return betweenness
+
+
+def _edge_betweenness_sources(G, sources, weight):
+    """Returns the unscaled node and edge betweenness accumulated from
+    `sources`.
+
+    """
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    # b[e]=0 for e in G.edges()
+    betweenness.update(dict.fromkeys(G.edges(wrap=False), 0.0))
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
+    return betweenness
+
+
+def _betweenness_moments(G, sources, weight, endpoints):
+    """Returns the sums and the sums of squares of the unscaled betweenness
+    contributed by each of `sources`.
+
+    """
+    total = dict.fromkeys(G, 0.0)
+    squares = defaultdict(float)
+    for s in sources:
+        if weight is None:  # use BFS
+            S, P, sigma, _ = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma, _ = _single_source_dijkstra_path_basic(G, s, weight)
+        # the dependencies of `s` are its contributions to the other nodes
+        if endpoints:
+            squares[s] += (len(S) - 1) ** 2
+            total, delta = _accumulate_endpoints(total, S, P, sigma, s)
+            del delta[s]
+            for v, d in delta.items():
+                squares[v] += (d + 1) ** 2
+        else:
+            total, delta = _accumulate_basic(total, S, P, sigma, s)
+            del delta[s]
+            for v, d in delta.items():
+                squares[v] += d * d
+    return total, squares
+
+
+def _sum_partials(betweenness, partials):
+    """Adds the values of the dicts in `partials` to `betweenness`."""
+    for partial in partials:
+        for key, value in partial.items():
+            betweenness[key] += value
+    return betweenness
+
+
 def _single_source_shortest_path_basic(G, s):
     S = []
     P = {}
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import networkx as nx
@@ -288,6 +290,74 @@ class TestBetweennessCentrality:
         for n in sorted(G):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
 
+    @pytest.mark.parametrize("n_jobs", (1, 2))
+    @pytest.mark.parametrize("endpoints", (False, True))
+    def test_parallel(self, n_jobs, endpoints):
+        G = nx.les_miserables_graph()
+        for kwargs in ({}, {"weight": "weight"}, {"k": 20, "seed": 42}):
+            b = nx.betweenness_centrality(G, endpoints=endpoints, **kwargs)
+            p = nx.betweenness_centrality(
+                G, endpoints=endpoints, n_jobs=n_jobs, **kwargs
+            )
+            assert p == pytest.approx(b, abs=1e-12)
+        G = nx.gnp_random_graph(30, 0.1, seed=5, directed=True)
+        with ThreadPoolExecutor(2) as executor:
+            p = nx.betweenness_centrality(G, executor=executor)
+        assert p == pytest.approx(nx.betweenness_centrality(G), abs=1e-12)
+
+
+class TestApproximateBetweennessCentrality:
+    @pytest.mark.parametrize("endpoints", (False, True))
+    @pytest.mark.parametrize("normalized", (False, True))
+    def test_exact_on_small_graphs(self, endpoints, normalized):
+        """All nodes end up as pivots when the bound needs more than n."""
+        G = nx.krackhardt_kite_graph()
+        b = nx.approximate_betweenness_centrality(
+            G, normalized=normalized, endpoints=endpoints, seed=1
+        )
+        b_answer = nx.betweenness_centrality(
+            G, normalized=normalized, endpoints=endpoints
+        )
+        assert b == pytest.approx(b_answer, abs=1e-12)
+
+    def test_error_bound(self):
+        G = nx.barabasi_albert_graph(400, 2, seed=3)
+        b_answer = nx.betweenness_centrality(G)
+        epsilon = 0.2
+        for seed in range(2):
+            b = nx.approximate_betweenness_centrality(G, epsilon=epsilon, seed=seed)
+            assert max(abs(b[v] - b_answer[v]) for v in G) <= epsilon
+            assert b != b_answer  # stopped before sampling every node
+
+    @pytest.mark.parametrize("n_jobs", (None, 2))
+    def test_seed(self, n_jobs):
+        G = nx.barabasi_albert_graph(500, 2, seed=3)
+        b = nx.approximate_betweenness_centrality(G, epsilon=0.2, seed=7)
+        p = nx.approximate_betweenness_centrality(G, epsilon=0.2, seed=7, n_jobs=n_jobs)
+        assert p == pytest.approx(b, abs=1e-12)
+
+    @pytest.mark.parametrize(
+        "G",
+        (
+            nx.empty_graph(0),
+            nx.empty_graph(1),
+            nx.empty_graph(2),
+            nx.path_graph(2),
+            nx.path_graph(3),
+        ),
+    )
+    @pytest.mark.parametrize("normalized", (True, False))
+    @pytest.mark.parametrize("endpoints", (True, False))
+    def test_tiny_graphs(self, G, normalized, endpoints):
+        kwargs = {"normalized": normalized, "endpoints": endpoints}
+        b = nx.approximate_betweenness_centrality(G, **kwargs)
+        assert b == pytest.approx(nx.betweenness_centrality(G, **kwargs))
+
+    @pytest.mark.parametrize("kwargs", ({"epsilon": 0}, {"delta": 1}))
+    def test_invalid_parameters(self, kwargs):
+        with pytest.raises(ValueError):
+            nx.approximate_betweenness_centrality(nx.path_graph(4), **kwargs)
+
 
 class TestWeightedBetweennessCentrality:
     def test_K5(self):
@@ -603,6 +673,19 @@ class TestEdgeBetweennessCentrality:
         for n in sorted(G.edges()):
             assert b[n] == pytest.approx(b_answer[n], abs=1e-7)
 
+    @pytest.mark.parametrize("n_jobs", (1, 2))
+    def test_parallel(self, n_jobs):
+        G = nx.les_miserables_graph()
+        for kwargs in ({}, {"weight": "weight"}, {"k": 20, "seed": 42}):
+            b = nx.edge_betweenness_centrality(G, **kwargs)
+            p = nx.edge_betweenness_centrality(G, n_jobs=n_jobs, **kwargs)
+            assert p == pytest.approx(b, abs=1e-12)
+        G = nx.MultiDiGraph(nx.gnp_random_graph(20, 0.2, seed=5, directed=True))
+        G.add_edges_from(list(G.edges)[:5])
+        with ThreadPoolExecutor(2) as executor:
+            p = nx.edge_betweenness_centrality(G, executor=executor)
+        assert p == pytest.approx(nx.edge_betweenness_centrality(G), abs=1e-12)
+
 
 class TestWeightedEdgeBetweennessCentrality:
     def test_K5(self):
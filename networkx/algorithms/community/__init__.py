@@ -24,3 +24,4 @@ from networkx.algorithms.community.modularity_max import *
 from networkx.algorithms.community.quality import *
 from networkx.algorithms.community.community_utils import *
 from networkx.algorithms.community.louvain import *
+from networkx.algorithms.community.leiden import *
@@ -10,7 +10,7 @@ __all__ = ["label_propagation_communities", "asyn_lpa_communities"]
 
 
 @py_random_state(2)
-def asyn_lpa_communities(G, weight=None, seed=None):
+def asyn_lpa_communities(G, weight=None, seed=None, labels=None, dirty=None):
     """Returns communities in `G` as detected by asynchronous label
     propagation.
 
@@ -44,11 +44,44 @@ def asyn_lpa_communities(G, weight=None, seed=None):
         Indicator of random number generation state.
         See :ref:`Randomness<randomness>`.
 
+    labels : dict, optional (default=None)
+        The initial labels of the nodes, for example the labels found
+        before a change to the graph. Nodes with the same label start in
+        the same community, and nodes that have no label start in
+        communities of their own. If None, each node starts with a unique
+        label.
+
+    dirty : iterable of nodes, optional (default=None)
+        The nodes whose labels may no longer be the most frequent among
+        their neighbors, for example the endpoints of the edges added or
+        removed since `labels` were computed. Only these nodes, and the
+        nodes whose neighbors change label later on, are updated. If None,
+        all nodes are updated.
+
     Returns
     -------
     communities : iterable
         Iterable of communities given as sets of nodes.
 
+    Examples
+    --------
+    After a change to the graph, the labels of the communities found
+    before only need to be propagated from the endpoints of the changed
+    edges:
+
+    >>> from networkx.algorithms.community import asyn_lpa_communities
+    >>> G = nx.barbell_graph(5, 0)
+    >>> communities = list(asyn_lpa_communities(G, seed=42))
+    >>> sorted(map(sorted, communities))
+    [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+    >>> labels = {n: i for i, c in enumerate(communities) for n in c}
+    >>> G.add_edges_from([(10, 0), (10, 1), (10, 2)])
+    >>> communities = asyn_lpa_communities(
+    ...     G, seed=42, labels=labels, dirty=[0, 1, 2, 10]
+    ... )
+    >>> sorted(map(sorted, communities))
+    [[0, 1, 2, 3, 4, 10], [5, 6, 7, 8, 9]]
+
     Notes
     -----
     Edge weight attributes must be numerical.
@@ -60,12 +93,19 @@ def asyn_lpa_communities(G, weight=None, seed=None):
            networks." Physical Review E 76.3 (2007): 036106.
     """
 
-    labels = {n: i for i, n in enumerate(G)}
+    labels = _initial_labels(G, labels)
+    if dirty is not None:
+        active = {n for n in dirty if n in G}
     cont = True
 
     while cont:
         cont = False
-        nodes = list(G)
+        if dirty is None:
+            nodes = list(G)
+        else:
+            # the nodes with a neighbor that changed label
+            nodes = [n for n in G if n in active]
+            active = set()
         seed.shuffle(nodes)
 
         for node in nodes:
@@ -101,12 +141,14 @@ def asyn_lpa_communities(G, weight=None, seed=None):
             if labels[node] not in best_labels:
                 labels[node] = seed.choice(best_labels)
                 cont = True
+                if dirty is not None:
+                    active.update(G[node])
 
     yield from groups(labels).values()
 
 
 @not_implemented_for("directed")
-def label_propagation_communities(G):
+def label_propagation_communities(G, labels=None, dirty=None, method="auto"):
     """Generates community sets determined by label propagation
 
     Finds communities in `G` using a semi-synchronous label propagation
@@ -118,6 +160,27 @@ def label_propagation_communities(G):
     G : graph
         An undirected NetworkX graph.
 
+    labels : dict, optional (default=None)
+        The initial labels of the nodes, for example the labels found
+        before a change to the graph. Nodes with the same label start in
+        the same community, and nodes that have no label start in
+        communities of their own. If None, each node starts with a unique
+        label.
+
+    dirty : iterable of nodes, optional (default=None)
+        The nodes whose labels may no longer be the most frequent among
+        their neighbors, for example the endpoints of the edges added or
+        removed since `labels` were computed. Only these nodes, and the
+        nodes whose neighbors change label later on, are updated. If None,
+        all nodes are updated.
+
+    method : string, optional (default="auto")
+        The implementation to use: "sequential" updates one node at a time,
+        "vectorized" updates all the nodes with the same color at once with
+        NumPy and SciPy, which is much faster for large graphs. Both find
+        the same communities. "auto" uses "vectorized" for graphs with at
+        least 100000 edges if NumPy and SciPy are installed.
+
     Returns
     -------
     communities : iterable
@@ -128,6 +191,35 @@ def label_propagation_communities(G):
     NetworkXNotImplemented
        If the graph is directed
 
+    ValueError
+       If `method` is not one of "auto", "sequential" or "vectorized".
+
+    Examples
+    --------
+    >>> from networkx.algorithms.community import label_propagation_communities
+    >>> G = nx.barbell_graph(5, 0)
+    >>> communities = label_propagation_communities(G)
+    >>> sorted(map(sorted, communities))
+    [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+
+    After adding a node, only the new node and its neighbors need to be
+    updated:
+
+    >>> labels = {n: i for i, c in enumerate(communities) for n in c}
+    >>> G.add_edges_from([(10, 0), (10, 1), (10, 2)])
+    >>> communities = label_propagation_communities(G, labels, dirty=[0, 1, 2, 10])
+    >>> sorted(map(sorted, communities))
+    [[0, 1, 2, 3, 4, 10], [5, 6, 7, 8, 9]]
+
+    Notes
+    -----
+    The nodes are colored such that neighbors have different colors, and in
+    each round the nodes of one color after the other are updated. A node
+    keeps its label if it is one of the most frequent labels among its
+    neighbors, and otherwise takes the largest of these labels.
+    Only the nodes with a neighbor that changed label in the previous round
+    are updated again.
+
     References
     ----------
     .. [1] Cordasco, G., & Gargano, L. (2010, December). Community detection
@@ -135,14 +227,39 @@ def label_propagation_communities(G):
        Applications of Social Network Analysis (BASNA), 2010 IEEE International
        Workshop on (pp. 1-8). IEEE.
     """
-    coloring = _color_network(G)
+    if method not in ("auto", "sequential", "vectorized"):
+        raise ValueError(f"Unknown method {method!r}")
+    if method == "auto":
+        method = "sequential"
+        if dirty is None and G.number_of_edges() >= 100_000:
+            try:
+                import numpy
+                import scipy
+            except ImportError:
+                pass
+            else:
+                method = "vectorized"
+
     # Create a unique label for each node in the graph
-    labeling = {v: k for k, v in enumerate(G)}
-    while not _labeling_complete(labeling, G):
-        # Update the labels of every node with the same color.
-        for color, nodes in coloring.items():
-            for n in nodes:
-                _update_label(n, labeling, G)
+    labeling = _initial_labels(G, labels)
+    if method == "vectorized":
+        active = G if dirty is None else [n for n in dirty if n in G]
+        labeling = _vectorized_label_propagation(G, _color_network(G), labeling, active)
+    elif dirty is not None:
+        _incremental_label_propagation(G, labeling, {n for n in dirty if n in G})
+    else:
+        coloring = _color_network(G)
+        active = set(G)
+        while active:
+            # The nodes with a neighbor that changed label since their last
+            # update, which may no longer have a most frequent label.
+            changed = set()
+            # Update the labels of every node with the same color.
+            for color, nodes in coloring.items():
+                for n in nodes:
+                    if (n in active or n in changed) and _update_label(n, labeling, G):
+                        changed.update(G[n])
+            active = changed
 
     clusters = defaultdict(set)
     for node, label in labeling.items():
@@ -150,6 +267,141 @@ def label_propagation_communities(G):
     return clusters.values()
 
 
+def _initial_labels(G, labels):
+    """Returns a dict keyed by node to integer labels.
+
+    Nodes with the same label in `labels` get the same integer label, and
+    nodes without a label get a unique one. Without `labels` the label of
+    each node is its position in `G`.
+    """
+    if labels is None:
+        return {v: k for k, v in enumerate(G)}
+    ids = {}
+    labeling = {}
+    for v in G:
+        if v in labels:
+            label = labels[v]
+            if label not in ids:
+                ids[label] = len(ids)
+            labeling[v] = ids[label]
+    k = len(ids)
+    for v in G:
+        if v not in labeling:
+            labeling[v] = k
+            k += 1
+    return labeling
+
+
+def _incremental_label_propagation(G, labeling, active):
+    """Updates `labeling` by semi-synchronous label propagation from the
+    nodes in `active`.
+
+    Only the nodes that are updated are colored, greedily as they are
+    reached, so that the cost depends on the part of the graph whose labels
+    change rather than on the size of the graph.
+    """
+    colors = {}
+
+    def color(n):
+        if n not in colors:
+            used = {colors[u] for u in G[n] if u in colors}
+            c = 0
+            while c in used:
+                c += 1
+            colors[n] = c
+        return colors[n]
+
+    while active:
+        changed = set()
+        # the nodes to update in this round, by color
+        todo = defaultdict(list)
+        for n in active:
+            todo[color(n)].append(n)
+        c = 0
+        while c <= max(todo):
+            for n in todo.pop(c, ()):
+                if _update_label(n, labeling, G):
+                    for u in G[n]:
+                        if u not in changed:
+                            changed.add(u)
+                            # neighbors of a later color are updated in
+                            # this round, as they are in a full round
+                            if color(u) > c and u not in active:
+                                todo[colors[u]].append(u)
+            if not todo:
+                break
+            c += 1
+        active = changed
+
+
+def _vectorized_label_propagation(G, coloring, labeling, active):
+    """Returns the labeling found by semi-synchronous label propagation.
+
+    All the nodes of a color are updated at once with array operations, which
+    gives the same labels as updating them one at a time because they are
+    not adjacent.
+    """
+    import numpy as np
+
+    nodes = list(G)
+    index = {v: i for i, v in enumerate(nodes)}
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format="csr")
+    indptr, indices = A.indptr, A.indices
+    degrees = np.diff(indptr)
+    labels = np.array([labeling[v] for v in nodes], dtype=np.int64)
+    colors = [
+        np.array([index[v] for v in c], dtype=np.int64) for c in coloring.values()
+    ]
+    pending = np.zeros(len(nodes), dtype=bool)
+    pending[[index[v] for v in active]] = True
+
+    while pending.any():
+        changed = np.zeros(len(nodes), dtype=bool)
+        for color in colors:
+            rows = color[(pending[color] | changed[color]) & (degrees[color] > 0)]
+            if len(rows) == 0:
+                continue
+            # the (row, neighbor label) pairs of the edges of each row
+            counts = degrees[rows]
+            owner = np.repeat(np.arange(len(rows)), counts)
+            starts = np.repeat(indptr[rows] - np.cumsum(counts) + counts, counts)
+            nbr_labels = labels[indices[starts + np.arange(len(owner))]]
+            order = np.lexsort((nbr_labels, owner))
+            owner = owner[order]
+            nbr_labels = nbr_labels[order]
+            # frequency of each distinct label among the neighbors of a row
+            first = np.flatnonzero(
+                np.r_[
+                    True,
+                    (owner[1:] != owner[:-1]) | (nbr_labels[1:] != nbr_labels[:-1]),
+                ]
+            )
+            freq = np.diff(np.r_[first, len(owner)])
+            owner = owner[first]
+            nbr_labels = nbr_labels[first]
+            max_freq = np.zeros(len(rows), dtype=np.int64)
+            np.maximum.at(max_freq, owner, freq)
+            best = freq == max_freq[owner]
+            owner = owner[best]
+            nbr_labels = nbr_labels[best]
+            # keep the label if it is one of the best, otherwise take the
+            # largest best label, which comes last (Prec-Max)
+            keep = np.zeros(len(rows), dtype=bool)
+            keep[owner[nbr_labels == labels[rows][owner]]] = True
+            new_labels = np.empty(len(rows), dtype=np.int64)
+            new_labels[owner] = nbr_labels
+            moved = ~keep
+            rows = rows[moved]
+            labels[rows] = new_labels[moved]
+            # mark the neighbors of the rows that changed label
+            counts = degrees[rows]
+            starts = np.repeat(indptr[rows] - np.cumsum(counts) + counts, counts)
+            changed[indices[starts + np.arange(counts.sum())]] = True
+        pending = changed
+
+    return dict(zip(nodes, labels.tolist()))
+
+
 def _color_network(G):
     """Colors the network so that neighboring nodes all have distinct colors.
 
@@ -165,19 +417,6 @@ def _color_network(G):
     return coloring
 
 
-def _labeling_complete(labeling, G):
-    """Determines whether or not LPA is done.
-
-    Label propagation is complete when all nodes have a label that is
-    in the set of highest frequency labels amongst its neighbors.
-
-    Nodes with no neighbors are considered complete.
-    """
-    return all(
-        labeling[v] in _most_frequent_labels(v, labeling, G) for v in G if len(G[v]) > 0
-    )
-
-
 def _most_frequent_labels(node, labeling, G):
     """Returns a set of all labels with maximum frequency in `labeling`.
 
@@ -199,11 +438,15 @@ def _update_label(node, labeling, G):
 
     The algorithm is explained in: 'Community Detection via Semi-Synchronous
     Label Propagation Algorithms' Cordasco and Gargano, 2011
+
+    Returns True if the label of the node changed.
     """
     high_labels = _most_frequent_labels(node, labeling, G)
+    label = labeling[node]
     if len(high_labels) == 1:
         labeling[node] = high_labels.pop()
     elif len(high_labels) > 1:
         # Prec-Max
         if labeling[node] not in high_labels:
             labeling[node] = max(high_labels)
+    return labeling[node] != label
@@ -0,0 +1,342 @@
+"""Function for detecting communities based on the Leiden Community Detection
+Algorithm"""
+
+from collections import defaultdict, deque
+from math import exp
+
+from networkx.algorithms.community.louvain import _neighbor_weights
+from networkx.algorithms.community.quality import modularity
+from networkx.utils import not_implemented_for, py_random_state
+
+__all__ = ["leiden_communities"]
+
+
+@not_implemented_for("directed")
+@py_random_state("seed")
+def leiden_communities(
+    G,
+    weight="weight",
+    resolution=1,
+    threshold=0.0000001,
+    seed=None,
+    partition=None,
+    randomness=0.01,
+):
+    r"""Find the best partition of a graph using the Leiden Community Detection
+    Algorithm.
+
+    The Leiden algorithm [1]_ improves the Louvain algorithm
+    (see :func:`louvain_communities`), which may yield communities that are badly
+    connected or even disconnected. It repeats three phases:
+
+    1. The fast local move phase moves single nodes to the neighbor community
+       with the largest modularity gain, or to a community of their own.
+       Instead of sweeping over all nodes until none moves, it keeps a queue of
+       the nodes to visit, which starts with all nodes in random order, and
+       when a node moves its neighbors outside of its new community are added
+       to the queue.
+    2. The refinement phase splits each community into subcommunities. Every
+       node starts in a subcommunity of its own, and the nodes that are well
+       connected to their community are merged in random order into
+       subcommunities in the same community that are themselves well connected.
+       A node joins a subcommunity $S$ with probability proportional to
+       $\exp(\Delta Q / \theta)$ among those with $\Delta Q \geq 0$, where
+       $\theta$ is the `randomness`.
+    3. The aggregation phase builds a new graph whose nodes are the refined
+       subcommunities, and the partition of the new graph into the communities
+       of the first phase is the starting point of the next iteration.
+
+    The modularity gain of moving a node $i$ into a community $C$, and the
+    condition for a set $S$ of nodes to be well connected to its community $C$,
+    are
+
+    .. math::
+        \Delta Q = \frac{k_{i,C}}{m} - \gamma\frac{ \Sigma_C \cdot k_i}{2m^2}
+        \qquad
+        k_{S,C-S} \geq \gamma\frac{\Sigma_S \cdot (\Sigma_C - \Sigma_S)}{2m}
+
+    where $m$ is the size of the graph, $k_{i,C}$ is the sum of the weights of the
+    links from $i$ to nodes in $C$, $k_i$ is the sum of the weights of the links
+    incident to node $i$, $\Sigma_C$ is the sum of the weights of the links incident
+    to nodes in $C$ and $\gamma$ is the resolution parameter.
+
+    The iterations stop when every community is a single node of the aggregated
+    graph, or when the modularity (computed by :func:`modularity`) of the
+    partition found in the first phase improves by no more than `threshold`.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+    weight : string or None, optional (default="weight")
+        The name of an edge attribute that holds the numerical value
+        used as a weight. If None then each edge has weight 1.
+    resolution : float, optional (default=1)
+        If resolution is less than 1, the algorithm favors larger communities.
+        Greater than 1 favors smaller communities
+    threshold : float, optional (default=0.0000001)
+        Modularity gain threshold for each iteration. If the gain of modularity
+        between 2 iterations of the algorithm is less than the given threshold
+        then the algorithm stops and returns the resulting communities.
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+    partition : iterable of sets of nodes, optional (default=None)
+        The communities to start from, for example the result of an earlier call
+        for a graph that has changed a little since. Nodes of `G` that are in
+        none of the sets start in communities of their own, and nodes that are
+        not in `G` are ignored. If None, every node starts in a community of
+        its own.
+    randomness : float, optional (default=0.01)
+        The randomness $\theta$ of the refinement phase, which must be
+        positive. Smaller values make nodes join the subcommunity with the
+        largest gain more often.
+
+    Returns
+    -------
+    list
+        A list of sets (partition of `G`). Each set represents one community and
+        contains all the nodes that constitute it.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is directed.
+
+    ValueError
+        If `randomness` is not positive.
+
+    Examples
+    --------
+    >>> import networkx.algorithms.community as nx_comm
+    >>> G = nx.ring_of_cliques(4, 5)
+    >>> communities = nx_comm.leiden_communities(G, seed=42)
+    >>> sorted(sorted(c) for c in communities)
+    [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9], [10, 11, 12, 13, 14], [15, 16, 17, 18, 19]]
+
+    Starting from the communities of a graph that changed a little usually
+    takes a single iteration:
+
+    >>> G.add_edge(20, 0)
+    >>> communities = nx_comm.leiden_communities(G, seed=42, partition=communities)
+    >>> sorted(sorted(c) for c in communities)[0]
+    [0, 1, 2, 3, 4, 20]
+
+    Notes
+    -----
+    Every community found by the Leiden algorithm is connected [1]_. When the
+    algorithm stops, no node of the last aggregated graph can be moved to
+    another community to improve the modularity, but moving a single node of
+    `G` may still improve it.
+
+    References
+    ----------
+    .. [1] Traag, V.A., Waltman, L. & van Eck, N.J. From Louvain to Leiden: guaranteeing
+       well-connected communities. Sci Rep 9, 5233 (2019). https://doi.org/10.1038/s41598-019-41695-z
+
+    See Also
+    --------
+    louvain_communities
+    """
+    if randomness <= 0:
+        raise ValueError(f"randomness must be positive. Got {randomness}.")
+    # the graph of each iteration: neighbors without self loops, the
+    # degrees (with self loops) and the nodes of G that each node stands for
+    nbrs = {u: {} for u in G}
+    degrees = dict.fromkeys(G, 0)
+    for u, v, wt in G.edges(data=weight, default=1, wrap=False):
+        degrees[u] += wt
+        degrees[v] += wt
+        if u != v:
+            nbrs[u][v] = nbrs[u].get(v, 0) + wt
+            nbrs[v][u] = nbrs[v].get(u, 0) + wt
+    members = {u: [u] for u in G}
+    m = sum(degrees.values()) / 2
+    if m == 0:
+        return [{u} for u in G]
+
+    node2com = {}
+    if partition is not None:
+        for i, community in enumerate(partition):
+            for u in community:
+                if u in nbrs:
+                    node2com[u] = i
+    # ids after those of the given communities for the other nodes
+    com = max(node2com.values(), default=-1)
+    for u in G:
+        if u not in node2com:
+            com += 1
+            node2com[u] = com
+    if partition is not None:
+        # the given communities may be disconnected
+        node2com = _connected_parts(nbrs, node2com)
+    communities = _communities(node2com, members)
+    mod = modularity(G, communities, weight=weight, resolution=resolution)
+
+    while True:
+        _fast_move_nodes(nbrs, degrees, node2com, m, resolution, seed)
+        communities = _communities(node2com, members)
+        new_mod = modularity(G, communities, weight=weight, resolution=resolution)
+        if len(communities) == len(nbrs) or new_mod - mod <= threshold:
+            return communities
+        mod = new_mod
+        refined = _refine(nbrs, degrees, node2com, m, resolution, randomness, seed)
+        nbrs, degrees, node2com, members = _aggregate(
+            nbrs, degrees, node2com, members, refined
+        )
+
+
+def _communities(node2com, members):
+    """Returns the list of sets of the nodes of G in each community."""
+    communities = defaultdict(set)
+    for u, com in node2com.items():
+        communities[com].update(members[u])
+    return list(communities.values())
+
+
+def _connected_parts(nbrs, node2com):
+    """Returns the community of each node after splitting the communities
+    into their connected parts."""
+    parts = {}
+    part = 0
+    for u in nbrs:
+        if u in parts:
+            continue
+        com = node2com[u]
+        parts[u] = part
+        queue = [u]
+        for v in queue:
+            for w in nbrs[v]:
+                if w not in parts and node2com[w] == com:
+                    parts[w] = part
+                    queue.append(w)
+        part += 1
+    return parts
+
+
+def _fast_move_nodes(nbrs, degrees, node2com, m, resolution, seed):
+    """Moves nodes to their best community, visiting the nodes in a queue.
+
+    Parameters
+    ----------
+    nbrs : dictionary
+        The neighbors of each node and the edge weights, without self loops.
+    degrees : dictionary
+        The weighted degree of each node.
+    node2com : dictionary
+        The community of each node, updated in place.
+    m : number
+        The size of the graph.
+    resolution : positive number
+        The resolution parameter for computing the modularity of a partition
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state.
+        See :ref:`Randomness<randomness>`.
+
+    """
+    Stot = defaultdict(float)
+    for u, com in node2com.items():
+        Stot[com] += degrees[u]
+    # ids for new communities
+    empty = max(node2com.values()) + 1
+    queue = list(nbrs)
+    seed.shuffle(queue)
+    queue = deque(queue)
+    queued = set(queue)
+    while queue:
+        u = queue.popleft()
+        queued.remove(u)
+        degree = degrees[u]
+        com = node2com[u]
+        weights2com = _neighbor_weights(nbrs[u], node2com)
+        Stot[com] -= degree
+        best_com = com
+        best_mod = 2 * weights2com.get(com, 0) - resolution * Stot[com] * degree / m
+        if best_mod < 0:
+            # a community of its own
+            best_com = empty
+            best_mod = 0
+        for nbr_com, wt in weights2com.items():
+            gain = 2 * wt - resolution * Stot[nbr_com] * degree / m
+            if gain > best_mod:
+                best_mod = gain
+                best_com = nbr_com
+        Stot[best_com] += degree
+        if best_com != com:
+            if best_com == empty:
+                empty += 1
+            node2com[u] = best_com
+            for v in nbrs[u]:
+                if v not in queued and node2com[v] != best_com:
+                    queue.append(v)
+                    queued.add(v)
+
+
+def _refine(nbrs, degrees, node2com, m, resolution, randomness, seed):
+    """Returns the subcommunity of each node after merging well connected nodes
+    into well connected subcommunities of their community."""
+    Stot = defaultdict(float)
+    for u, com in node2com.items():
+        Stot[com] += degrees[u]
+    refined = {u: u for u in nbrs}
+    Sref = dict(degrees)
+    size = dict.fromkeys(nbrs, 1)
+    # the weight of the edges between each subcommunity and the rest of its
+    # community
+    external = {}
+    for u, com in node2com.items():
+        external[u] = sum(wt for v, wt in nbrs[u].items() if node2com[v] == com)
+    nodes = list(nbrs)
+    seed.shuffle(nodes)
+    for u in nodes:
+        if size[refined[u]] > 1:
+            continue
+        com = node2com[u]
+        degree = degrees[u]
+        if external[u] < resolution * degree * (Stot[com] - degree) / (2 * m):
+            continue
+        weights2sub = defaultdict(float)
+        for v, wt in nbrs[u].items():
+            if node2com[v] == com:
+                weights2sub[refined[v]] += wt
+        # the gains of the well connected subcommunities, relative to staying
+        candidates = [(u, 0.0)]
+        for sub, wt in weights2sub.items():
+            well_connected = external[sub] >= resolution * Sref[sub] * (
+                Stot[com] - Sref[sub]
+            ) / (2 * m)
+            gain = (wt - resolution * degree * Sref[sub] / (2 * m)) / m
+            if well_connected and gain >= 0:
+                candidates.append((sub, gain))
+        best = max(gain for _, gain in candidates)
+        probs = [exp((gain - best) / randomness) for _, gain in candidates]
+        r = seed.random() * sum(probs)
+        for (sub, _), p in zip(candidates, probs):
+            r -= p
+            if r < 0:
+                break
+        if sub != u:
+            refined[u] = sub
+            Sref[sub] += degree
+            size[sub] += 1
+            size[u] = 0
+            external[sub] += external[u] - 2 * weights2sub[sub]
+    return refined
+
+
+def _aggregate(nbrs, degrees, node2com, members, refined):
+    """Returns the graph of the subcommunities, with each subcommunity in the
+    community of its nodes."""
+    new_nbrs = {}
+    new_degrees = defaultdict(float)
+    new_node2com = {}
+    new_members = defaultdict(list)
+    for u, sub in refined.items():
+        if sub not in new_nbrs:
+            new_nbrs[sub] = defaultdict(float)
+            new_node2com[sub] = node2com[u]
+        new_degrees[sub] += degrees[u]
+        new_members[sub].extend(members[u])
+        for v, wt in nbrs[u].items():
+            if refined[v] != sub:
+                new_nbrs[sub][refined[v]] += wt
+    return new_nbrs, new_degrees, new_node2com, new_members
@@ -2,6 +2,7 @@
 Algorithm"""
 
 from collections import defaultdict, deque
+from importlib.util import find_spec
 
 import networkx as nx
 from networkx.algorithms.community import modularity
@@ -12,7 +13,7 @@ __all__ = ["louvain_communities", "louvain_partitions"]
 
 @py_random_state("seed")
 def louvain_communities(
-    G, weight="weight", resolution=1, threshold=0.0000001, seed=None
+    G, weight="weight", resolution=1, threshold=0.0000001, seed=None, method="auto"
 ):
     r"""Find the best partition of a graph using the Louvain Community Detection
     Algorithm.
@@ -73,6 +74,15 @@ def louvain_communities(
     seed : integer, random_state, or None (default)
         Indicator of random number generation state.
         See :ref:`Randomness<randomness>`.
+    method : string, optional (default="auto")
+        The engine that moves the nodes in the first phase, one of
+
+        - "sequential": the nodes are moved one at a time in random order.
+        - "vectorized": the moves are computed with NumPy and SciPy on the
+          sparse adjacency matrix of the graph, for all nodes at once.
+          This is much faster on large graphs.
+        - "auto": "vectorized" for graphs with at least 100000 edges if
+          NumPy and SciPy are installed, otherwise "sequential".
 
     Returns
     -------
@@ -80,6 +90,11 @@ def louvain_communities(
         A list of sets (partition of `G`). Each set represents one community and contains
         all the nodes that constitute it.
 
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the above.
+
     Examples
     --------
     >>> import networkx as nx
@@ -93,6 +108,14 @@ def louvain_communities(
     The order in which the nodes are considered can affect the final output. In the algorithm
     the ordering happens using a random shuffle.
 
+    The vectorized engine works in rounds: the nodes next to a node that moved in the
+    previous round compute their best move for the partition at the start of the round,
+    and a random half of the nodes with a positive gain make it. A node that is alone
+    in its community only joins another such node with a smaller index, so that pairs
+    of nodes do not keep swapping communities [4]_.
+    The first phase ends when no node can improve the modularity. The partitions are
+    as good as those of the sequential engine but not the same.
+
     References
     ----------
     .. [1] Blondel, V.D. et al. Fast unfolding of communities in
@@ -101,20 +124,23 @@ def louvain_communities(
        well-connected communities. Sci Rep 9, 5233 (2019). https://doi.org/10.1038/s41598-019-41695-z
     .. [3] Nicolas Dugué, Anthony Perez. Directed Louvain : maximizing modularity in directed networks.
         [Research Report] Université d’Orléans. 2015. hal-01231784. https://hal.archives-ouvertes.fr/hal-01231784
+    .. [4] Hao Lu, Mahantesh Halappanavar, Ananth Kalyanaraman. Parallel heuristics for
+       scalable community detection. Parallel Computing 47, 19-37 (2015).
+       https://doi.org/10.1016/j.parco.2015.03.003
 
     See Also
     --------
     louvain_partitions
     """
 
-    d = louvain_partitions(G, weight, resolution, threshold, seed)
+    d = louvain_partitions(G, weight, resolution, threshold, seed, method)
     q = deque(d, maxlen=1)
     return q.pop()
 
 
 @py_random_state("seed")
 def louvain_partitions(
-    G, weight="weight", resolution=1, threshold=0.0000001, seed=None
+    G, weight="weight", resolution=1, threshold=0.0000001, seed=None, method="auto"
 ):
     """Yields partitions for each level of the Louvain Community Detection Algorithm
 
@@ -146,6 +172,9 @@ def louvain_partitions(
     seed : integer, random_state, or None (default)
      Indicator of random number generation state.
      See :ref:`Randomness<randomness>`.
+    method : string, optional (default="auto")
+     The engine that moves the nodes in the first phase: "sequential",
+     "vectorized" or "auto". See :func:`louvain_communities`.
 
     Yields
     ------
@@ -153,6 +182,11 @@ def louvain_partitions(
         A list of sets (partition of `G`). Each set represents one community and contains
         all the nodes that constitute it.
 
+    Raises
+    ------
+    ValueError
+        If `method` is not one of "auto", "sequential" or "vectorized".
+
     References
     ----------
     .. [1] Blondel, V.D. et al. Fast unfolding of communities in
@@ -163,6 +197,9 @@ def louvain_partitions(
     louvain_communities
     """
 
+    if _use_vectorized(G, method):
+        yield from _vectorized_partitions(G, weight, resolution, threshold, seed)
+        return
     partition = [{u} for u in G.nodes()]
     mod = modularity(G, partition, resolution=resolution, weight=weight)
     is_directed = G.is_directed()
@@ -171,7 +208,7 @@ def louvain_partitions(
     else:
         graph = G.__class__()
         graph.add_nodes_from(G)
-        graph.add_weighted_edges_from(G.edges(data=weight, default=1))
+        graph.add_weighted_edges_from(G.edges(data=weight, default=1, wrap=False))
 
     m = graph.size(weight="weight")
     partition, inner_partition, improvement = _one_level(
@@ -222,7 +259,15 @@ def _one_level(G, m, partition, resolution=1, is_directed=False, seed=None):
     else:
         degrees = dict(G.degree(weight="weight"))
         Stot = [deg for deg in degrees.values()]
-    nbrs = {u: {v: data["weight"] for v, data in G[u].items() if v != u} for u in G}
+    if is_directed:
+        # the weights of the edges to and from each neighbor
+        nbrs = {u: defaultdict(float) for u in G}
+        for u, v, wt in G.edges(data="weight", wrap=False):
+            if u != v:
+                nbrs[u][v] += wt
+                nbrs[v][u] += wt
+    else:
+        nbrs = {u: {v: data["weight"] for v, data in G[u].items() if v != u} for u in G}
     rand_nodes = list(G.nodes)
     seed.shuffle(rand_nodes)
     nb_moves = 1
@@ -304,7 +349,7 @@ def _gen_graph(G, partition):
             nodes.update(G.nodes[node].get("nodes", {node}))
         H.add_node(i, nodes=nodes)
 
-    for node1, node2, wt in G.edges(data=True):
+    for node1, node2, wt in G.edges(data=True, wrap=False):
         wt = wt["weight"]
         com1 = node2com[node1]
         com2 = node2com[node2]
@@ -320,9 +365,191 @@ def _convert_multigraph(G, weight, is_directed):
     else:
         H = nx.Graph()
     H.add_nodes_from(G)
-    for u, v, wt in G.edges(data=weight, default=1):
+    for u, v, wt in G.edges(data=weight, default=1, wrap=False):
         if H.has_edge(u, v):
             H[u][v]["weight"] += wt
         else:
             H.add_edge(u, v, weight=wt)
     return H
+
+
+def _use_vectorized(G, method):
+    """Returns True if `method` selects the vectorized engine for `G`."""
+    if method not in ("auto", "sequential", "vectorized"):
+        raise ValueError(f"Unknown method {method!r}")
+    if method == "auto":
+        if G.number_of_edges() < 100_000:
+            return False
+        return all(find_spec(name) is not None for name in ("numpy", "scipy"))
+    return method == "vectorized"
+
+
+def _vectorized_partitions(G, weight, resolution, threshold, seed):
+    """Yields the partitions of each level of the Louvain algorithm computed
+    with NumPy arrays.
+
+    The levels are computed on the CSR adjacency matrix of `G`, see
+    :func:`_vectorized_one_level`.
+    """
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    rng = np.random.RandomState(seed.randint(0, 2**31 - 1))
+    nodes = list(G)
+    is_directed = G.is_directed()
+    A = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=weight, dtype=float)
+    if not is_directed:
+        # count self loops twice so that the row sums are the degrees
+        n = A.shape[0]
+        loops = sp.sparse.csr_array(
+            (A.diagonal(), (np.arange(n), np.arange(n))), shape=(n, n)
+        )
+        A = (A + loops).tocsr()
+    m = float(A.sum()) if is_directed else float(A.sum()) / 2
+    # the community of each node of G
+    node2com = np.arange(len(nodes))
+    mod = _array_modularity(A, node2com, m, resolution, is_directed)
+    level = 0
+    while True:
+        com, improvement = _vectorized_one_level(A, m, resolution, is_directed, rng)
+        if level > 0 and not improvement:
+            return
+        level += 1
+        node2com = com[node2com]
+        yield _array_partition(nodes, node2com)
+        new_mod = _array_modularity(A, com, m, resolution, is_directed)
+        if new_mod - mod <= threshold:
+            return
+        mod = new_mod
+        # the communities are the nodes of the next level
+        n = A.shape[0]
+        P = sp.sparse.csr_array(
+            (np.ones(n), (np.arange(n), com)), shape=(n, com.max() + 1)
+        )
+        A = (P.T @ A @ P).tocsr()
+
+
+def _vectorized_one_level(A, m, resolution, is_directed, rng):
+    """Returns the communities of the nodes of the sparse array `A` after the
+    first phase of the Louvain algorithm, numbered from 0 in the order of the
+    nodes they started from, and whether any node moved.
+
+    The nodes move in rounds. In each round the nodes with a neighbor that
+    moved in the previous round compute their best move, and a random half
+    of the nodes with an improving move make it.
+    """
+    import numpy as np
+
+    n = A.shape[0]
+    out_degree = A.sum(axis=1)
+    in_degree = A.sum(axis=0) if is_directed else out_degree
+    # the neighbors, without self loops; like the sequential engine, the
+    # weight to a community sums the edges to it and from it
+    A = A.tocoo()
+    loop = A.row == A.col
+    A.data[loop] = 0
+    A = A.tocsr()
+    if is_directed:
+        A = (A + A.T).tocsr()
+    A.eliminate_zeros()
+    indptr, indices, data = A.indptr, A.indices, A.data
+    com = np.arange(n)
+    Stot_out = out_degree.copy()
+    Stot_in = in_degree.copy() if is_directed else Stot_out
+    size = np.ones(n, dtype=int)
+    # only nodes with a neighbor that moved can have a better move
+    active = np.arange(n)
+    improvement = False
+    while len(active):
+        # the edges of the active nodes
+        degree = indptr[active + 1] - indptr[active]
+        rows = np.repeat(active, degree)
+        if len(rows) == 0:
+            break
+        edges = np.arange(len(rows)) + np.repeat(
+            indptr[active] - np.cumsum(degree) + degree, degree
+        )
+        # the weight from each node to each of its neighbor communities
+        key = rows * n + com[indices[edges]]
+        order = np.argsort(key)
+        key = key[order]
+        first = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        u, c = np.divmod(key[first], n)
+        wt = np.add.reduceat(data[edges[order]], first)
+        # the gain of moving u to c after taking it out of its community
+        own = c == com[u]
+        k_out, k_in = out_degree[u], in_degree[u]
+        if is_directed:
+            gain = (
+                wt
+                - resolution
+                * (
+                    k_out * (Stot_in[c] - own * k_in)
+                    + k_in * (Stot_out[c] - own * k_out)
+                )
+                / m
+            )
+        else:
+            gain = 2 * wt - resolution * (Stot_out[c] - own * k_out) * k_out / m
+        # u stays unless the best gain is positive and better than staying
+        stay = np.zeros(n)
+        stay[u[own]] = np.maximum(gain[own], 0)
+        start = np.flatnonzero(np.r_[True, u[1:] != u[:-1]])
+        best_gain = np.maximum.reduceat(gain, start)
+        best = np.flatnonzero(
+            gain == np.repeat(best_gain, np.diff(np.r_[start, len(u)]))
+        )
+        best = best[np.r_[True, u[best[1:]] != u[best[:-1]]]]
+        best = best[gain[best] > stay[u[best]]]
+        source, target = u[best], c[best]
+        # singletons only join singletons with a smaller label, which
+        # stops pairs of nodes from swapping communities
+        swap = (size[com[source]] == 1) & (size[target] == 1) & (target > com[source])
+        source, target = source[~swap], target[~swap]
+        if len(source) == 0:
+            break
+        improvement = True
+        # moving all nodes at once makes them oscillate
+        half = rng.random_sample(len(source)) < 0.5
+        moved, target = source[half], target[half]
+        old = com[moved]
+        np.subtract.at(Stot_out, old, out_degree[moved])
+        np.add.at(Stot_out, target, out_degree[moved])
+        if is_directed:
+            np.subtract.at(Stot_in, old, in_degree[moved])
+            np.add.at(Stot_in, target, in_degree[moved])
+        np.subtract.at(size, old, 1)
+        np.add.at(size, target, 1)
+        com[moved] = target
+        # the gains of the neighbors of the moved nodes change
+        degree = indptr[moved + 1] - indptr[moved]
+        edges = np.arange(degree.sum()) + np.repeat(
+            indptr[moved] - np.cumsum(degree) + degree, degree
+        )
+        active = np.union1d(source[~half], indices[edges])
+    _, com = np.unique(com, return_inverse=True)
+    return com, improvement
+
+
+def _array_modularity(A, com, m, resolution, is_directed):
+    """Returns the modularity of the partition `com` of the sparse array `A`
+    with total edge weight `m`."""
+    import numpy as np
+
+    n = A.shape[0]
+    rows = np.repeat(np.arange(n), np.diff(A.indptr))
+    inner = float(A.data[com[rows] == com[A.indices]].sum())
+    out_degree = np.bincount(com, A.sum(axis=1), n)
+    if is_directed:
+        in_degree = np.bincount(com, A.sum(axis=0), n)
+        return inner / m - resolution * float(out_degree @ in_degree) / m**2
+    return inner / (2 * m) - resolution * float(out_degree @ out_degree) / (2 * m) ** 2
+
+
+def _array_partition(nodes, node2com):
+    """Returns the list of sets of `nodes` with the same community."""
+    partition = [set() for _ in range(node2com.max() + 1)]
+    for u, c in zip(nodes, node2com.tolist()):
+        partition[c].add(u)
+    return partition
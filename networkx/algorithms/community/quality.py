@@ -343,7 +343,11 @@ def modularity(G, communities, weight="weight", resolution=1):
 
     def community_contribution(community):
         comm = set(community)
-        L_c = sum(wt for u, v, wt in G.edges(comm, data=weight, default=1) if v in comm)
+        L_c = sum(
+            wt
+            for u, v, wt in G.edges(comm, data=weight, default=1, wrap=False)
+            if v in comm
+        )
 
         out_degree_sum = sum(out_degree[u] for u in comm)
         in_degree_sum = sum(in_degree[u] for u in comm) if directed else out_degree_sum
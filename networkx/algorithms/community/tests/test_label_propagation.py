@@ -108,6 +108,66 @@ def test_connected_communities():
     assert result in ground_truth
 
 
+@pytest.mark.parametrize("method", ("sequential", "vectorized"))
+def test_labels_and_dirty(method):
+    if method == "vectorized":
+        pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+    G = nx.caveman_graph(3, 5)
+    G.add_edges_from([(4, 5), (9, 10)])
+    communities = label_propagation_communities(G, method=method)
+    ground_truth = {frozenset(range(5 * i, 5 * (i + 1))) for i in range(3)}
+    assert {frozenset(c) for c in communities} == ground_truth
+
+    # the given labels are kept if they are stable
+    labels = {n: "abc"[n // 5] for n in G}
+    communities = label_propagation_communities(G, labels, method=method)
+    assert {frozenset(c) for c in communities} == ground_truth
+    communities = label_propagation_communities(G, labels, dirty=[], method=method)
+    assert {frozenset(c) for c in communities} == ground_truth
+
+    # only dirty nodes and the nodes they reach are updated
+    labels = {n: "abc"[n // 5] for n in G}
+    labels[0] = "c"
+    communities = label_propagation_communities(G, labels, dirty=[], method=method)
+    assert {frozenset(c) for c in communities} == {
+        frozenset(range(1, 5)),
+        frozenset(range(5, 10)),
+        frozenset([0, 10, 11, 12, 13, 14]),
+    }
+    communities = label_propagation_communities(G, labels, dirty=[0], method=method)
+    assert {frozenset(c) for c in communities} == ground_truth
+
+    # nodes without labels start in communities of their own
+    G.add_edges_from([(15, 0), (15, 1), (15, 2), (16, 17)])
+    labels = {n: "abc"[n // 5] for n in range(15)}
+    communities = label_propagation_communities(
+        G, labels, dirty=[0, 1, 2, 15, 16, 17], method=method
+    )
+    result = {frozenset(c) for c in communities}
+    assert frozenset([0, 1, 2, 3, 4, 15]) in result
+    assert frozenset([10, 11, 12, 13, 14]) in result
+
+
+def test_vectorized():
+    pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    for seed in range(3):
+        G = nx.gnp_random_graph(200, 0.03, seed=seed)
+        G.add_edge(0, 0)
+        G.add_node(200)
+        expected = label_propagation_communities(G, method="sequential")
+        result = label_propagation_communities(G, method="vectorized")
+        assert sorted(map(sorted, result)) == sorted(map(sorted, expected))
+    G = nx.MultiGraph(nx.karate_club_graph())
+    G.add_edges_from(nx.karate_club_graph().edges)
+    expected = label_propagation_communities(G, method="sequential")
+    result = label_propagation_communities(G, method="vectorized")
+    assert sorted(map(sorted, result)) == sorted(map(sorted, expected))
+    with pytest.raises(ValueError):
+        label_propagation_communities(G, method="foo")
+
+
 def test_termination():
     # ensure termination of asyn_lpa_communities in two cases
     # that led to an endless loop in a previous version
@@ -161,3 +221,23 @@ class TestAsynLpaCommunities:
         edges = chain.from_iterable(combinations(c, 2) for c in ground_truth)
         G = nx.Graph(edges)
         self._check_communities(G, ground_truth)
+
+    def test_labels_and_dirty(self):
+        G = nx.caveman_graph(3, 5)
+        G.add_edges_from([(4, 5), (9, 10)])
+        ground_truth = {frozenset(range(5 * i, 5 * (i + 1))) for i in range(3)}
+        labels = {n: "abc"[n // 5] for n in G}
+        communities = asyn_lpa_communities(G, labels=labels, seed=1)
+        assert {frozenset(c) for c in communities} == ground_truth
+
+        # only dirty nodes and the nodes they reach are updated
+        labels = {n: "abc"[n // 5] for n in G}
+        labels[0] = "c"
+        communities = asyn_lpa_communities(G, labels=labels, dirty=[], seed=1)
+        assert {frozenset(c) for c in communities} == {
+            frozenset(range(1, 5)),
+            frozenset(range(5, 10)),
+            frozenset([0, 10, 11, 12, 13, 14]),
+        }
+        communities = asyn_lpa_communities(G, labels=labels, dirty=[0], seed=1)
+        assert {frozenset(c) for c in communities} == ground_truth
@@ -0,0 +1,125 @@
+import pytest
+
+import networkx as nx
+from networkx.algorithms.community import (
+    is_partition,
+    leiden_communities,
+    louvain_communities,
+    modularity,
+)
+
+
+def test_valid_partition():
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    partition = leiden_communities(G, seed=42)
+
+    assert is_partition(G, partition)
+    assert modularity(G, partition) > modularity(G, [{u} for u in G])
+    assert modularity(G, partition) >= 0.95 * modularity(
+        G, louvain_communities(G, seed=42)
+    )
+
+
+def test_connected_communities():
+    G = nx.gnp_random_graph(300, 0.02, seed=1)
+    partition = leiden_communities(G, seed=42)
+
+    assert is_partition(G, partition)
+    for community in partition:
+        assert nx.is_connected(G.subgraph(community))
+
+
+def test_ring_of_cliques():
+    G = nx.ring_of_cliques(8, 6)
+    partition = leiden_communities(G, seed=1)
+    expected = [set(range(i, i + 6)) for i in range(0, 48, 6)]
+
+    assert sorted(partition, key=min) == expected
+
+
+def test_seed():
+    G = nx.karate_club_graph()
+
+    assert leiden_communities(G, seed=7) == leiden_communities(G, seed=7)
+
+
+def test_resolution():
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    partition1 = leiden_communities(G, resolution=0.5, seed=12)
+    partition2 = leiden_communities(G, seed=12)
+    partition3 = leiden_communities(G, resolution=2, seed=12)
+
+    assert len(partition1) <= len(partition2) <= len(partition3)
+
+
+def test_weight():
+    G = nx.Graph([(0, 1), (1, 2), (2, 3), (3, 0)])
+    nx.set_edge_attributes(G, {(0, 1): 10, (2, 3): 10}, name="weight")
+    partition = leiden_communities(G, seed=1)
+
+    assert sorted(partition, key=min) == [{0, 1}, {2, 3}]
+    partition = leiden_communities(G, weight=None, seed=1)
+    assert is_partition(G, partition)
+
+
+def test_partition():
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    partition = leiden_communities(G, seed=3)
+    mod = modularity(G, partition)
+
+    # a partition is a fixed point, up to further improvement
+    assert modularity(G, leiden_communities(G, seed=3, partition=partition)) >= mod
+
+    # nodes added since and nodes removed since
+    H = G.copy()
+    H.add_edges_from([(250, 0), (250, 1), (251, 250)])
+    H.remove_node(2)
+    warm = leiden_communities(H, seed=3, partition=partition)
+    assert is_partition(H, warm)
+    assert modularity(H, warm) >= 0.95 * modularity(H, leiden_communities(H, seed=3))
+
+
+def test_small_graphs():
+    assert leiden_communities(nx.Graph()) == []
+    assert leiden_communities(nx.empty_graph(3)) == [{0}, {1}, {2}]
+    G = nx.Graph([(0, 0)])
+    assert leiden_communities(G) == [{0}]
+    G = nx.path_graph(2)
+    assert leiden_communities(G) == [{0, 1}]
+
+
+def test_multigraph():
+    G = nx.karate_club_graph()
+    H = nx.MultiGraph(G)
+    # parallel edges count as one edge with the sum of their weights
+    H.add_edge(0, 1, weight=10)
+    G[0][1]["weight"] += 10
+
+    assert leiden_communities(G, seed=1) == leiden_communities(H, seed=1)
+
+
+def test_directed():
+    G = nx.DiGraph([(0, 1)])
+
+    with pytest.raises(nx.NetworkXNotImplemented):
+        leiden_communities(G)
+
+
+def test_disconnected_partition():
+    G = nx.Graph([(0, 1), (2, 3)])
+    partition = leiden_communities(G, partition=[{0, 1, 2, 3}], seed=1)
+
+    assert sorted(partition, key=min) == [{0, 1}, {2, 3}]
+
+
+def test_randomness():
+    G = nx.karate_club_graph()
+
+    with pytest.raises(ValueError):
+        leiden_communities(G, randomness=0)
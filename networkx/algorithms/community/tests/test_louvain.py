@@ -1,7 +1,10 @@
+import pytest
+
 import networkx as nx
 from networkx.algorithms.community import (
     is_partition,
     louvain_communities,
+    louvain_partitions,
     modularity,
     partition_quality,
 )
@@ -126,3 +129,62 @@ def test_threshold():
     mod2 = modularity(G, partition2)
 
     assert mod1 < mod2
+
+
+def test_vectorized():
+    pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    G = nx.LFR_benchmark_graph(
+        250, 3, 1.5, 0.009, average_degree=5, min_community=20, seed=10
+    )
+    G.add_edge(0, 0, weight=3)
+    for H in (G, G.to_directed(), nx.MultiGraph(G), nx.gn_graph(200, seed=1234)):
+        partition = louvain_communities(H, seed=42, method="vectorized")
+        assert is_partition(H, partition)
+        assert partition == louvain_communities(H, seed=42, method="vectorized")
+        sequential = louvain_communities(H, seed=42, method="sequential")
+        assert modularity(H, partition) > 0.9 * modularity(H, sequential)
+
+    partitions = list(louvain_partitions(G, seed=42, method="vectorized"))
+    mods = [modularity(G, p) for p in partitions]
+    assert mods == sorted(mods)
+    assert all(is_partition(G, p) for p in partitions)
+
+    partition1 = louvain_communities(G, resolution=0.5, seed=12, method="vectorized")
+    partition2 = louvain_communities(G, resolution=1, seed=12, method="vectorized")
+    partition3 = louvain_communities(G, resolution=2, seed=12, method="vectorized")
+    assert len(partition1) <= len(partition2) <= len(partition3)
+
+    partition = louvain_communities(G, threshold=0.2, seed=2, method="vectorized")
+    assert modularity(G, partition) < modularity(G, partition2)
+
+
+def test_vectorized_directed():
+    pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    # the edges point to the larger node, so nodes without out-edges have
+    # to move to their in-neighbors
+    H = nx.random_partition_graph([10] * 20, 0.5, 0.01, seed=0)
+    G = nx.DiGraph((min(u, v), max(u, v)) for u, v in H.edges())
+    G.add_nodes_from(H)
+    partition = louvain_communities(G, seed=42, method="vectorized")
+    sequential = louvain_communities(G, seed=42, method="sequential")
+    assert modularity(G, partition) >= 0.95 * modularity(G, sequential)
+    assert modularity(G, partition) >= 0.95 * modularity(G, H.graph["partition"])
+    assert all(len(c) > 1 for c in partition)
+
+
+def test_vectorized_small_graphs():
+    pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    G = nx.Graph([(0, 1)])
+    G.add_node(2)
+    assert louvain_communities(G, method="vectorized") == [{0, 1}, {2}]
+    G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (0, 3)])
+    assert louvain_communities(G, method="vectorized") == [{0, 1, 2}, {3, 4, 5}]
+
+
+def test_method():
+    G = nx.karate_club_graph()
+    with pytest.raises(ValueError):
+        louvain_communities(G, method="parallel")
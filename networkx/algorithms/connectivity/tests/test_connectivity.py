@@ -10,6 +10,7 @@ from networkx.algorithms.connectivity import (
 )
 
 flow_funcs = [
+    flow.array_preflow_push,
     flow.boykov_kolmogorov,
     flow.dinitz,
     flow.edmonds_karp,
@@ -106,7 +107,7 @@ def test_brandes_erlebach():
         assert 2 == nx.node_connectivity(G, 1, 11, **kwargs), errmsg
         assert 2 == nx.edge_connectivity(G, **kwargs), errmsg
         assert 2 == nx.node_connectivity(G, **kwargs), errmsg
-        if flow_func is flow.preflow_push:
+        if flow_func in (flow.preflow_push, flow.array_preflow_push):
             assert 3 == nx.edge_connectivity(G, 1, 11, cutoff=2, **kwargs), errmsg
         else:
             assert 2 == nx.edge_connectivity(G, 1, 11, cutoff=2, **kwargs), errmsg
@@ -277,7 +278,7 @@ def test_cutoff():
     G = nx.complete_graph(5)
     for local_func in [local_edge_connectivity, local_node_connectivity]:
         for flow_func in flow_funcs:
-            if flow_func is flow.preflow_push:
+            if flow_func in (flow.preflow_push, flow.array_preflow_push):
                 # cutoff is not supported by preflow_push
                 continue
             for cutoff in [3, 2, 1]:
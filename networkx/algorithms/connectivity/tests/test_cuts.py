@@ -6,6 +6,7 @@ from networkx.algorithms.connectivity import minimum_st_edge_cut, minimum_st_nod
 from networkx.utils import arbitrary_element
 
 flow_funcs = [
+    flow.array_preflow_push,
     flow.boykov_kolmogorov,
     flow.dinitz,
     flow.edmonds_karp,
@@ -25,6 +25,8 @@ __all__ = [
     "is_aperiodic",
     "transitive_closure",
     "transitive_closure_dag",
+    "ReachabilityIndex",
+    "DynamicTopologicalOrder",
     "transitive_reduction",
     "antichains",
     "dag_longest_path",
@@ -748,6 +750,525 @@ def transitive_closure_dag(G, topo_order=None):
     return TC
 
 
+class ReachabilityIndex:
+    """Index of a directed acyclic graph for fast reachability queries.
+
+    The index answers whether a node reaches another node without computing
+    the transitive closure, which can have a quadratic number of edges, and
+    usually without a graph search. It stores a few labels per node, which
+    answer most queries in constant time:
+
+    - the position of each node in a topological order, as a node can only
+      reach the nodes after it;
+    - interval labels from randomized depth-first traversals (GRAIL [1]_):
+      the interval of a node contains the intervals of all its descendants,
+      and the intervals of the first traversal also identify the
+      descendants of each node in its depth-first search tree;
+    - bit sets of the hub nodes (those with the most paths through them)
+      that each node reaches and is reached from, computed with bitwise
+      operations on integers for all hubs at once. A node reaches another
+      node when a hub is a descendant of the first and an ancestor of the
+      second, and does not reach it when the second node reaches a hub
+      that the first does not reach.
+
+    The remaining queries run a depth-first search that the labels prune to
+    the nodes that may still reach the target.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph
+        A directed acyclic graph (DAG). The graph must not change while the
+        index is in use.
+
+    intervals : integer, optional (default=2)
+        The number of interval labels of each node.
+
+    hubs : integer, optional (default=64)
+        The number of hub nodes.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state used for the order of
+        the depth-first traversals.
+        See :ref:`Randomness<randomness>`.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is not directed.
+    NetworkXUnfeasible
+        If `G` has a cycle.
+
+    See Also
+    --------
+    descendants
+    ancestors
+    has_path
+    transitive_closure_dag
+
+    Notes
+    -----
+    Building the index takes $O((k + 1)(n + m))$ time for $n$ nodes, $m$
+    edges and $k$ interval labels, and the index takes $O((k + 1) n)$ space
+    besides the adjacency lists, with hub bit sets of one or two machine
+    words per node.
+
+    References
+    ----------
+    .. [1] Hilmi Yildirim, Vineet Chaoji and Mohammed J. Zaki:
+       GRAIL: Scalable Reachability Index for Large Graphs.
+       Proceedings of the VLDB Endowment 3(1), 276-284, 2010.
+
+    Examples
+    --------
+    >>> DG = nx.DiGraph([(1, 2), (2, 3), (1, 4), (5, 4)])
+    >>> index = nx.ReachabilityIndex(DG, seed=42)
+    >>> index.reachable(1, 3)
+    True
+    >>> index.reachable(5, 3)
+    False
+    >>> sorted(index.descendants(1))
+    [2, 3, 4]
+    >>> sorted(index.ancestors(4))
+    [1, 5]
+    """
+
+    def __init__(self, G, intervals=2, hubs=64, seed=None):
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for undirected type")
+        seed = nx.utils.create_py_random_state(seed)
+        # nodes are numbered in topological order
+        self._nodes = nodes = list(topological_sort(G))
+        self._index = index = {u: i for i, u in enumerate(nodes)}
+        self._succ = [[index[v] for v in G._succ[u]] for u in nodes]
+        self._pred = [[index[v] for v in G._pred[u]] for u in nodes]
+
+        self._low = []
+        self._post = []
+        for k in range(max(intervals, 1)):
+            low, post = self._interval_labels(seed, first=(k == 0))
+            self._low.append(low)
+            self._post.append(post)
+
+        n = len(nodes)
+        paths = sorted(
+            range(n),
+            key=lambda i: (len(self._pred[i]) + 1) * (len(self._succ[i]) + 1),
+            reverse=True,
+        )
+        bit = [0] * n
+        for b, i in enumerate(paths[:hubs]):
+            bit[i] = 1 << b
+        self._desc_hubs = desc_hubs = bit[:]
+        for i in reversed(range(n)):
+            for j in self._succ[i]:
+                desc_hubs[i] |= desc_hubs[j]
+        self._anc_hubs = anc_hubs = bit
+        for i in range(n):
+            for j in self._pred[i]:
+                anc_hubs[i] |= anc_hubs[j]
+
+    def _interval_labels(self, seed, first):
+        """Returns the smallest post-order number of the descendants and the
+        post-order number of each node in a randomized depth-first traversal,
+        and store the pre-order numbers of the first traversal."""
+        succ = self._succ
+        n = len(succ)
+        low = [0] * n
+        post = [0] * n
+        pre = [0] * n
+        visited = [False] * n
+        roots = [i for i in range(n) if not self._pred[i]]
+        seed.shuffle(roots)
+        counter = pre_counter = 0
+        for root in roots:
+            visited[root] = True
+            pre[root] = pre_counter
+            pre_counter += 1
+            stack = [(root, iter(seed.sample(succ[root], len(succ[root]))))]
+            while stack:
+                i, children = stack[-1]
+                for j in children:
+                    if not visited[j]:
+                        visited[j] = True
+                        pre[j] = pre_counter
+                        pre_counter += 1
+                        stack.append((j, iter(seed.sample(succ[j], len(succ[j])))))
+                        break
+                else:
+                    stack.pop()
+                    post[i] = counter
+                    counter += 1
+                    low[i] = min([post[i]] + [low[j] for j in succ[i]])
+        if first:
+            self._pre = pre
+        return low, post
+
+    def _node_index(self, u):
+        try:
+            return self._index[u]
+        except (KeyError, TypeError) as err:
+            raise nx.NetworkXError(f"The node {u} is not in the graph.") from err
+
+    def _may_reach(self, i, j):
+        """Returns False if the labels show that node i does not reach node j,
+        for i < j."""
+        if self._desc_hubs[j] & ~self._desc_hubs[i]:
+            return False
+        if self._anc_hubs[i] & ~self._anc_hubs[j]:
+            return False
+        for low, post in zip(self._low, self._post):
+            if low[j] < low[i] or post[j] > post[i]:
+                return False
+        return True
+
+    def _surely_reaches(self, i, j):
+        """Returns True if the labels show that node i reaches node j."""
+        if self._desc_hubs[i] & self._anc_hubs[j]:
+            return True
+        # j is a descendant of i in the first depth-first search tree
+        return self._pre[i] <= self._pre[j] and self._post[0][j] <= self._post[0][i]
+
+    def reachable(self, u, v):
+        """Returns True if there is a path from `u` to `v`.
+
+        A node reaches itself, by the path of length zero.
+
+        Parameters
+        ----------
+        u, v : nodes
+            Nodes of the graph.
+
+        Returns
+        -------
+        bool
+            Whether `u` reaches `v`.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` or `v` is not in the graph.
+        """
+        i = self._node_index(u)
+        j = self._node_index(v)
+        if i == j:
+            return True
+        if i > j or not self._may_reach(i, j):
+            return False
+        if self._surely_reaches(i, j):
+            return True
+        # depth-first search of the nodes that may reach j
+        seen = {i}
+        stack = [i]
+        while stack:
+            k = stack.pop()
+            for l in self._succ[k]:
+                if l == j:
+                    return True
+                if l < j and l not in seen and self._may_reach(l, j):
+                    if self._surely_reaches(l, j):
+                        return True
+                    seen.add(l)
+                    stack.append(l)
+        return False
+
+    def descendants(self, u):
+        """Returns the set of nodes reachable from `u`, without `u`.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` is not in the graph.
+        """
+        return self._search(self._node_index(u), self._succ)
+
+    def ancestors(self, u):
+        """Returns the set of nodes that reach `u`, without `u`.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` is not in the graph.
+        """
+        return self._search(self._node_index(u), self._pred)
+
+    def _search(self, i, neighbors):
+        seen = {i}
+        stack = [i]
+        while stack:
+            for j in neighbors[stack.pop()]:
+                if j not in seen:
+                    seen.add(j)
+                    stack.append(j)
+        seen.remove(i)
+        nodes = self._nodes
+        return {nodes[j] for j in seen}
+
+
+class DynamicTopologicalOrder:
+    """A topological order of a directed acyclic graph that changes.
+
+    The order is kept under edge insertions with the algorithm of Pearce and
+    Kelly [1]_: inserting an edge $(u, v)$ with $u$ after $v$ only reorders
+    the nodes between $v$ and $u$ that are reachable from $v$ or reach $u$.
+    The search for them finds the cycle if $v$ reaches $u$, in which case
+    the edge is rejected and nothing changes. Removing edges and nodes
+    keeps the order valid.
+
+    The generation of each node, the length of a longest path that ends at
+    the node, is kept as well, by propagating changes from the endpoints of
+    the inserted or removed edges to the successors whose generation
+    changes. The generations are those of :func:`topological_generations`.
+
+    Parameters
+    ----------
+    G : NetworkX DiGraph, optional (default=None)
+        A directed acyclic graph to start from. Its nodes and edges are
+        copied; later changes to `G` are not seen.
+
+    Attributes
+    ----------
+    graph : NetworkX DiGraph
+        The current graph. Change it through the methods of this class
+        only.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If `G` is not directed.
+    NetworkXUnfeasible
+        If `G` has a cycle.
+
+    See Also
+    --------
+    topological_sort
+    topological_generations
+    is_directed_acyclic_graph
+
+    Notes
+    -----
+    Inserting an edge $(u, v)$ takes time linear in the number of nodes and
+    edges of the affected region, that is, the nodes between $v$ and $u$
+    in the order that are reachable from $v$ or reach $u$ and their edges,
+    with an extra logarithmic factor for sorting them. Updating the
+    generations takes time linear in the number of nodes whose generation
+    changes and in their edges.
+
+    References
+    ----------
+    .. [1] David J. Pearce and Paul H. J. Kelly:
+       A Dynamic Topological Sort Algorithm for Directed Acyclic Graphs.
+       ACM Journal of Experimental Algorithmics 11, 1.7, 2007.
+
+    Examples
+    --------
+    >>> order = nx.DynamicTopologicalOrder(nx.DiGraph([(1, 2), (3, 4)]))
+    >>> list(order)
+    [1, 3, 2, 4]
+    >>> order.add_edge(4, 1)
+    >>> list(order)
+    [3, 4, 1, 2]
+    >>> list(order.topological_generations())
+    [[3], [4], [1], [2]]
+    >>> order.add_edge(2, 3)
+    Traceback (most recent call last):
+        ...
+    networkx.exception.NetworkXUnfeasible: Adding edge (2, 3) would create a cycle.
+    >>> order.remove_edge(4, 1)
+    >>> list(order.topological_generations())
+    [[3, 1], [4, 2]]
+    """
+
+    def __init__(self, G=None):
+        self.graph = nx.DiGraph()
+        # the node at each position of the order, with None for the positions
+        # of removed nodes, and the position of each node
+        self._nodes = []
+        self._position = {}
+        # the generation of each node and the nodes of each generation
+        self._generation = {}
+        self._generations = []
+        if G is None:
+            return
+        if not G.is_directed():
+            raise nx.NetworkXNotImplemented("not implemented for undirected type")
+        for i, generation in enumerate(topological_generations(G)):
+            self._generations.append(set(generation))
+            for u in generation:
+                self._generation[u] = i
+                self._position[u] = len(self._nodes)
+                self._nodes.append(u)
+        self.graph.add_nodes_from(self._nodes)
+        self.graph.add_edges_from(G.edges())
+
+    def __iter__(self):
+        """Iterate over the nodes in topological order."""
+        return (u for u in self._nodes if u is not None)
+
+    def __len__(self):
+        return len(self._position)
+
+    def __contains__(self, u):
+        return u in self._position
+
+    def add_node(self, u):
+        """Add a node without edges at the end of the order."""
+        if u not in self._position:
+            self.graph.add_node(u)
+            self._position[u] = len(self._nodes)
+            self._nodes.append(u)
+            self._set_generation(u, 0)
+
+    def add_edge(self, u, v):
+        """Add the edge (u, v), reordering nodes if `u` comes after `v`.
+
+        Nodes that are not in the graph are added.
+
+        Raises
+        ------
+        NetworkXUnfeasible
+            If the edge would create a cycle. The graph and the order do not
+            change.
+        """
+        if u == v:
+            raise nx.NetworkXUnfeasible(f"Adding edge ({u}, {v}) would create a cycle.")
+        self.add_node(u)
+        self.add_node(v)
+        if v in self.graph._succ[u]:
+            return
+        position = self._position
+        lower = position[v]
+        upper = position[u]
+        if lower < upper:
+            succ = self.graph._succ
+            pred = self.graph._pred
+            # the nodes reachable from v that come before u
+            forward = self._search(v, succ, lambda w: position[w] <= upper)
+            if u in forward:
+                raise nx.NetworkXUnfeasible(
+                    f"Adding edge ({u}, {v}) would create a cycle."
+                )
+            # the nodes that reach u and come after v
+            backward = self._search(u, pred, lambda w: position[w] > lower)
+            # move the nodes that reach u before the nodes reachable from v,
+            # keeping the relative order of each set, in the same positions
+            key = position.__getitem__
+            nodes = sorted(backward, key=key) + sorted(forward, key=key)
+            positions = sorted(map(key, nodes))
+            for w, i in zip(nodes, positions):
+                position[w] = i
+                self._nodes[i] = w
+        self.graph.add_edge(u, v)
+        if self._generation[v] <= self._generation[u]:
+            self._update_generations([v])
+
+    def add_edges_from(self, ebunch_to_add):
+        """Add the edges in `ebunch_to_add` one after the other.
+
+        Raises
+        ------
+        NetworkXUnfeasible
+            If an edge would create a cycle. The edges before it are added.
+        """
+        for u, v in ebunch_to_add:
+            self.add_edge(u, v)
+
+    def remove_edge(self, u, v):
+        """Remove the edge (u, v).
+
+        Raises
+        ------
+        NetworkXError
+            If there is not an edge between `u` and `v`.
+        """
+        self.graph.remove_edge(u, v)
+        self._update_generations([v])
+
+    def remove_node(self, u):
+        """Remove node `u` and its edges.
+
+        Raises
+        ------
+        NetworkXError
+            If `u` is not in the graph.
+        """
+        succ = list(self.graph.succ[u]) if u in self.graph else None
+        self.graph.remove_node(u)
+        self._update_generations(succ)
+        self._generations[self._generation.pop(u)].remove(u)
+        self._nodes[self._position.pop(u)] = None
+        if len(self._nodes) > 2 * len(self._position) + 16:
+            # drop the positions of removed nodes
+            self._nodes = list(self)
+            self._position = {w: i for i, w in enumerate(self._nodes)}
+
+    def precedes(self, u, v):
+        """Returns True if `u` comes before `v` in the order."""
+        return self._position[u] < self._position[v]
+
+    def generation(self, u):
+        """Returns the generation of node `u`, the number of edges of a
+        longest path that ends at `u`."""
+        return self._generation[u]
+
+    def topological_generations(self):
+        """Iterate over the generations of the graph, as lists of nodes in
+        topological order.
+
+        See :func:`topological_generations`.
+        """
+        key = self._position.__getitem__
+        for generation in self._generations:
+            if not generation:
+                break
+            yield sorted(generation, key=key)
+
+    def _search(self, source, neighbors, condition):
+        """Returns the nodes that are reachable from source through the
+        neighbors for which condition holds."""
+        seen = {source}
+        stack = [source]
+        while stack:
+            for w in neighbors[stack.pop()]:
+                if w not in seen and condition(w):
+                    seen.add(w)
+                    stack.append(w)
+        return seen
+
+    def _set_generation(self, u, i):
+        old = self._generation.get(u)
+        if old is not None:
+            self._generations[old].remove(u)
+        while len(self._generations) <= i:
+            self._generations.append(set())
+        self._generations[i].add(u)
+        self._generation[u] = i
+
+    def _update_generations(self, nodes):
+        """Recompute the generations of nodes and of the successors whose
+        generation changes as a result, in topological order."""
+        pred = self.graph._pred
+        succ = self.graph._succ
+        position = self._position
+        generation = self._generation
+        heap = [(position[u], u) for u in nodes]
+        heapq.heapify(heap)
+        seen = set(nodes)
+        while heap:
+            _, u = heapq.heappop(heap)
+            seen.remove(u)
+            new = max((generation[w] + 1 for w in pred[u]), default=0)
+            old = generation[u]
+            if new == old:
+                continue
+            self._set_generation(u, new)
+            for w in succ[u]:
+                # only the successors whose generation is determined by u
+                # may change when its generation decreases
+                if w not in seen and (new > old or generation[w] == old + 1):
+                    seen.add(w)
+                    heapq.heappush(heap, (position[w], w))
+
+
 @not_implemented_for("undirected")
 def transitive_reduction(G):
     """Returns transitive reduction of a directed graph
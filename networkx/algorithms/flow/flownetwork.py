@@ -0,0 +1,284 @@
+"""
+Maximum flow and minimum cut queries on one capacitated graph.
+"""
+import networkx as nx
+from networkx.utils import parallel_graph_imap
+
+from .maxflow import default_flow_func, flow_funcs
+from .utils import build_flow_dict, build_residual_network
+
+__all__ = ["FlowNetwork"]
+
+
+class FlowNetwork:
+    """Maximum flows and minimum cuts between many pairs of nodes of a graph.
+
+    :func:`maximum_flow` and :func:`minimum_cut` build the residual network
+    of the graph for every call. A flow network builds it once and passes it
+    to the flow function of every query, which resets the flows in the
+    residual network before computing a new flow. Queries for many pairs of
+    nodes can be split across worker processes.
+
+    The graph must not change while the flow network is in use.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes,
+        with the signature of :func:`preflow_push`, which is the default.
+        It must accept the residual network as the `residual` keyword
+        argument.
+
+    kwargs : Any other keyword parameter is passed to the function that
+        computes the maximum flow.
+
+    Attributes
+    ----------
+    residual : NetworkX DiGraph
+        The residual network of the last query, see
+        :func:`~networkx.algorithms.flow.build_residual_network`.
+
+    Raises
+    ------
+    NetworkXError
+        The algorithm does not support MultiGraph and MultiDiGraph. If
+        the input graph is an instance of one of these two classes, a
+        NetworkXError is raised.
+
+    See Also
+    --------
+    :meth:`maximum_flow`
+    :meth:`minimum_cut`
+    :func:`build_residual_network`
+
+    Examples
+    --------
+    >>> from networkx.algorithms.flow import FlowNetwork
+    >>> G = nx.DiGraph()
+    >>> G.add_edge("x", "a", capacity=3.0)
+    >>> G.add_edge("x", "b", capacity=1.0)
+    >>> G.add_edge("a", "c", capacity=3.0)
+    >>> G.add_edge("b", "c", capacity=5.0)
+    >>> G.add_edge("b", "d", capacity=4.0)
+    >>> G.add_edge("d", "e", capacity=2.0)
+    >>> G.add_edge("c", "y", capacity=2.0)
+    >>> G.add_edge("e", "y", capacity=3.0)
+    >>> network = FlowNetwork(G)
+    >>> network.maximum_flow_value("x", "y")
+    3.0
+    >>> cut_value, partition = network.minimum_cut("x", "c")
+    >>> cut_value
+    4.0
+    >>> network.maximum_flow_values([("x", "y"), ("b", "y"), ("a", "e")])
+    {('x', 'y'): 3.0, ('b', 'y'): 4.0, ('a', 'e'): 0}
+    """
+
+    def __init__(self, G, capacity="capacity", flow_func=None, **kwargs):
+        if flow_func is None:
+            if kwargs:
+                raise nx.NetworkXError(
+                    "You have to explicitly set a flow_func if"
+                    " you need to pass parameters via kwargs."
+                )
+            flow_func = default_flow_func
+
+        if not callable(flow_func):
+            raise nx.NetworkXError("flow_func has to be callable.")
+
+        self.G = G
+        self.capacity = capacity
+        self.flow_func = flow_func
+        self.kwargs = kwargs
+        self.residual = build_residual_network(G, capacity)
+
+    def _flow(self, s, t, value_only):
+        return self.flow_func(
+            self.G,
+            s,
+            t,
+            capacity=self.capacity,
+            residual=self.residual,
+            value_only=value_only,
+            **self.kwargs,
+        )
+
+    def maximum_flow(self, s, t):
+        """Returns the value and the flow dictionary of a maximum flow.
+
+        Parameters
+        ----------
+        s : node
+            Source node for the flow.
+
+        t : node
+            Sink node for the flow.
+
+        Returns
+        -------
+        flow_value : integer, float
+            Value of the maximum flow, i.e., net outflow from the source.
+
+        flow_dict : dict
+            A dictionary containing the value of the flow that went through
+            each edge.
+
+        Raises
+        ------
+        NetworkXError
+            If s or t are not in the graph.
+
+        NetworkXUnbounded
+            If the graph has a path of infinite capacity, the value of a
+            feasible flow on the graph is unbounded above and the function
+            raises a NetworkXUnbounded.
+
+        See Also
+        --------
+        :func:`maximum_flow`
+        """
+        R = self._flow(s, t, value_only=False)
+        return (R.graph["flow_value"], build_flow_dict(self.G, R))
+
+    def maximum_flow_value(self, s, t):
+        """Returns the value of a maximum flow.
+
+        See :meth:`maximum_flow` for the parameters.
+        """
+        R = self._flow(s, t, value_only=True)
+        return R.graph["flow_value"]
+
+    def minimum_cut(self, s, t):
+        """Returns the value and the node partition of a minimum (s, t)-cut.
+
+        Parameters
+        ----------
+        s : node
+            Source node.
+
+        t : node
+            Sink node.
+
+        Returns
+        -------
+        cut_value : integer, float
+            Value of the minimum cut.
+
+        partition : pair of node sets
+            A partitioning of the nodes that defines a minimum cut.
+
+        Raises
+        ------
+        NetworkXError
+            If s or t are not in the graph, or if the flow function was
+            given a cutoff that it does not support for minimum cuts.
+
+        NetworkXUnbounded
+            If the graph has a path of infinite capacity, all cuts have
+            infinite capacity and the function raises a NetworkXUnbounded.
+
+        See Also
+        --------
+        :func:`minimum_cut`
+        """
+        self._check_cutoff()
+        R = self._flow(s, t, value_only=True)
+        # the nodes that reach t through edges that are not saturated
+        R_pred = R.pred
+        non_reachable = {t}
+        queue = [t]
+        for v in queue:
+            for u, attr in R_pred[v].items():
+                if u not in non_reachable and attr["flow"] < attr["capacity"]:
+                    non_reachable.add(u)
+                    queue.append(u)
+        partition = (set(self.G) - non_reachable, non_reachable)
+        return (R.graph["flow_value"], partition)
+
+    def minimum_cut_value(self, s, t):
+        """Returns the value of a minimum (s, t)-cut.
+
+        See :meth:`minimum_cut` for the parameters.
+        """
+        self._check_cutoff()
+        R = self._flow(s, t, value_only=True)
+        return R.graph["flow_value"]
+
+    def _check_cutoff(self):
+        if self.kwargs.get("cutoff") is not None and self.flow_func in flow_funcs:
+            raise nx.NetworkXError("cutoff should not be specified.")
+
+    def maximum_flow_values(self, pairs, n_jobs=None, executor=None):
+        """Returns the values of the maximum flows between pairs of nodes.
+
+        Parameters
+        ----------
+        pairs : iterable of pairs of nodes
+            The (source, sink) pairs.
+
+        n_jobs : int, optional (default=None)
+            The number of worker processes to split the pairs across.
+            None computes the flows in the calling process, -1 uses all
+            CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+        executor : :class:`concurrent.futures.Executor`, optional (default=None)
+            An executor to compute the flows on instead of a new process
+            pool. Every chunk of pairs is computed on its own copy of the
+            residual network.
+
+        Returns
+        -------
+        dict
+            The value of the maximum flow keyed by (source, sink) pair.
+        """
+        return dict(self._batch("maximum_flow_value", pairs, n_jobs, executor))
+
+    def minimum_cuts(self, pairs, n_jobs=None, executor=None):
+        """Returns the minimum cuts between pairs of nodes.
+
+        See :meth:`maximum_flow_values` for the parameters.
+
+        Returns
+        -------
+        dict
+            The value and the node partition of a minimum cut, as returned
+            by :meth:`minimum_cut`, keyed by (source, sink) pair.
+        """
+        self._check_cutoff()
+        return dict(self._batch("minimum_cut", pairs, n_jobs, executor))
+
+    def _batch(self, method, pairs, n_jobs, executor):
+        pairs = list(pairs)
+        if n_jobs is None and executor is None:
+            query = getattr(self, method)
+            return [((s, t), query(s, t)) for s, t in pairs]
+        chunks = parallel_graph_imap(
+            _query_pairs,
+            self,
+            pairs,
+            args=(method,),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        return [result for chunk in chunks for result in chunk]
+
+
+def _query_pairs(network, pairs, method):
+    """Returns the results of the query `method` of a copy of `network` for
+    each pair of nodes, so that workers sharing the network do not share
+    its residual network."""
+    copy = FlowNetwork.__new__(FlowNetwork)
+    copy.__dict__.update(network.__dict__)
+    copy.residual = network.residual.copy()
+    query = getattr(copy, method)
+    return [((s, t), query(s, t)) for s, t in pairs]
@@ -6,7 +6,7 @@ import networkx as nx
 from .boykovkolmogorov import boykov_kolmogorov
 from .dinitz_alg import dinitz
 from .edmondskarp import edmonds_karp
-from .preflowpush import preflow_push
+from .preflowpush import array_preflow_push, preflow_push
 from .shortestaugmentingpath import shortest_augmenting_path
 from .utils import build_flow_dict
 
@@ -14,6 +14,7 @@ from .utils import build_flow_dict
 default_flow_func = preflow_push
 # Functions that don't support cutoff for minimum cut computations.
 flow_funcs = [
+    array_preflow_push,
     boykov_kolmogorov,
     dinitz,
     edmonds_karp,
@@ -16,7 +16,7 @@ from .utils import (
     detect_unboundedness,
 )
 
-__all__ = ["preflow_push"]
+__all__ = ["preflow_push", "array_preflow_push"]
 
 
 def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq, value_only):
@@ -421,3 +421,344 @@ def preflow_push(
     R = preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq, value_only)
     R.graph["algorithm"] = "preflow_push"
     return R
+
+
+def array_preflow_push_impl(
+    G, s, t, capacity, residual, global_relabel_freq, value_only
+):
+    """Implementation of the highest-label preflow-push algorithm on arrays."""
+    if s not in G:
+        raise nx.NetworkXError(f"node {str(s)} not in graph")
+    if t not in G:
+        raise nx.NetworkXError(f"node {str(t)} not in graph")
+    if s == t:
+        raise nx.NetworkXError("source and sink are the same node")
+
+    if global_relabel_freq is None:
+        global_relabel_freq = 0
+    if global_relabel_freq < 0:
+        raise nx.NetworkXError("global_relabel_freq must be nonnegative.")
+
+    if residual is None:
+        R = build_residual_network(G, capacity)
+    else:
+        R = residual
+
+    detect_unboundedness(R, s, t)
+
+    R_nodes = R.nodes
+    R_succ = R._succ
+
+    # The residual network in arrays: the edges are numbered in pairs, so
+    # that the reverse of edge e is edge e ^ 1, edge e goes to the node with
+    # index head[e] and has the residual capacity rcap[e], and adj[u] lists
+    # the edges out of the node with index u.
+    nodes = list(R)
+    index = {u: i for i, u in enumerate(nodes)}
+    n = len(nodes)
+    adj = [[] for _ in range(n)]
+    head = []
+    attrs = []
+    for i, u in enumerate(nodes):
+        R_succ_u = R_succ[u]
+        for v, attr in R_succ_u.items():
+            j = index[v]
+            if i < j:
+                adj[i].append(len(head))
+                adj[j].append(len(head) + 1)
+                head.append(j)
+                head.append(i)
+                attrs.append(attr)
+                attrs.append(R_succ[v][u])
+    m = len(head)
+    cap = [attr["capacity"] for attr in attrs]
+    rcap = cap[:]
+    s = index[s]
+    t = index[t]
+    excess = [0] * n
+
+    def finish(flow_value):
+        """Store the flows, the excesses and the flow value in R."""
+        for attr, c, r in zip(attrs, cap, rcap):
+            attr["flow"] = c - r
+        for u, ex in zip(nodes, excess):
+            R_nodes[u]["excess"] = ex
+        R.graph["flow_value"] = flow_value
+        return R
+
+    def reverse_bfs(src, skip):
+        """Returns the number of edges from each node to src in the residual
+        network, or None if there is no path, ignoring node skip."""
+        dist = [None] * n
+        dist[src] = 0
+        queue = [src]
+        for u in queue:
+            d = dist[u] + 1
+            for e in adj[u]:
+                v = head[e]
+                if dist[v] is None and rcap[e ^ 1] > 0 and v != skip:
+                    dist[v] = d
+                    queue.append(v)
+        return dist
+
+    dist = reverse_bfs(t, None)
+    if dist[s] is None:
+        # t is not reachable from s in the residual network. The maximum flow
+        # must be zero.
+        return finish(0)
+
+    # Phase 1: Find the maximum preflow by pushing as much flow as possible to
+    # t. The nodes with a height of at least n are known to be on the s side
+    # of the minimum s-t cut and are not processed before phase 2.
+
+    height = [n + 1 if d is None else d for d in dist]
+    height[s] = n
+    # Saturate all edges emanating from s.
+    for e in adj[s]:
+        flow = rcap[e]
+        if flow > 0:
+            rcap[e] = 0
+            rcap[e ^ 1] += flow
+            excess[head[e]] += flow
+            excess[s] -= flow
+
+    threshold = (n + m) / global_relabel_freq if global_relabel_freq else float("inf")
+    # the position of the current edge of each node in adj
+    cur = [0] * n
+    # The nodes at each height below n, for the gap heuristic, and the stacks
+    # of active nodes at each height, which may hold nodes whose height or
+    # excess changed since.
+    levels = [set() for _ in range(n)]
+    active = [[] for _ in range(2 * n + 1)]
+
+    def rebuild(limit):
+        """Fill the levels and the stacks of the nodes with heights below
+        limit, and return the largest heights of an active node and of a
+        node in the levels."""
+        for level in levels:
+            level.clear()
+        for stack in active:
+            stack.clear()
+        max_height = top = 0
+        for u in range(n):
+            h = height[u]
+            if u != s and u != t and h < limit:
+                if limit == n:
+                    levels[h].add(u)
+                    top = max(top, h)
+                if excess[u] > 0:
+                    active[h].append(u)
+                    max_height = max(max_height, h)
+        return max_height, top
+
+    def discharge_all(is_phase1):
+        """Discharge the active nodes, highest first, until none is left
+        below height n during phase 1, or above height n during phase 2."""
+        work = 0
+        limit = n if is_phase1 else 2 * n
+        h, top = rebuild(limit)
+        while h > (0 if is_phase1 else n):
+            stack = active[h]
+            if not stack:
+                h -= 1
+                continue
+            u = stack.pop()
+            if height[u] != h or excess[u] == 0:
+                continue
+            ex = excess[u]
+            edges = adj[u]
+            i = cur[u]
+            end = len(edges)
+            while True:
+                if i == end:
+                    # We have run off the end of the adjacency list, and there
+                    # can be no more admissible edges. Relabel the node.
+                    work += end
+                    new = min(height[head[e]] for e in edges if rcap[e] > 0) + 1
+                    i = 0
+                    if is_phase1:
+                        level = levels[h]
+                        level.discard(u)
+                        if not level:
+                            # Gap heuristic: no node with a height above h can
+                            # reach t, so u and the nodes above the gap are on
+                            # the s side of the minimum s-t cut.
+                            for k in range(h + 1, top + 1):
+                                for v in levels[k]:
+                                    height[v] = n + 1
+                                levels[k].clear()
+                            top = h - 1
+                            new = n + 1
+                        if new >= n:
+                            height[u] = new
+                            break
+                        levels[new].add(u)
+                        top = max(top, new)
+                    height[u] = h = new
+                    continue
+                e = edges[i]
+                v = head[e]
+                r = rcap[e]
+                if r > 0 and height[v] == h - 1:
+                    flow = ex if ex < r else r
+                    rcap[e] = r - flow
+                    rcap[e ^ 1] += flow
+                    if excess[v] == 0 and v != s and v != t:
+                        active[h - 1].append(v)
+                    excess[v] += flow
+                    ex -= flow
+                    if ex == 0:
+                        break
+                i += 1
+            excess[u] = ex
+            cur[u] = i
+            if ex > 0 and height[u] < limit:
+                active[height[u]].append(u)
+            if work >= threshold:
+                # Global relabeling heuristic: Recompute the exact heights of
+                # all nodes.
+                global_relabel(is_phase1)
+                h, top = rebuild(limit)
+                work = 0
+
+    def global_relabel(is_phase1):
+        """Set the heights to the distances to t during phase 1, and to n
+        plus the distances to s during phase 2."""
+        if is_phase1:
+            dist = reverse_bfs(t, s)
+            for u in range(n):
+                if u != s:
+                    d = dist[u]
+                    if d is not None:
+                        height[u] = d
+                    elif height[u] < n:
+                        height[u] = n + 1
+        else:
+            dist = reverse_bfs(s, t)
+            for u in range(n):
+                if u != s and u != t:
+                    d = dist[u]
+                    height[u] = 2 * n if d is None else n + d
+        for u in range(n):
+            cur[u] = 0
+
+    discharge_all(True)
+
+    # A maximum preflow has been found. The excess at t is the maximum flow
+    # value.
+    if value_only:
+        return finish(excess[t])
+
+    # Phase 2: Convert the maximum preflow into a maximum flow by returning the
+    # excess to s.
+    global_relabel(False)
+    discharge_all(False)
+    return finish(excess[t])
+
+
+def array_preflow_push(
+    G, s, t, capacity="capacity", residual=None, global_relabel_freq=1, value_only=False
+):
+    r"""Find a maximum single-commodity flow using the highest-label
+    preflow-push algorithm on arrays.
+
+    This function computes the same maximum flows as :func:`preflow_push`
+    and returns the residual network in the same form. It numbers the nodes
+    and the edges of the residual network, with each edge next to its
+    reverse edge, and copies the residual capacities and the heads of the
+    edges into lists indexed by edge, and the edges out of each node into a
+    list of edge numbers per node. It keeps the heights, excesses and current
+    edges of the nodes in lists as well, which avoids the attribute lookups
+    that dominate the running time of :func:`preflow_push` on large graphs.
+    It uses the global relabeling and gap heuristics.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Edges of the graph are expected to have an attribute called
+        'capacity'. If this attribute is not present, the edge is
+        considered to have infinite capacity.
+
+    s : node
+        Source node for the flow.
+
+    t : node
+        Sink node for the flow.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    residual : NetworkX graph
+        Residual network on which the algorithm is to be executed. If None, a
+        new residual network is created. Default value: None.
+
+    global_relabel_freq : integer, float
+        Relative frequency of applying the global relabeling heuristic to speed
+        up the algorithm. If it is None, the heuristic is disabled. Default
+        value: 1.
+
+    value_only : bool
+        If False, compute a maximum flow; otherwise, compute a maximum preflow
+        which is enough for computing the maximum flow value. Default value:
+        False.
+
+    Returns
+    -------
+    R : NetworkX DiGraph
+        Residual network after computing the maximum flow.
+
+    Raises
+    ------
+    NetworkXError
+        The algorithm does not support MultiGraph and MultiDiGraph. If
+        the input graph is an instance of one of these two classes, a
+        NetworkXError is raised.
+
+    NetworkXUnbounded
+        If the graph has a path of infinite capacity, the value of a
+        feasible flow on the graph is unbounded above and the function
+        raises a NetworkXUnbounded.
+
+    See also
+    --------
+    :meth:`maximum_flow`
+    :meth:`minimum_cut`
+    :meth:`preflow_push`
+
+    Notes
+    -----
+    See :func:`preflow_push` for the residual network :samp:`R`. The node
+    attribute :samp:`R.nodes[u]['excess']` is set as well, but not the
+    heights of the nodes.
+
+    Examples
+    --------
+    >>> from networkx.algorithms.flow import array_preflow_push
+    >>> G = nx.DiGraph()
+    >>> G.add_edge("x", "a", capacity=3.0)
+    >>> G.add_edge("x", "b", capacity=1.0)
+    >>> G.add_edge("a", "c", capacity=3.0)
+    >>> G.add_edge("b", "c", capacity=5.0)
+    >>> G.add_edge("b", "d", capacity=4.0)
+    >>> G.add_edge("d", "e", capacity=2.0)
+    >>> G.add_edge("c", "y", capacity=2.0)
+    >>> G.add_edge("e", "y", capacity=3.0)
+    >>> R = array_preflow_push(G, "x", "y")
+    >>> R.graph["flow_value"]
+    3.0
+
+    It can be used by all the functions that take a `flow_func`.
+
+    >>> nx.minimum_cut_value(G, "x", "y", flow_func=array_preflow_push)
+    3.0
+    >>> nx.node_connectivity(nx.cycle_graph(6), flow_func=array_preflow_push)
+    2
+    """
+    R = array_preflow_push_impl(
+        G, s, t, capacity, residual, global_relabel_freq, value_only
+    )
+    R.graph["algorithm"] = "array_preflow_push"
+    return R
@@ -0,0 +1,90 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import networkx as nx
+from networkx.algorithms.flow import (
+    FlowNetwork,
+    array_preflow_push,
+    boykov_kolmogorov,
+    dinitz,
+    edmonds_karp,
+    preflow_push,
+    shortest_augmenting_path,
+)
+
+flow_funcs = [
+    array_preflow_push,
+    boykov_kolmogorov,
+    dinitz,
+    edmonds_karp,
+    preflow_push,
+    shortest_augmenting_path,
+]
+
+
+def capacity_graph(directed):
+    G = nx.gnp_random_graph(15, 0.3, seed=42, directed=directed)
+    for i, (u, v) in enumerate(G.edges()):
+        G[u][v]["capacity"] = 1 + i % 5
+    return G
+
+
+@pytest.mark.parametrize("flow_func", flow_funcs)
+@pytest.mark.parametrize("directed", (False, True))
+def test_queries(flow_func, directed):
+    G = capacity_graph(directed)
+    network = FlowNetwork(G, flow_func=flow_func)
+    for s, t in itertools.permutations(list(G)[:5], 2):
+        value = nx.maximum_flow_value(G, s, t)
+        assert network.maximum_flow_value(s, t) == value
+        assert network.minimum_cut_value(s, t) == value
+        flow_value, flow_dict = network.maximum_flow(s, t)
+        assert flow_value == value
+        assert flow_dict == nx.maximum_flow(G, s, t, flow_func=flow_func)[1]
+        cut_value, (S, T) = network.minimum_cut(s, t)
+        assert cut_value == value
+        assert s in S and t in T and S | T == set(G) and not S & T
+        cut = sum(
+            d["capacity"]
+            for u, v, d in G.edges(data=True)
+            if (u in S and v in T) or (not directed and u in T and v in S)
+        )
+        assert cut == value
+
+
+def test_batch():
+    G = capacity_graph(True)
+    network = FlowNetwork(G, flow_func=dinitz)
+    pairs = list(itertools.permutations(list(G)[:6], 2))
+    values = network.maximum_flow_values(pairs)
+    assert list(values) == pairs
+    assert values == {(s, t): nx.maximum_flow_value(G, s, t) for s, t in pairs}
+    cuts = network.minimum_cuts(pairs)
+    assert {st: cut[0] for st, cut in cuts.items()} == values
+    assert network.maximum_flow_values(pairs, n_jobs=2) == values
+    assert network.minimum_cuts(pairs, n_jobs=2) == cuts
+    with ThreadPoolExecutor(2) as executor:
+        assert network.maximum_flow_values(pairs, executor=executor) == values
+        assert network.minimum_cuts(pairs, executor=executor) == cuts
+
+
+def test_errors():
+    G = capacity_graph(False)
+    with pytest.raises(nx.NetworkXError):
+        FlowNetwork(G, flow_func=42)
+    with pytest.raises(nx.NetworkXError):
+        FlowNetwork(G, cutoff=1)
+    with pytest.raises(nx.NetworkXError):
+        FlowNetwork(nx.MultiGraph(G))
+    network = FlowNetwork(G, flow_func=edmonds_karp, cutoff=1)
+    assert network.maximum_flow_value(0, 1) >= 1
+    with pytest.raises(nx.NetworkXError):
+        network.minimum_cut(0, 1)
+    network = FlowNetwork(G)
+    with pytest.raises(nx.NetworkXError):
+        network.maximum_flow_value(0, 100)
+    G = nx.DiGraph([(0, 1), (1, 2)])
+    with pytest.raises(nx.NetworkXUnbounded):
+        FlowNetwork(G).minimum_cut(0, 2)
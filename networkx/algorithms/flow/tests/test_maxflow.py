@@ -4,6 +4,7 @@ import pytest
 
 import networkx as nx
 from networkx.algorithms.flow import (
+    array_preflow_push,
     boykov_kolmogorov,
     build_flow_dict,
     build_residual_network,
@@ -14,6 +15,7 @@ from networkx.algorithms.flow import (
 )
 
 flow_funcs = {
+    array_preflow_push,
     boykov_kolmogorov,
     dinitz,
     edmonds_karp,
@@ -501,6 +503,14 @@ def test_preflow_push_global_relabel_freq():
     pytest.raises(nx.NetworkXError, preflow_push, G, 1, 2, global_relabel_freq=-1)
 
 
+def test_array_preflow_push_global_relabel_freq():
+    G = nx.DiGraph()
+    G.add_edge(1, 2, capacity=1)
+    R = array_preflow_push(G, 1, 2, global_relabel_freq=None)
+    assert R.graph["flow_value"] == 1
+    pytest.raises(nx.NetworkXError, array_preflow_push, G, 1, 2, global_relabel_freq=-1)
+
+
 def test_preflow_push_makes_enough_space():
     # From ticket #1542
     G = nx.DiGraph()
@@ -7,6 +7,7 @@ import pytest
 
 import networkx as nx
 from networkx.algorithms.flow import (
+    array_preflow_push,
     boykov_kolmogorov,
     build_flow_dict,
     build_residual_network,
@@ -17,6 +18,7 @@ from networkx.algorithms.flow import (
 )
 
 flow_funcs = [
+    array_preflow_push,
     boykov_kolmogorov,
     dinitz,
     edmonds_karp,
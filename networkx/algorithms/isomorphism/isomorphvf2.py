@@ -139,7 +139,12 @@ polynomial-time algorithm is known to exist).
 # James P. Crutchfield, principal investigator.
 # Complexity Sciences Center and Physics Department, UC Davis.
 
+import copy
 import sys
+from collections import deque
+
+from networkx.utils import chunks, effective_n_jobs
+from networkx.utils.parallel import _graph_task, _GraphProcessPool
 
 __all__ = ["GraphMatcher", "DiGraphMatcher"]
 
@@ -286,12 +291,18 @@ class GraphMatcher:
         except StopIteration:
             return False
 
-    def isomorphisms_iter(self):
-        """Generator over isomorphisms between G1 and G2."""
+    def isomorphisms_iter(self, n_jobs=None, executor=None):
+        """Generator over isomorphisms between G1 and G2.
+
+        See :meth:`subgraph_isomorphisms_iter` for `n_jobs` and `executor`.
+        """
         # Declare that we are looking for a graph-graph isomorphism.
         self.test = "graph"
         self.initialize()
-        yield from self.match()
+        if n_jobs is not None or executor is not None:
+            yield from self._parallel_match(n_jobs, executor)
+        else:
+            yield from self.match()
 
     def match(self):
         """Extends the isomorphism mapping.
@@ -376,19 +387,132 @@ class GraphMatcher:
 
     #    subgraph_is_isomorphic.__doc__ += "\n" + subgraph.replace('\n','\n'+indent)
 
-    def subgraph_isomorphisms_iter(self):
-        """Generator over isomorphisms between a subgraph of G1 and G2."""
+    def subgraph_isomorphisms_iter(self, n_jobs=None, executor=None):
+        """Generator over isomorphisms between a subgraph of G1 and G2.
+
+        Parameters
+        ----------
+        n_jobs : int, optional (default=None)
+            The number of worker processes to split the search across.
+            None runs the search in the calling process, -1 uses all CPUs.
+            See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+        executor : :class:`concurrent.futures.Executor`, optional (default=None)
+            An executor to run the search on instead of a new process pool.
+
+        Notes
+        -----
+        With `n_jobs` or `executor` the search tree is split into subtrees:
+        the candidate nodes of G1 for the first node of G2 are dispatched in
+        chunks to the workers, which each search the subtrees of their
+        candidates on a copy of the matcher. A worker stops after a few
+        hundred mappings and hands back the subtrees it did not search yet,
+        at every level of its search, which are dispatched again before the
+        chunks after it. The mappings of every chunk are yielded as soon as
+        the chunk and those before it are done, in the same order as without
+        workers. Only a few chunks per worker are in flight at once, so
+        stopping the iteration early does not wait for the rest of the
+        search.
+
+        A new process pool receives the matcher once per worker process. An
+        executor of worker processes receives it with every chunk, which
+        requires the graphs and any `node_match` or `edge_match` functions
+        to be picklable (module level functions rather than closures).
+
+        Examples
+        --------
+        >>> from networkx.algorithms import isomorphism
+        >>> G1 = nx.complete_graph(4)
+        >>> G2 = nx.path_graph(3)
+        >>> GM = isomorphism.GraphMatcher(G1, G2)
+        >>> matches = list(GM.subgraph_monomorphisms_iter(n_jobs=2))
+        >>> matches == list(GM.subgraph_monomorphisms_iter())
+        True
+        >>> len(matches)
+        24
+        """
         # Declare that we are looking for graph-subgraph isomorphism.
         self.test = "subgraph"
         self.initialize()
-        yield from self.match()
+        if n_jobs is not None or executor is not None:
+            yield from self._parallel_match(n_jobs, executor)
+        else:
+            yield from self.match()
+
+    def subgraph_monomorphisms_iter(self, n_jobs=None, executor=None):
+        """Generator over monomorphisms between a subgraph of G1 and G2.
 
-    def subgraph_monomorphisms_iter(self):
-        """Generator over monomorphisms between a subgraph of G1 and G2."""
+        See :meth:`subgraph_isomorphisms_iter` for `n_jobs` and `executor`.
+        """
         # Declare that we are looking for graph-subgraph monomorphism.
         self.test = "mono"
         self.initialize()
-        yield from self.match()
+        if n_jobs is not None or executor is not None:
+            yield from self._parallel_match(n_jobs, executor)
+        else:
+            yield from self.match()
+
+    def _parallel_match(self, n_jobs, executor):
+        """Generator over the mappings of match() from the initial state,
+        with the subtrees of the search searched in parallel.
+        """
+        if executor is None:
+            n_workers = effective_n_jobs(n_jobs)
+        else:
+            n_workers = effective_n_jobs(-1 if n_jobs is None else n_jobs)
+        if len(self.G2) == 0 or (executor is None and n_workers == 1):
+            yield from self.match()
+            return
+        roots = [(pair,) for pair in self.candidate_pairs_iter()]
+        # small chunks keep the workers busy, as the subtrees of the roots
+        # differ a lot in size
+        chunksize = max(1, len(roots) // (16 * n_workers))
+        if executor is None:
+            pool = _GraphProcessPool(self, n_workers)
+        else:
+            pool = executor
+        task = _graph_task(_match_prefixes, self, pool)
+        args = (self.test, _MATCH_BATCH)
+        # the chunks of subtrees left to search, in the order of the search,
+        # with the futures of those submitted to the workers
+        queue = deque([chunk, None] for chunk in chunks(roots, chunksize))
+        in_flight = 0
+
+        def submit():
+            nonlocal in_flight
+            for entry in queue:
+                if in_flight >= 2 * n_workers:
+                    break
+                if entry[1] is None:
+                    entry[1] = pool.submit(task, entry[0], args)
+                    in_flight += 1
+
+        try:
+            submit()
+            while queue:
+                chunk, future = queue[0]
+                if future is None:
+                    future = pool.submit(task, chunk, args)
+                    in_flight += 1
+                mappings, rest = future.result()
+                queue.popleft()
+                in_flight -= 1
+                # the subtrees a task did not search come before the chunks
+                # after it
+                size = max(1, len(rest) // (2 * n_workers))
+                queue.extendleft(
+                    [part, None] for part in reversed(list(chunks(rest, size)))
+                )
+                submit()
+                for mapping in mappings:
+                    self.mapping = mapping
+                    yield mapping
+        finally:
+            for _, future in queue:
+                if future is not None:
+                    future.cancel()
+            if executor is None:
+                pool.shutdown(wait=True, cancel_futures=True)
 
     #    subgraph_isomorphisms_iter.__doc__ += "\n" + subgraph.replace('\n','\n'+indent)
 
@@ -1059,3 +1183,88 @@ class DiGMState:
             for node in list(vector.keys()):
                 if vector[node] == self.depth:
                     del vector[node]
+
+
+# The number of mappings after which a task of a parallel search stops and
+# returns the subtrees it did not search yet.
+_MATCH_BATCH = 512
+
+
+def _match_prefixes(GM, prefixes, test, batch):
+    """Searches the subtrees of the partial mappings `prefixes` (sequences of
+    candidate pairs) on a copy of the matcher `GM`, in order.
+
+    Returns the mappings found and, if there are `batch` of them, the
+    prefixes of the subtrees left to search in the order of the search.
+    """
+    GM = copy.copy(GM)
+    GM.test = test
+    GM.initialize()
+    mappings = []
+    for k, prefix in enumerate(prefixes):
+        states = []
+        for G1_node, G2_node in prefix:
+            if not (
+                GM.syntactic_feasibility(G1_node, G2_node)
+                and GM.semantic_feasibility(G1_node, G2_node)
+            ):
+                break
+            states.append(GM.state.__class__(GM, G1_node, G2_node))
+        else:
+            rest = _match_subtree(GM, prefix, mappings, batch)
+            if rest is not None:
+                rest.extend(prefixes[k + 1 :])
+                return mappings, rest
+        for state in reversed(states):
+            state.restore()
+        if len(mappings) >= batch:
+            return mappings, list(prefixes[k + 1 :])
+    return mappings, []
+
+
+def _match_subtree(GM, prefix, mappings, batch):
+    """Appends the mappings of the search below the current state of `GM`,
+    the state of the partial mapping `prefix`, to `mappings`, like match().
+
+    Returns None, or the prefixes of the subtrees left to search if the
+    search stops because `mappings` holds `batch` mappings.
+    """
+    if len(GM.core_1) == len(GM.G2):
+        mappings.append(GM.core_1.copy())
+        return None
+    # the candidate pairs of each level, the index of the next one and the
+    # state of the level, which restores the pair chosen above it
+    levels = [[list(GM.candidate_pairs_iter()), 0, None]]
+    path = list(prefix)
+    while levels:
+        level = levels[-1]
+        pairs, i, state = level
+        if i == len(pairs):
+            levels.pop()
+            if state is not None:
+                state.restore()
+                path.pop()
+            continue
+        level[1] = i + 1
+        G1_node, G2_node = pairs[i]
+        if GM.syntactic_feasibility(G1_node, G2_node):
+            if GM.semantic_feasibility(G1_node, G2_node):
+                newstate = GM.state.__class__(GM, G1_node, G2_node)
+                if len(GM.core_1) == len(GM.G2):
+                    mappings.append(GM.core_1.copy())
+                    newstate.restore()
+                    if len(mappings) >= batch:
+                        break
+                else:
+                    path.append(pairs[i])
+                    levels.append([list(GM.candidate_pairs_iter()), 0, newstate])
+    else:
+        return None
+    rest = []
+    for depth in reversed(range(len(levels))):
+        pairs, i, state = levels[depth]
+        base = path[: len(prefix) + depth]
+        rest.extend((*base, pair) for pair in pairs[i:])
+        if state is not None:
+            state.restore()
+    return rest
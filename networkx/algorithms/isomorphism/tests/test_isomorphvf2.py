@@ -401,3 +401,62 @@ def test_monomorphism_edge_match():
 
     gm = iso.DiGraphMatcher(G, SG, edge_match=iso.categorical_edge_match("label", None))
     assert gm.subgraph_is_monomorphic()
+
+
+def test_parallel_iter():
+    from concurrent.futures import ThreadPoolExecutor
+
+    G1 = nx.gnp_random_graph(30, 0.3, seed=42)
+    G2 = nx.cycle_graph(4)
+    nx.set_node_attributes(G1, {u: u % 3 for u in G1}, "color")
+    nx.set_node_attributes(G2, {u: u % 2 for u in G2}, "color")
+    nm = iso.categorical_node_match("color", None)
+    D1 = nx.gnp_random_graph(20, 0.3, seed=1, directed=True)
+    D2 = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    matchers = [
+        lambda: iso.GraphMatcher(G1, G2),
+        lambda: iso.GraphMatcher(G1, G2, node_match=nm),
+        lambda: iso.DiGraphMatcher(D1, D2),
+    ]
+    with ThreadPoolExecutor(2) as executor:
+        for matcher in matchers:
+            for method in ("subgraph_isomorphisms_iter", "subgraph_monomorphisms_iter"):
+                expected = list(getattr(matcher(), method)())
+                assert len(expected) > 0
+                for kwargs in ({"n_jobs": 1}, {"n_jobs": 2}, {"executor": executor}):
+                    assert list(getattr(matcher(), method)(**kwargs)) == expected
+
+        # early termination
+        GM = iso.GraphMatcher(G1, G2)
+        first = next(GM.subgraph_isomorphisms_iter())
+        assert next(GM.subgraph_isomorphisms_iter(executor=executor)) == first
+
+    GM = iso.GraphMatcher(nx.cycle_graph(6), nx.cycle_graph(6))
+    assert list(GM.isomorphisms_iter(n_jobs=2)) == list(GM.isomorphisms_iter())
+    GM = iso.GraphMatcher(nx.path_graph(3), nx.Graph())
+    assert list(GM.subgraph_isomorphisms_iter(n_jobs=2)) == [{}]
+
+
+def test_parallel_iter_batches(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+
+    from networkx.algorithms.isomorphism import isomorphvf2
+
+    # tasks stop after every few mappings and hand back their subtrees
+    monkeypatch.setattr(isomorphvf2, "_MATCH_BATCH", 3)
+    G1 = nx.gnp_random_graph(10, 0.5, seed=3)
+    G2 = nx.path_graph(4)
+    D1 = nx.gnp_random_graph(8, 0.4, seed=2, directed=True)
+    with ThreadPoolExecutor(2) as executor:
+        for GM in (iso.GraphMatcher(G1, G2), iso.DiGraphMatcher(D1, D1)):
+            for method in ("subgraph_isomorphisms_iter", "subgraph_monomorphisms_iter"):
+                expected = list(getattr(GM, method)())
+                assert list(getattr(GM, method)(executor=executor)) == expected
+
+        # the mappings are streamed from a search much larger than a batch
+        GM = iso.GraphMatcher(nx.complete_graph(14), nx.path_graph(7))
+        expected = list(islice(GM.subgraph_monomorphisms_iter(), 20))
+        matches = GM.subgraph_monomorphisms_iter(executor=executor)
+        assert list(islice(matches, 20)) == expected
+        matches.close()
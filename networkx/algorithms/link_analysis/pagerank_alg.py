@@ -3,7 +3,13 @@ from warnings import warn
 
 import networkx as nx
 
-__all__ = ["pagerank", "pagerank_numpy", "pagerank_scipy", "google_matrix"]
+__all__ = [
+    "pagerank",
+    "pagerank_numpy",
+    "pagerank_scipy",
+    "google_matrix",
+    "IncrementalPageRank",
+]
 
 
 def pagerank(
@@ -466,12 +472,7 @@ def pagerank_scipy(
         return {}
 
     nodelist = list(G)
-    A = nx.to_scipy_sparse_array(G, nodelist=nodelist, weight=weight, dtype=float)
-    S = A.sum(axis=1)
-    S[S != 0] = 1.0 / S[S != 0]
-    # TODO: csr_array
-    Q = sp.sparse.csr_array(sp.sparse.spdiags(S.T, 0, *A.shape))
-    A = Q @ A
+    A, S = _transition_matrix(G, nodelist, weight)
 
     # initial vector
     if nstart is None:
@@ -506,3 +507,332 @@ def pagerank_scipy(
         if err < N * tol:
             return dict(zip(nodelist, map(float, x)))
     raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _transition_matrix(G, nodelist, weight):
+    """Returns the row-stochastic transition matrix of `G` (with all-zero rows
+    for dangling nodes) and the array of weighted out-degrees.
+
+    """
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    A = nx.to_scipy_sparse_array(G, nodelist=nodelist, weight=weight, dtype=float)
+    S = A.sum(axis=1)
+    inv = S.copy()
+    inv[inv != 0] = 1.0 / inv[inv != 0]
+    # TODO: csr_array
+    Q = sp.sparse.csr_array(sp.sparse.spdiags(inv.T, 0, *A.shape))
+    return Q @ A, S
+
+
+class IncrementalPageRank:
+    r"""PageRank of a graph that is kept up to date under edge changes.
+
+    The PageRank is computed once when the object is created. Batches of
+    edge insertions and deletions are then applied to the graph with
+    :meth:`update`, which re-converges from the previous PageRank vector
+    instead of starting over.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph. Undirected graphs are treated as directed graphs
+      with two directed edges for each undirected edge. Updates are applied
+      to `G` itself, which must not be changed in any other way while the
+      object is in use.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    personalization: dict, optional
+      The "personalization vector" consisting of a dictionary with a
+      key some subset of graph nodes and personalization value each of those.
+      At least one personalization value must be non-zero.
+      By default, a uniform distribution is used.
+
+    max_iter : integer, optional
+      Maximum number of rounds of the solver for each update.
+
+    tol : float, optional
+      Error tolerance used to check convergence, as in :func:`pagerank`.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, i.e., nodes without
+      any outedges, as in :func:`pagerank`.
+
+    Attributes
+    ----------
+    G : graph
+      The graph the PageRank is computed for.
+
+    pagerank : dictionary
+      Dictionary of nodes with their current PageRank as value.
+
+    Raises
+    ------
+    PowerIterationFailedConvergence
+        If the solver fails to converge to the specified tolerance
+        within `max_iter` rounds.
+
+    See Also
+    --------
+    pagerank
+
+    Notes
+    -----
+    PageRank is the fixed point $x = \alpha x P + \alpha (x \cdot d) w +
+    (1 - \alpha) p$ of the transition matrix $P$ with dangling nodes $d$,
+    dangling weights $w$ and personalization $p$. The object keeps the
+    residual $r$ of its current vector $x$ with respect to that equation
+    and solves it by pushing residual mass: every node whose residual
+    exceeds `tol` moves it into $x$ and spreads $\alpha$ times of it along
+    its out-edges [1]_. Starting from the uniform vector all nodes are
+    pushed in the first rounds, which is the power iteration of
+    :func:`pagerank`.
+
+    Changing the out-edges of a node $u$ changes row $u$ of $P$, which only
+    changes the residual of the old and new successors of $u$ by $\alpha
+    x_u$ times the difference of the rows. The following rounds then only
+    push nodes around the changed edges, as long as the residual spreading
+    from them stays above `tol`. Iteration stops when the residual has an
+    $L_1$ norm below ``N * tol``.
+
+    Nodes appearing in inserted edges are added to the graph. Nodes are
+    never removed.
+
+    References
+    ----------
+    .. [1] Frank McSherry:
+       A Uniform Approach to Accelerated PageRank Computation.
+       Proceedings of the 14th International Conference on World Wide Web,
+       575-582, 2005.
+       https://doi.org/10.1145/1060745.1060829
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> ipr = nx.IncrementalPageRank(G)
+    >>> pr = ipr.update(add=[(3, 0)], remove=[(1, 0)])
+    >>> expected = nx.pagerank(G)
+    >>> all(abs(pr[n] - expected[n]) < 1e-5 for n in G)
+    True
+    """
+
+    def __init__(
+        self,
+        G,
+        alpha=0.85,
+        personalization=None,
+        max_iter=100,
+        tol=1.0e-6,
+        weight="weight",
+        dangling=None,
+    ):
+        import numpy as np
+
+        self.G = G
+        self.alpha = alpha
+        self.max_iter = max_iter
+        self.tol = tol
+        self.weight = weight
+        self._personalization = personalization
+        self._dangling = dangling
+
+        self._nodelist = list(G)
+        self._index = {n: i for i, n in enumerate(self._nodelist)}
+        N = len(self._nodelist)
+        if N == 0:
+            self._P = None
+            self._x = self._r = np.zeros(0)
+            return
+        self._P, S = _transition_matrix(G, self._nodelist, weight)
+        self._is_dangling = S == 0
+        self._p_raw = self._raw_weights(personalization, self._nodelist)
+        self._w_raw = self._raw_weights(dangling, self._nodelist)
+        if personalization is not None and self._p_raw.sum() == 0:
+            raise ZeroDivisionError
+        p, w = self._normalized_weights()
+
+        self._x = np.repeat(1.0 / N, N)
+        self._r = self._residual(self._x, p, w)
+        self._solve(p, w)
+
+    @staticmethod
+    def _raw_weights(values, nodes):
+        import numpy as np
+
+        if values is None:
+            return np.ones(len(nodes))
+        return np.array([values.get(n, 0) for n in nodes], dtype=float)
+
+    def _normalized_weights(self):
+        p = self._p_raw / self._p_raw.sum()
+        if self._dangling is None:
+            return p, p
+        return p, self._w_raw / self._w_raw.sum()
+
+    def _residual(self, x, p, w):
+        alpha = self.alpha
+        dangling_mass = x[self._is_dangling].sum()
+        return alpha * (x @ self._P + dangling_mass * w) + (1 - alpha) * p - x
+
+    def _solve(self, p, w):
+        import numpy as np
+
+        alpha, tol = self.alpha, self.tol
+        x, r, P = self._x, self._r, self._P
+        N = len(x)
+        for _ in range(self.max_iter):
+            abs_r = np.absolute(r)
+            if abs_r.sum() < N * tol:
+                return
+            active = np.flatnonzero(abs_r > tol)
+            pushed = r[active]
+            r[active] = 0
+            x[active] += pushed
+            r += alpha * (P[active].T @ pushed)
+            dangling_mass = pushed[self._is_dangling[active]].sum()
+            if dangling_mass:
+                r += alpha * dangling_mass * w
+        if np.absolute(r).sum() >= N * tol:
+            raise nx.PowerIterationFailedConvergence(self.max_iter)
+
+    @property
+    def pagerank(self):
+        x = self._x
+        total = x.sum()
+        return dict(zip(self._nodelist, map(float, x / total if total else x)))
+
+    def _add_nodes(self, nodes):
+        import numpy as np
+
+        start = len(self._nodelist)
+        for n in nodes:
+            self._index[n] = len(self._nodelist)
+            self._nodelist.append(n)
+        k = len(self._nodelist) - start
+        if k == 0:
+            return
+        self._x = np.concatenate([self._x, np.zeros(k)])
+        self._r = np.concatenate([self._r, np.zeros(k)])
+        self._is_dangling = np.concatenate([self._is_dangling, np.ones(k, bool)])
+        self._p_raw = np.concatenate(
+            [self._p_raw, self._raw_weights(self._personalization, nodes)]
+        )
+        self._w_raw = np.concatenate(
+            [self._w_raw, self._raw_weights(self._dangling, nodes)]
+        )
+        self._P.resize((len(self._nodelist), len(self._nodelist)))
+
+    def _row(self, u):
+        """Returns the column indices and values of the new row of `u`."""
+        import numpy as np
+
+        G, weight, index = self.G, self.weight, self._index
+        nbrs = G._adj[u]
+        cols = [index[v] for v in nbrs]
+        if G.is_multigraph():
+            if weight is None:
+                vals = [len(keydict) for keydict in nbrs.values()]
+            else:
+                vals = [
+                    sum(d.get(weight, 1) for d in keydict.values())
+                    for keydict in nbrs.values()
+                ]
+        elif weight is None:
+            vals = [1] * len(cols)
+        else:
+            vals = [dd.get(weight, 1) for dd in nbrs.values()]
+        vals = np.array(vals, dtype=float)
+        total = vals.sum()
+        return np.array(cols, dtype=np.intp), vals / total if total else vals
+
+    def update(self, add=None, remove=None):
+        """Applies a batch of edge changes to the graph and returns the new
+        PageRank.
+
+        Parameters
+        ----------
+        add : iterable of edges, optional
+            Edges to add with :meth:`~networkx.Graph.add_edges_from`. Each
+            edge can be a 2-tuple, or a 3-tuple with a dict of edge data.
+            Data of existing edges is updated, so this also changes weights.
+
+        remove : iterable of edges, optional
+            Edges to remove with :meth:`~networkx.Graph.remove_edges_from`.
+            Edges that are not in the graph are silently ignored.
+
+        Returns
+        -------
+        pagerank : dictionary
+           Dictionary of nodes with PageRank as value
+        """
+        import numpy as np
+        import scipy as sp
+        import scipy.sparse  # call as sp.sparse
+
+        G = self.G
+        add = [] if add is None else list(add)
+        remove = [] if remove is None else list(remove)
+        changed = {e[0] for e in add} | {e[0] for e in remove}
+        if not G.is_directed():
+            changed.update(e[1] for e in add)
+            changed.update(e[1] for e in remove)
+        G.remove_edges_from(remove)
+        G.add_edges_from(add)
+        if self._P is None:
+            # nothing to update incrementally yet
+            self.__init__(
+                G,
+                self.alpha,
+                self._personalization,
+                self.max_iter,
+                self.tol,
+                self.weight,
+                self._dangling,
+            )
+            return self.pagerank
+
+        old_p, old_w = self._normalized_weights()
+        self._add_nodes([n for n in G if n not in self._index])
+        p, w = self._normalized_weights()
+        x, r, P, index = self._x, self._r, self._P, self._index
+        N = len(x)
+        if len(old_p) < N:
+            old_p = np.concatenate([old_p, np.zeros(N - len(old_p))])
+            old_w = np.concatenate([old_w, np.zeros(N - len(old_w))])
+
+        # the residual changes by alpha * x[u] times the change of row u
+        rows, cols, vals = [], [], []
+        was_dangling = self._is_dangling.copy()
+        for u in changed:
+            if u not in G:
+                continue
+            i = index[u]
+            start, stop = P.indptr[i], P.indptr[i + 1]
+            new_cols, new_vals = self._row(u)
+            rows.append(np.full(stop - start + len(new_cols), i))
+            cols.append(P.indices[start:stop])
+            cols.append(new_cols)
+            vals.append(-P.data[start:stop])
+            vals.append(new_vals)
+            self._is_dangling[i] = len(new_cols) == 0
+        if rows:
+            D = sp.sparse.csr_array(
+                (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(N, N),
+            )
+            r += self.alpha * (D.T @ x)
+            P = self._P = P + D
+            P.eliminate_zeros()
+        # dangling nodes and the personalization weigh on all nodes
+        dangling_mass = x[self._is_dangling].sum()
+        old_dangling_mass = x[was_dangling].sum()
+        r += self.alpha * (dangling_mass * w - old_dangling_mass * old_w)
+        r += (1 - self.alpha) * (p - old_p)
+        self._solve(p, w)
+        return self.pagerank
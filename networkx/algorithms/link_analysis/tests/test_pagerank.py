@@ -209,6 +209,68 @@ class TestPageRankScipy(TestPageRank):
         assert nx.pagerank_scipy(G) == {}
 
 
+class TestIncrementalPageRank:
+    @classmethod
+    def setup_class(cls):
+        TestPageRank.setup_class()
+        cls.G = TestPageRank.G
+
+    def check(self, ipr, **kwargs):
+        expected = nx.pagerank(ipr.G, tol=1e-10, **kwargs)
+        assert ipr.pagerank == pytest.approx(expected, abs=1e-4)
+
+    def test_initial(self):
+        ipr = nx.IncrementalPageRank(self.G.copy(), alpha=0.9, tol=1.0e-08)
+        for n in self.G:
+            assert ipr.pagerank[n] == pytest.approx(self.G.pagerank[n], abs=1e-4)
+
+    @pytest.mark.parametrize("graph_type", (nx.Graph, nx.DiGraph, nx.MultiDiGraph))
+    def test_updates(self, graph_type):
+        G = nx.gnm_random_graph(200, 600, seed=42, directed=True)
+        G = graph_type(G)
+        rng = random.Random(42)
+        ipr = nx.IncrementalPageRank(G)
+        self.check(ipr)
+        for _ in range(5):
+            remove = rng.sample(list(G.edges()), 20)
+            add = [(rng.randrange(220), rng.randrange(220)) for _ in range(20)]
+            pr = ipr.update(add=add, remove=remove)
+            assert pr == ipr.pagerank
+            assert set(pr) == set(G)
+            self.check(ipr)
+
+    def test_weights_and_options(self):
+        G = nx.gnm_random_graph(50, 150, seed=1, directed=True)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (u + v) % 5 + 1
+        personalization = {n: n % 3 for n in G}
+        dangling = {n: 1 for n in range(10)}
+        kwargs = {"personalization": personalization, "dangling": dangling}
+        ipr = nx.IncrementalPageRank(G, **kwargs)
+        self.check(ipr, **kwargs)
+        ipr.update(add=[(0, 1, {"weight": 20}), (3, 60)], remove=list(G.edges(7)))
+        self.check(ipr, **kwargs)
+        ipr = nx.IncrementalPageRank(G, weight=None)
+        ipr.update(add=[(2, 3, {"weight": 100})])
+        self.check(ipr, weight=None)
+
+    def test_empty(self):
+        G = nx.DiGraph()
+        ipr = nx.IncrementalPageRank(G)
+        assert ipr.pagerank == {}
+        ipr.update(add=[(1, 2), (2, 3)])
+        self.check(ipr)
+
+    def test_zero_personalization_vector(self):
+        G = nx.complete_graph(4)
+        with pytest.raises(ZeroDivisionError):
+            nx.IncrementalPageRank(G, personalization={0: 0})
+
+    def test_max_iter(self):
+        with pytest.raises(nx.PowerIterationFailedConvergence):
+            nx.IncrementalPageRank(self.G.copy(), max_iter=0)
+
+
 @pytest.mark.parametrize("pagerank_alg", (nx.pagerank_numpy, nx.pagerank_scipy))
 def test_deprecation_warnings(pagerank_alg):
     """Make sure deprecation warnings are raised.
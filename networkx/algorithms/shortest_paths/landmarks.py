@@ -0,0 +1,364 @@
+"""Point-to-point shortest paths with precomputed landmark distances (ALT).
+"""
+from heapq import heappop, heappush
+from itertools import count
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+from networkx.utils import create_py_random_state
+
+__all__ = ["ShortestPathIndex"]
+
+# stands in for the distance between a landmark and a node that it cannot
+# reach or be reached from; finite so that differences stay well defined
+_UNREACHABLE = 1e300
+
+
+class ShortestPathIndex:
+    r"""Index of a static graph for fast point-to-point shortest path queries.
+
+    The index computes the distances from and to a small set of landmark
+    nodes once. Queries then run a bidirectional Dijkstra search that is
+    directed towards the target by the lower bounds on distances that
+    follow from the triangle inequality (the ALT algorithm [1]_), which
+    usually visits a small fraction of the nodes that
+    :func:`bidirectional_dijkstra` visits.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        The graph must not change while the index is in use: the landmark
+        distances are not updated, and queries on a changed graph may
+        return paths that are not shortest.
+
+    landmarks : integer or iterable of nodes, optional (default=16)
+        The landmark nodes, or the number of landmarks to select. Landmarks
+        are selected one after the other as the node farthest from the
+        landmarks selected so far, which spreads them around the border of
+        the graph where they give the best bounds.
+
+    weight : string or function
+        If this is a string, then edge weights will be accessed via the
+        edge attribute with this key (that is, the weight of the edge
+        joining `u` to `v` will be ``G.edges[u, v][weight]``). If no
+        such edge attribute exists, the weight of the edge is assumed to
+        be one.
+
+        If this is a function, the weight of an edge is the value
+        returned by the function. The function must accept exactly three
+        positional arguments: the two endpoints of an edge and the
+        dictionary of edge attributes for that edge. The function must
+        return a number or None to hide the edge.
+
+    active_landmarks : integer, optional (default=4)
+        The number of landmarks used by a query: those that give the best
+        lower bound on the distance between its source and target.
+
+    seed : integer, random_state, or None (default)
+        Indicator of random number generation state used to choose the
+        node the landmark selection starts from.
+        See :ref:`Randomness<randomness>`.
+
+    Attributes
+    ----------
+    landmarks : list
+        The landmark nodes.
+
+    Raises
+    ------
+    ValueError
+        If a negative edge weight is found.
+
+    See Also
+    --------
+    bidirectional_dijkstra
+    astar_path
+
+    Notes
+    -----
+    For a landmark $L$ the triangle inequality gives the lower bounds
+    $d(v, t) \geq d(L, t) - d(L, v)$ and $d(v, t) \geq d(v, L) - d(t, L)$.
+    The largest of these bounds over the active landmarks is a potential
+    $\pi_t$ that estimates the distance to the target, and $\pi_s$
+    estimates the distance from the source in the same way. The forward
+    search orders nodes by $d(s, v) + \pi(v)$ and the backward search by
+    $d(v, t) - \pi(v)$ with the average potential
+    $\pi = (\pi_t - \pi_s) / 2$, which keeps both searches consistent, and
+    the search stops as soon as the sum of the two smallest keys reaches
+    the length of the best path found [2]_.
+
+    Preprocessing runs one single source Dijkstra search per landmark, two
+    for directed graphs, and stores one distance per node and landmark
+    (two for directed graphs).
+
+    Distances are calculated as sums of weighted edges traversed. The
+    length is only guaranteed to be exact for integer weights, as with
+    :func:`bidirectional_dijkstra`.
+
+    References
+    ----------
+    .. [1] Andrew V. Goldberg and Chris Harrelson:
+       Computing the shortest path: A* search meets graph theory.
+       Proceedings of the 16th Annual ACM-SIAM Symposium on Discrete
+       Algorithms, 156-165, 2005.
+    .. [2] Ikeda, T., Hsu, M.-Y., Imai, H., Nishimura, S., Shimoura, H.,
+       Hashimoto, T., Tenmoku, K. and Mitoh, K.:
+       A fast algorithm for finding better routes by AI search techniques.
+       Proceedings of the Vehicle Navigation and Information Systems
+       Conference, 291-296, 1994.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> index = nx.ShortestPathIndex(G, landmarks=4, seed=42)
+    >>> index.length((0, 0), (9, 9))
+    18
+    >>> path = index.path((0, 0), (9, 9))
+    >>> len(path)
+    19
+    """
+
+    def __init__(self, G, landmarks=16, weight="weight", active_landmarks=4, seed=None):
+        self.G = G
+        self._weight = _weight_function(G, weight)
+        self.active_landmarks = active_landmarks
+        if G.is_directed():
+            self._neighs = [G._succ, G._pred]
+        else:
+            self._neighs = [G._adj, G._adj]
+        if isinstance(landmarks, int):
+            self.landmarks, dists_from = self._select_landmarks(landmarks, seed)
+        else:
+            self.landmarks = list(landmarks)
+            for L in self.landmarks:
+                if L not in G:
+                    raise nx.NodeNotFound(f"Landmark {L} is not in G")
+            dists_from = [self._distances(L, 0) for L in self.landmarks]
+
+        nodes = list(G)
+        self._from = self._node_table(nodes, dists_from)
+        if G.is_directed():
+            dists_to = [self._distances(L, 1) for L in self.landmarks]
+            self._to = self._node_table(nodes, dists_to)
+        else:
+            self._to = self._from
+
+    def _distances(self, source, dir):
+        # distances from source (dir == 0) or to source (dir == 1)
+        weight = self._weight
+        neighs = self._neighs[dir]
+        dist = {}
+        seen = {source: 0}
+        c = count()
+        fringe = [(0, next(c), source)]
+        while fringe:
+            (d, _, v) = heappop(fringe)
+            if v in dist:
+                continue
+            dist[v] = d
+            for u, e in neighs[v].items():
+                cost = weight(v, u, e) if dir == 0 else weight(u, v, e)
+                if cost is None:
+                    continue
+                vu_dist = d + cost
+                if u in dist:
+                    if vu_dist < dist[u]:
+                        raise ValueError("Contradictory paths found: negative weights?")
+                elif u not in seen or vu_dist < seen[u]:
+                    seen[u] = vu_dist
+                    heappush(fringe, (vu_dist, next(c), u))
+        return dist
+
+    def _select_landmarks(self, k, seed):
+        # returns the landmarks and their distances to all nodes
+        G = self.G
+        if k <= 0 or len(G) == 0:
+            return [], []
+        seed = create_py_random_state(seed)
+        # start from the node farthest from a random node
+        nodes = list(G)
+        start = self._distances(seed.choice(nodes), 0)
+        landmarks = [max(start, key=start.get)]
+        dists = []
+        gap = dict.fromkeys(nodes, _UNREACHABLE)
+        while True:
+            dist = self._distances(landmarks[-1], 0)
+            dists.append(dist)
+            for v, d in dist.items():
+                if d < gap[v]:
+                    gap[v] = d
+            if len(landmarks) == min(k, len(nodes)):
+                return landmarks, dists
+            # nodes not reached by any landmark yet come first
+            landmarks.append(max(gap, key=gap.get))
+
+    @staticmethod
+    def _node_table(nodes, dists):
+        # node -> tuple of its distances to or from each landmark
+        if not dists:
+            return dict.fromkeys(nodes, ())
+        columns = [[d.get(v, _UNREACHABLE) for v in nodes] for d in dists]
+        return dict(zip(nodes, zip(*columns)))
+
+    def _potential(self, source, target):
+        # the average potential of the source and target lower bounds over
+        # the active landmarks, or None if target is not reachable
+        F, T = self._from, self._to
+        fs, ts, ft, tt = F[source], T[source], F[target], T[target]
+        bounds = [
+            (max(ft[i] - fs[i], ts[i] - tt[i]), i) for i in range(len(self.landmarks))
+        ]
+        bounds.sort(reverse=True)
+        if bounds and bounds[0][0] >= _UNREACHABLE / 2:
+            return None
+        active = [i for _, i in bounds[: self.active_landmarks]]
+        pots = {}
+
+        def potential(v):
+            try:
+                return pots[v]
+            except KeyError:
+                fv, tv = F[v], T[v]
+                # lower bounds of d(v, target) and d(source, v)
+                to_target = max(
+                    [ft[i] - fv[i] for i in active] + [tv[i] - tt[i] for i in active]
+                )
+                from_source = max(
+                    [fv[i] - fs[i] for i in active] + [ts[i] - tv[i] for i in active]
+                )
+                p = pots[v] = (to_target - from_source) / 2
+                return p
+
+        if not active:
+            return lambda v: 0
+        return potential
+
+    def _search(self, source, target):
+        G = self.G
+        if source not in G or target not in G:
+            msg = f"Either source {source} or target {target} is not in G"
+            raise nx.NodeNotFound(msg)
+        if source == target:
+            return (0, [source])
+        potential = self._potential(source, target)
+        if potential is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+
+        weight = self._weight
+        neighs = self._neighs
+        push = heappush
+        pop = heappop
+        # Init:  [Forward, Backward]
+        dists = [{}, {}]  # dictionary of final distances
+        preds = [{source: None}, {target: None}]
+        seen = [{source: 0}, {target: 0}]  # dict of distances to seen nodes
+        c = count()
+        # the forward search is keyed by dist + potential, the backward
+        # search by dist - potential
+        sign = [1, -1]
+        fringe = [
+            [(potential(source), next(c), source)],
+            [(-potential(target), next(c), target)],
+        ]
+        best = None
+        meet = None
+        dir = 1
+        while fringe[0] and fringe[1]:
+            if best is not None and fringe[0][0][0] + fringe[1][0][0] >= best:
+                break
+            # choose direction
+            # dir == 0 is forward direction and dir == 1 is back
+            dir = 1 - dir
+            (_, _, v) = pop(fringe[dir])
+            if v in dists[dir]:
+                # Shortest path to v has already been found
+                continue
+            dist = dists[dir][v] = seen[dir][v]
+            other_seen = seen[1 - dir]
+            for w, d in neighs[dir][v].items():
+                # weight(v, w, d) for forward and weight(w, v, d) for back direction
+                cost = weight(v, w, d) if dir == 0 else weight(w, v, d)
+                if cost is None:
+                    continue
+                vw_dist = dist + cost
+                if w in dists[dir]:
+                    if vw_dist < dists[dir][w]:
+                        raise ValueError("Contradictory paths found: negative weights?")
+                    continue
+                if w not in seen[dir] or vw_dist < seen[dir][w]:
+                    # relaxing
+                    seen[dir][w] = vw_dist
+                    preds[dir][w] = v
+                    push(fringe[dir], (vw_dist + sign[dir] * potential(w), next(c), w))
+                    if w in other_seen:
+                        # see if this path is better than the already
+                        # discovered shortest path
+                        total = vw_dist + other_seen[w]
+                        if best is None or total < best:
+                            best = total
+                            meet = w
+        if best is None:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        path = []
+        v = meet
+        while v is not None:
+            path.append(v)
+            v = preds[0][v]
+        path.reverse()
+        v = preds[1][meet]
+        while v is not None:
+            path.append(v)
+            v = preds[1][v]
+        return (best, path)
+
+    def path(self, source, target):
+        """Returns a shortest path from `source` to `target`.
+
+        Parameters
+        ----------
+        source : node
+            Starting node.
+
+        target : node
+            Ending node.
+
+        Returns
+        -------
+        path : list
+            List of nodes in a shortest path.
+
+        Raises
+        ------
+        NodeNotFound
+            If either `source` or `target` is not in the graph.
+
+        NetworkXNoPath
+            If no path exists between source and target.
+        """
+        return self._search(source, target)[1]
+
+    def length(self, source, target):
+        """Returns the length of a shortest path from `source` to `target`.
+
+        Parameters
+        ----------
+        source : node
+            Starting node.
+
+        target : node
+            Ending node.
+
+        Returns
+        -------
+        length : number
+            Shortest path length.
+
+        Raises
+        ------
+        NodeNotFound
+            If either `source` or `target` is not in the graph.
+
+        NetworkXNoPath
+            If no path exists between source and target.
+        """
+        return self._search(source, target)[0]
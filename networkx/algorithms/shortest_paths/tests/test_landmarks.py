@@ -0,0 +1,111 @@
+import itertools
+import random
+
+import pytest
+
+import networkx as nx
+from networkx.algorithms.shortest_paths.weighted import _weight_function
+from networkx.utils import pairwise
+
+
+def check_index(G, index, weight="weight"):
+    wt = _weight_function(G, weight)
+    for s, t in itertools.product(G, repeat=2):
+        try:
+            length, _ = nx.bidirectional_dijkstra(G, s, t, weight=weight)
+        except nx.NetworkXNoPath:
+            pytest.raises(nx.NetworkXNoPath, index.length, s, t)
+            pytest.raises(nx.NetworkXNoPath, index.path, s, t)
+            continue
+        assert index.length(s, t) == length
+        path = index.path(s, t)
+        assert path[0] == s and path[-1] == t
+        assert sum(wt(u, v, G[u][v]) for u, v in pairwise(path)) == length
+
+
+class TestShortestPathIndex:
+    @classmethod
+    def setup_class(cls):
+        edges = [
+            ("s", "u", 10),
+            ("s", "x", 5),
+            ("u", "v", 1),
+            ("u", "x", 2),
+            ("v", "y", 1),
+            ("x", "u", 3),
+            ("x", "v", 5),
+            ("x", "y", 2),
+            ("y", "s", 7),
+            ("y", "v", 6),
+        ]
+        cls.XG = nx.DiGraph()
+        cls.XG.add_weighted_edges_from(edges)
+
+    def test_digraph(self):
+        index = nx.ShortestPathIndex(self.XG, landmarks=2, seed=42)
+        assert len(index.landmarks) == 2
+        assert index.path("s", "v") == ["s", "x", "u", "v"]
+        assert index.length("s", "v") == 9
+        check_index(self.XG, index)
+
+    @pytest.mark.parametrize("directed", (False, True))
+    @pytest.mark.parametrize("landmarks", (0, 1, 3, 100))
+    def test_random_graphs(self, directed, landmarks):
+        rng = random.Random(42)
+        for seed in range(3):
+            G = nx.gnp_random_graph(20, 0.15, seed=seed, directed=directed)
+            for u, v, d in G.edges(data=True):
+                d["weight"] = rng.randint(0, 20)
+            index = nx.ShortestPathIndex(
+                G, landmarks=landmarks, active_landmarks=2, seed=seed
+            )
+            assert len(index.landmarks) == min(landmarks, len(G))
+            check_index(G, index)
+
+    def test_given_landmarks(self):
+        G = nx.grid_2d_graph(6, 6)
+        index = nx.ShortestPathIndex(G, landmarks=[(0, 0), (5, 5)])
+        assert index.landmarks == [(0, 0), (5, 5)]
+        check_index(G, index)
+        with pytest.raises(nx.NodeNotFound):
+            nx.ShortestPathIndex(G, landmarks=[(6, 6)])
+
+    def test_multigraph_and_weight_function(self):
+        G = nx.MultiDiGraph(self.XG)
+        G.add_edge("s", "v", weight=8)
+        G.add_edge("s", "v", weight=20)
+        index = nx.ShortestPathIndex(G, landmarks=3, seed=1)
+        assert index.path("s", "v") == ["s", "v"]
+        check_index(G, index)
+
+        def weight(u, v, d):
+            # hide the edges out of x
+            return None if u == "x" else min(e["weight"] for e in d.values())
+
+        index = nx.ShortestPathIndex(G, landmarks=3, weight=weight, seed=1)
+        assert index.path("s", "y") == ["s", "v", "y"]
+        check_index(G, index, weight=weight)
+
+    def test_disconnected(self):
+        G = nx.disjoint_union(nx.path_graph(4), nx.cycle_graph(5))
+        G.add_node(9)
+        index = nx.ShortestPathIndex(G, landmarks=3, seed=42)
+        # one landmark in each component
+        assert {
+            frozenset(nx.node_connected_component(G, L)) for L in index.landmarks
+        } == {frozenset(c) for c in nx.connected_components(G)}
+        check_index(G, index)
+
+    def test_errors(self):
+        index = nx.ShortestPathIndex(self.XG, landmarks=2, seed=42)
+        assert index.path("s", "s") == ["s"]
+        assert index.length("s", "s") == 0
+        with pytest.raises(nx.NodeNotFound):
+            index.path("s", "z")
+        with pytest.raises(nx.NodeNotFound):
+            index.length("z", "s")
+        G = nx.Graph([(0, 1, {"weight": -2})])
+        with pytest.raises(ValueError):
+            nx.ShortestPathIndex(G, landmarks=1, seed=42)
+        index = nx.ShortestPathIndex(nx.Graph(), seed=42)
+        assert index.landmarks == []
@@ -1,3 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 import networkx as nx
 
 
@@ -84,6 +88,19 @@ class TestUnweightedPath:
         l = dict(nx.all_pairs_shortest_path_length(self.grid))
         assert l[1][16] == 6
 
+    @pytest.mark.parametrize("n_jobs", (1, 2))
+    def test_all_pairs_shortest_path_length_parallel(self, n_jobs):
+        expected = list(nx.all_pairs_shortest_path_length(self.grid, cutoff=3))
+        result = nx.all_pairs_shortest_path_length(self.grid, cutoff=3, n_jobs=n_jobs)
+        assert list(result) == expected
+        with ThreadPoolExecutor(2) as executor:
+            result = nx.all_pairs_shortest_path_length(
+                self.directed_cycle, executor=executor
+            )
+            assert list(result) == list(
+                nx.all_pairs_shortest_path_length(self.directed_cycle)
+            )
+
     def test_predecessor_path(self):
         G = nx.path_graph(4)
         assert nx.predecessor(G, 0) == {0: [], 1: [0], 2: [1], 3: [2]}
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import networkx as nx
@@ -396,6 +398,25 @@ class TestWeightedPath(WeightedTestBase):
         pl = dict(nx.all_pairs_dijkstra_path_length(cycle))
         assert pl[0] == {0: 0, 1: 1, 2: 5, 3: 4, 4: 3, 5: 2, 6: 1}
 
+    @pytest.mark.parametrize("n_jobs", (1, 2))
+    def test_all_pairs_dijkstra_path_length_parallel(self, n_jobs):
+        G = nx.gnm_random_graph(30, 80, seed=7, directed=True)
+        for u, v, d in G.edges(data=True):
+            d["cost"] = (u * v) % 5 + 1
+        expected = list(nx.all_pairs_dijkstra_path_length(G, cutoff=6, weight="cost"))
+        result = nx.all_pairs_dijkstra_path_length(
+            G, cutoff=6, weight="cost", n_jobs=n_jobs
+        )
+        assert list(result) == expected
+        with ThreadPoolExecutor(2) as executor:
+            result = nx.all_pairs_dijkstra_path_length(
+                G, weight=lambda u, v, d: d["cost"] * 2, executor=executor
+            )
+            assert list(result) == [
+                (n, {v: 2 * l for v, l in lengths.items()})
+                for n, lengths in nx.all_pairs_dijkstra_path_length(G, weight="cost")
+            ]
+
     def test_all_pairs_dijkstra(self):
         cycle = nx.cycle_graph(7)
         out = dict(nx.all_pairs_dijkstra(cycle))
@@ -922,3 +943,21 @@ class TestJohnsonAlgorithm(WeightedTestBase):
         validate_path(self.XG3, 0, 3, 15, nx.johnson(self.XG3)[0][3])
         validate_path(self.XG4, 0, 2, 4, nx.johnson(self.XG4)[0][2])
         validate_path(self.MXG4, 0, 2, 4, nx.johnson(self.MXG4)[0][2])
+
+    @pytest.mark.parametrize("n_jobs", (1, 2))
+    def test_parallel(self, n_jobs):
+        # Negative weights on an acyclic graph cannot form negative cycles.
+        G = nx.DiGraph()
+        G.add_weighted_edges_from(
+            (u, v, (u + 2 * v) % 7 - 2)
+            for u, v in nx.gnm_random_graph(25, 70, seed=3).edges
+            if u < v
+        )
+        MG = nx.MultiGraph()
+        MG.add_weighted_edges_from([(0, 1, 2), (1, 2, 3), (2, 0, 1), (0, 1, 1)])
+        for H in (G, MG):
+            assert nx.johnson(H, n_jobs=n_jobs) == nx.johnson(H)
+        with ThreadPoolExecutor(2) as executor:
+            paths = nx.johnson(G, executor=executor)
+        assert list(paths) == list(G)
+        assert paths == nx.johnson(G)
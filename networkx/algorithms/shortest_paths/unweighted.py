@@ -140,7 +140,7 @@ def single_target_shortest_path_length(G, target, cutoff=None):
     return _single_shortest_path_length(adj, nextlevel, cutoff)
 
 
-def all_pairs_shortest_path_length(G, cutoff=None):
+def all_pairs_shortest_path_length(G, cutoff=None, n_jobs=None, executor=None):
     """Computes the shortest path lengths between all nodes in `G`.
 
     Parameters
@@ -151,6 +151,15 @@ def all_pairs_shortest_path_length(G, cutoff=None):
         Depth at which to stop the search. Only paths of length at most
         `cutoff` are returned.
 
+    n_jobs : int, optional (default=None)
+        The number of worker processes to split the source nodes across.
+        None or 1 runs every source in the calling process, -1 uses all
+        CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run chunks of source nodes on instead of a new
+        process pool.
+
     Returns
     -------
     lengths : iterator
@@ -161,6 +170,9 @@ def all_pairs_shortest_path_length(G, cutoff=None):
     -----
     The iterator returned only has reachable node pairs.
 
+    When running in parallel the graph is sent to each worker process once,
+    and the results are still yielded in the order of the nodes of `G`.
+
     Examples
     --------
     >>> G = nx.path_graph(5)
@@ -178,12 +190,28 @@ def all_pairs_shortest_path_length(G, cutoff=None):
     0
 
     """
+    if n_jobs is not None or executor is not None:
+        results = nx.utils.parallel_graph_imap(
+            _all_pairs_shortest_path_length_chunk,
+            G,
+            G,
+            args=(cutoff,),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        for chunk in results:
+            yield from chunk
+        return
     length = single_source_shortest_path_length
-    # TODO This can be trivially parallelized.
     for n in G:
         yield (n, length(G, n, cutoff=cutoff))
 
 
+def _all_pairs_shortest_path_length_chunk(G, sources, cutoff):
+    length = single_source_shortest_path_length
+    return [(n, length(G, n, cutoff=cutoff)) for n in sources]
+
+
 def bidirectional_shortest_path(G, source, target):
     """Returns a list of nodes in a shortest path between source and target.
 
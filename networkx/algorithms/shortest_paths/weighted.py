@@ -1003,7 +1003,9 @@ def all_pairs_dijkstra(G, cutoff=None, weight="weight"):
         yield (n, (dist, path))
 
 
-def all_pairs_dijkstra_path_length(G, cutoff=None, weight="weight"):
+def all_pairs_dijkstra_path_length(
+    G, cutoff=None, weight="weight", n_jobs=None, executor=None
+):
     """Compute shortest path lengths between all nodes in a weighted graph.
 
     Parameters
@@ -1025,7 +1027,16 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight="weight"):
         returned by the function. The function must accept exactly three
         positional arguments: the two endpoints of an edge and the
         dictionary of edge attributes for that edge. The function must
-        return a number.
+        return a number. It has to be picklable to run in worker processes.
+
+    n_jobs : int, optional (default=None)
+        The number of worker processes to split the source nodes across.
+        None or 1 runs every source in the calling process, -1 uses all
+        CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run chunks of source nodes on instead of a new
+        process pool.
 
     Returns
     -------
@@ -1055,12 +1066,32 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight="weight"):
     Distances are calculated as sums of weighted edges traversed.
 
     The dictionary returned only has keys for reachable node pairs.
+
+    When running in parallel the graph is sent to each worker process once,
+    and the results are still yielded in the order of the nodes of `G`.
     """
+    if n_jobs is not None or executor is not None:
+        results = nx.utils.parallel_graph_imap(
+            _all_pairs_dijkstra_path_length_chunk,
+            G,
+            G,
+            args=(cutoff, weight),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        for chunk in results:
+            yield from chunk
+        return
     length = single_source_dijkstra_path_length
     for n in G:
         yield (n, length(G, n, cutoff=cutoff, weight=weight))
 
 
+def _all_pairs_dijkstra_path_length_chunk(G, sources, cutoff, weight):
+    length = single_source_dijkstra_path_length
+    return [(n, length(G, n, cutoff=cutoff, weight=weight)) for n in sources]
+
+
 def all_pairs_dijkstra_path(G, cutoff=None, weight="weight"):
     """Compute shortest paths between all nodes in a weighted graph.
 
@@ -2377,7 +2408,7 @@ def bidirectional_dijkstra(G, source, target, weight="weight"):
     raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
 
 
-def johnson(G, weight="weight"):
+def johnson(G, weight="weight", n_jobs=None, executor=None):
     r"""Uses Johnson's Algorithm to compute shortest paths.
 
     Johnson's Algorithm finds a shortest path between each pair of
@@ -2398,7 +2429,16 @@ def johnson(G, weight="weight"):
         returned by the function. The function must accept exactly three
         positional arguments: the two endpoints of an edge and the
         dictionary of edge attributes for that edge. The function must
-        return a number.
+        return a number. It has to be picklable to run in worker processes.
+
+    n_jobs : int, optional (default=None)
+        The number of worker processes to split the Dijkstra searches across.
+        None or 1 runs every source in the calling process, -1 uses all
+        CPUs. See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run chunks of source nodes on instead of a new
+        process pool.
 
     Returns
     -------
@@ -2432,6 +2472,9 @@ def johnson(G, weight="weight"):
     graph. For dense graphs, this may be faster than the Floyd–Warshall
     algorithm.
 
+    The Bellman–Ford pass always runs in the calling process. Only the
+    Dijkstra searches from each source are split across worker processes.
+
     See Also
     --------
     floyd_warshall_predecessor_and_distance
@@ -2449,10 +2492,31 @@ def johnson(G, weight="weight"):
 
     dist = {v: 0 for v in G}
     pred = {v: [] for v in G}
-    weight = _weight_function(G, weight)
 
     # Calculate distance of shortest paths
-    dist_bellman = _bellman_ford(G, list(G), weight, pred=pred, dist=dist)
+    dist_bellman = _bellman_ford(
+        G, list(G), _weight_function(G, weight), pred=pred, dist=dist
+    )
+
+    if n_jobs is not None or executor is not None:
+        results = nx.utils.parallel_graph_imap(
+            _johnson_paths,
+            G,
+            G,
+            args=(weight, dist_bellman),
+            n_jobs=n_jobs,
+            executor=executor,
+        )
+        return {v: paths for chunk in results for v, paths in chunk}
+    return dict(_johnson_paths(G, G, weight, dist_bellman))
+
+
+def _johnson_paths(G, sources, weight, dist_bellman):
+    """Returns a list of `(source, paths)` pairs with the shortest paths from
+    each of `sources` reweighted by the Bellman–Ford distances.
+
+    """
+    weight = _weight_function(G, weight)
 
     # Update the weight function to take into account the Bellman--Ford
     # relaxation distances.
@@ -2464,4 +2528,4 @@ def johnson(G, weight="weight"):
         _dijkstra(G, v, new_weight, paths=paths)
         return paths
 
-    return {v: dist_path(v) for v in G}
+    return [(v, dist_path(v)) for v in sources]
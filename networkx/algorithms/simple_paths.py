@@ -3,7 +3,8 @@ from itertools import count
 
 import networkx as nx
 from networkx.algorithms.shortest_paths.weighted import _weight_function
-from networkx.utils import not_implemented_for, pairwise
+from networkx.utils import effective_n_jobs, not_implemented_for, pairwise
+from networkx.utils.parallel import _GraphProcessPool, parallel_graph_imap
 
 __all__ = [
     "all_simple_paths",
@@ -421,7 +422,9 @@ def _all_simple_edge_paths_multigraph(G, source, targets, cutoff):
 
 
 @not_implemented_for("multigraph")
-def shortest_simple_paths(G, source, target, weight=None):
+def shortest_simple_paths(
+    G, source, target, weight=None, method="auto", n_jobs=None, executor=None
+):
     """Generate all simple paths in the graph G from source to target,
        starting from shortest ones.
 
@@ -452,6 +455,24 @@ def shortest_simple_paths(G, source, target, weight=None):
         If None all edges are considered to have unit weight. Default
         value None.
 
+    method : string, optional (default="auto")
+        How to compute the spur paths (see Notes). "bidirectional" runs a
+        bidirectional search for each spur path, "tree" uses the shortest
+        path tree of the target, and "auto" uses "tree" if `n_jobs` or
+        `executor` is given or if `G` has at least 10_000 edges. The two
+        methods may order paths of equal length differently.
+
+    n_jobs : int, optional (default=None)
+        The number of worker processes to compute the spur paths of each
+        path on, with the "tree" method. None computes them in the calling
+        process, -1 uses all CPUs.
+        See :func:`~networkx.utils.parallel.effective_n_jobs`.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to compute the spur paths on instead of a new process
+        pool, with the "tree" method. A function `weight` must be picklable,
+        e.g. defined at module level, for an executor of worker processes.
+
     Returns
     -------
     path_generator: generator
@@ -469,6 +490,9 @@ def shortest_simple_paths(G, source, target, weight=None):
     NetworkXNotImplemented
        If the input graph is a Multi[Di]Graph.
 
+    ValueError
+       If `method` is not supported.
+
     Examples
     --------
 
@@ -495,6 +519,19 @@ def shortest_simple_paths(G, source, target, weight=None):
     This procedure is based on algorithm by Jin Y. Yen [1]_.  Finding
     the first $K$ paths requires $O(KN^3)$ operations.
 
+    Each new path is found among the spur paths of the paths found before:
+    the shortest paths that share the first $i$ nodes of a path found
+    before (the root) and then leave all the paths found before with the
+    same root. The "tree" method computes the shortest path tree towards
+    the target once. A spur path is the path in the tree when the tree path
+    avoids the nodes of the root and the edges that leave the root,
+    otherwise an A* search that uses the distances in the tree as its
+    heuristic finds it. It only computes the spur paths of a path for the
+    roots that extend the root it was found from (Lawler's improvement
+    [2]_), keeps the paths found before in a prefix tree, and can compute
+    the spur paths of each path in parallel. A new process pool is started
+    once per generator and shut down when the generator is closed.
+
     See Also
     --------
     all_shortest_paths
@@ -506,6 +543,10 @@ def shortest_simple_paths(G, source, target, weight=None):
     .. [1] Jin Y. Yen, "Finding the K Shortest Loopless Paths in a
        Network", Management Science, Vol. 17, No. 11, Theory Series
        (Jul., 1971), pp. 712-716.
+    .. [2] E. L. Lawler, "A Procedure for Computing the K Best Solutions to
+       Discrete Optimization Problems and Its Application to the Shortest
+       Path Problem", Management Science, Vol. 18, No. 7 (Mar., 1972),
+       pp. 401-405.
 
     """
     if source not in G:
@@ -514,6 +555,21 @@ def shortest_simple_paths(G, source, target, weight=None):
     if target not in G:
         raise nx.NodeNotFound(f"target node {target} not in graph")
 
+    if method == "auto":
+        if n_jobs is not None or executor is not None or G.number_of_edges() >= 10_000:
+            method = "tree"
+        else:
+            method = "bidirectional"
+    if method == "tree":
+        return _tree_shortest_simple_paths(G, source, target, weight, n_jobs, executor)
+    if method != "bidirectional":
+        raise ValueError(f"Unknown method {method!r}")
+    return _bidirectional_shortest_simple_paths(G, source, target, weight)
+
+
+def _bidirectional_shortest_simple_paths(G, source, target, weight):
+    """Yen's algorithm with a bidirectional search for each spur path."""
+
     if weight is None:
         length_func = len
         shortest_path_func = _bidirectional_shortest_path
@@ -567,6 +623,174 @@ def shortest_simple_paths(G, source, target, weight=None):
             break
 
 
+def _tree_shortest_simple_paths(G, source, target, weight, n_jobs, executor):
+    """Yen's algorithm with Lawler's improvement, and spur paths from the
+    shortest path tree towards the target."""
+    wt = _tree_weight_function(weight)
+    tree = _target_tree(G, target, wt)
+    if source not in tree[0]:
+        raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+    G_succ = G._succ if G.is_directed() else G._adj
+    # the weight itself, and not its function, is sent to worker processes
+    state = (G_succ, weight, target, tree)
+
+    pool = None
+    if executor is None and n_jobs is not None and effective_n_jobs(n_jobs) > 1:
+        pool = _GraphProcessPool(state, effective_n_jobs(n_jobs))
+    try:
+        # the paths found so far as a prefix tree, and the candidate paths,
+        # with the index of the node where they leave the path they were
+        # found from
+        found = {}
+        candidates = []
+        seen = set()
+        c = count()
+        path = _spur_path(state, wt, [source], ())[1]
+        deviation = 0
+        while True:
+            yield path
+            node = found
+            for u in path:
+                node = node.setdefault(u, {})
+            lengths = [0]
+            for u, v in pairwise(path):
+                lengths.append(lengths[-1] + wt(u, v, G_succ[u][v]))
+            items = []
+            node = found
+            for i, u in enumerate(path[:-1]):
+                node = node[u]
+                if i >= deviation:
+                    # the spur paths from u avoid the nodes before u and the
+                    # edges from u of the paths found with the same root
+                    items.append((i, path[: i + 1], tuple(node)))
+            if n_jobs is None and executor is None:
+                spurs = _spur_paths(state, items)
+            else:
+                spurs = (
+                    spur
+                    for chunk in parallel_graph_imap(
+                        _spur_paths,
+                        state,
+                        items,
+                        n_jobs=n_jobs,
+                        executor=pool if pool is not None else executor,
+                    )
+                    for spur in chunk
+                )
+            for i, length, spur in spurs:
+                if spur is not None:
+                    new_path = path[:i] + spur
+                    key = tuple(new_path)
+                    if key not in seen:
+                        seen.add(key)
+                        heappush(
+                            candidates, (lengths[i] + length, next(c), new_path, i)
+                        )
+            if not candidates:
+                return
+            _, _, path, deviation = heappop(candidates)
+            seen.remove(tuple(path))
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _tree_weight_function(weight):
+    """Returns the function of the edge weights of the "tree" method, for
+    the `weight` of :func:`shortest_simple_paths` on a graph that is not a
+    multigraph."""
+    if weight is None:
+        return lambda u, v, d: 1
+    if callable(weight):
+        return weight
+    return lambda u, v, d: d.get(weight, 1)
+
+
+def _target_tree(G, target, wt):
+    """Returns the distances to target and the next node on a shortest path
+    to target of the nodes that reach target."""
+    G_pred = G._pred if G.is_directed() else G._adj
+    dist = {}
+    nxt = {target: None}
+    tentative = {target: 0}
+    fringe = [(0, 0, target)]
+    c = count(1)
+    while fringe:
+        d, _, v = heappop(fringe)
+        if v in dist:
+            continue
+        dist[v] = d
+        for u, e in G_pred[v].items():
+            if u in dist:
+                continue
+            cost = wt(u, v, e)
+            if cost is None:
+                continue
+            du = d + cost
+            if u not in tentative or du < tentative[u]:
+                tentative[u] = du
+                nxt[u] = v
+                heappush(fringe, (du, next(c), u))
+    return dist, nxt
+
+
+def _spur_paths(state, items):
+    """Returns the index, the length and the spur path (or None) of each
+    (index, root, banned) item, see :func:`_spur_path`."""
+    wt = _tree_weight_function(state[1])
+    return [(i, *_spur_path(state, wt, root, banned)) for i, root, banned in items]
+
+
+def _spur_path(state, wt, root, banned):
+    """Returns the length and the nodes of a shortest path from the last node
+    of root to the target that avoids the other nodes of root and the edges
+    to the nodes in banned from the last node of root, or (None, None)."""
+    G_succ, _, target, (dist, nxt) = state
+    spur = root[-1]
+    ignore = set(root[:-1])
+    # the path in the shortest path tree, if it avoids root and banned
+    v = nxt.get(spur)
+    if v is not None and v not in banned:
+        path = [spur]
+        while v not in ignore:
+            path.append(v)
+            if v == target:
+                return dist[spur], path
+            v = nxt[v]
+    # A* search with the distances to the target as the heuristic, which is
+    # consistent as the tree does not avoid any nodes or edges
+    pred = {spur: None}
+    tentative = {spur: 0}
+    closed = set()
+    fringe = [(dist.get(spur, 0), 0, 0, spur)]
+    c = count(1)
+    while fringe:
+        _, _, d, u = heappop(fringe)
+        if u in closed:
+            continue
+        if u == target:
+            path = []
+            while u is not None:
+                path.append(u)
+                u = pred[u]
+            return d, path[::-1]
+        closed.add(u)
+        for v, e in G_succ[u].items():
+            if v in closed or v in ignore or v not in dist:
+                continue
+            if u == spur and v in banned:
+                continue
+            cost = wt(u, v, e)
+            if cost is None:
+                continue
+            dv = d + cost
+            if v not in tentative or dv < tentative[v]:
+                tentative[v] = dv
+                pred[v] = u
+                heappush(fringe, (dv + dist[v], next(c), dv, v))
+    return None, None
+
+
 class PathBuffer:
     def __init__(self):
         self.paths = set()
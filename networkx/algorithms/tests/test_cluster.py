@@ -541,3 +541,64 @@ class TestGeneralizedDegree:
             3: {2: 2, 3: 2},
             4: {2: 2, 3: 2},
         }
+
+
+class TestVectorized:
+    @classmethod
+    def setup_class(cls):
+        pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+
+    @pytest.mark.parametrize("directed", (False, True))
+    @pytest.mark.parametrize("weight", (None, "weight"))
+    def test_clustering(self, directed, weight):
+        for seed in range(3):
+            G = nx.gnp_random_graph(50, 0.2, seed=seed, directed=directed)
+            G.add_edge(0, 0)
+            G.add_node(50)
+            for i, (u, v, d) in enumerate(G.edges(data=True)):
+                d["weight"] = [0, 1, 2.5, -1, 3][i % 5]
+            expected = nx.clustering(G, weight=weight, method="sequential")
+            result = nx.clustering(G, weight=weight, method="vectorized")
+            assert result == pytest.approx(expected)
+            result = nx.clustering(G, [1, 2, 50], weight=weight, method="vectorized")
+            assert result == pytest.approx({n: expected[n] for n in [1, 2, 50]})
+            result = nx.average_clustering(G, weight=weight, method="vectorized")
+            assert result == pytest.approx(sum(expected.values()) / len(G))
+
+    def test_triangles_and_transitivity(self):
+        G = nx.barabasi_albert_graph(200, 4, seed=42)
+        G.add_edge(0, 0)
+        expected = nx.triangles(G, method="sequential")
+        assert nx.triangles(G, method="vectorized") == expected
+        assert nx.triangles(G, [0, 1], method="vectorized") == {
+            0: expected[0],
+            1: expected[1],
+        }
+        assert nx.transitivity(G, method="vectorized") == pytest.approx(
+            nx.transitivity(G, method="sequential")
+        )
+        for G in (nx.Graph(), nx.empty_graph(3), nx.complete_graph(5)):
+            assert nx.triangles(G, method="vectorized") == nx.triangles(G)
+            assert nx.clustering(G, method="vectorized") == nx.clustering(G)
+            assert nx.transitivity(G, method="vectorized") == nx.transitivity(G)
+
+    @pytest.mark.parametrize("method", ("sequential", "vectorized"))
+    def test_n_jobs(self, method):
+        from concurrent.futures import ThreadPoolExecutor
+
+        G = nx.gnp_random_graph(60, 0.2, seed=1)
+        expected = nx.triangles(G)
+        assert nx.triangles(G, method=method, n_jobs=1) == expected
+        with ThreadPoolExecutor(2) as executor:
+            assert nx.triangles(G, method=method, executor=executor) == expected
+            assert nx.clustering(G, method=method, executor=executor) == pytest.approx(
+                nx.clustering(G)
+            )
+
+    def test_errors(self):
+        G = nx.complete_graph(3)
+        with pytest.raises(ValueError):
+            nx.triangles(G, method="foo")
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.clustering(nx.MultiGraph(G), method="vectorized")
@@ -1,3 +1,4 @@
+import random
 from collections import deque
 from itertools import combinations, permutations
 
@@ -708,3 +709,108 @@ def test_ancestors_descendants_undirected():
     undirected graphs."""
     G = nx.path_graph(5)
     nx.ancestors(G, 2) == nx.descendants(G, 2) == {0, 1, 3, 4}
+
+
+class TestReachabilityIndex:
+    @pytest.mark.parametrize("hubs", (0, 3, 64))
+    def test_random_dags(self, hubs):
+        for seed in range(5):
+            G = nx.gnp_random_graph(40, 0.08, seed=seed, directed=True)
+            G = nx.DiGraph((u, v) for u, v in G.edges() if u < v)
+            G.add_nodes_from(range(40))
+            index = nx.ReachabilityIndex(G, hubs=hubs, seed=seed)
+            for u in G:
+                descendants = nx.descendants(G, u)
+                assert index.descendants(u) == descendants
+                assert index.ancestors(u) == nx.ancestors(G, u)
+                for v in G:
+                    assert index.reachable(u, v) == (v in descendants or u == v)
+
+    def test_intervals(self):
+        G = nx.balanced_tree(2, 5, create_using=nx.DiGraph)
+        G.add_edges_from([(60, 3), (5, 40)])
+        for intervals in (0, 1, 4):
+            index = nx.ReachabilityIndex(G, intervals=intervals, hubs=0, seed=1)
+            for u, v in permutations(G, 2):
+                assert index.reachable(u, v) == nx.has_path(G, u, v)
+
+    def test_errors(self):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.ReachabilityIndex(nx.path_graph(3))
+        with pytest.raises(nx.NetworkXUnfeasible):
+            nx.ReachabilityIndex(nx.cycle_graph(3, create_using=nx.DiGraph))
+        index = nx.ReachabilityIndex(nx.DiGraph([(0, 1)]))
+        with pytest.raises(nx.NetworkXError):
+            index.reachable(0, 2)
+        with pytest.raises(nx.NetworkXError):
+            index.descendants(2)
+        with pytest.raises(nx.NetworkXError):
+            index.ancestors([])
+        assert index.reachable(0, 0)
+
+
+class TestDynamicTopologicalOrder:
+    @staticmethod
+    def check(order):
+        G = order.graph
+        nodes = list(order)
+        assert len(order) == len(nodes) == len(G)
+        position = {u: i for i, u in enumerate(nodes)}
+        assert all(position[u] < position[v] for u, v in G.edges())
+        generations = list(order.topological_generations())
+        assert [set(g) for g in generations] == [
+            set(g) for g in nx.topological_generations(G)
+        ]
+        for i, generation in enumerate(generations):
+            assert generation == sorted(generation, key=position.get)
+            assert all(order.generation(u) == i for u in generation)
+
+    def test_random_insertions_and_removals(self):
+        rng = random.Random(42)
+        order = nx.DynamicTopologicalOrder()
+        for _ in range(600):
+            u, v = rng.randrange(30), rng.randrange(30)
+            G = order.graph.copy()
+            G.add_edge(u, v)
+            if nx.is_directed_acyclic_graph(G):
+                order.add_edge(u, v)
+                assert order.precedes(u, v)
+            else:
+                with pytest.raises(nx.NetworkXUnfeasible):
+                    order.add_edge(u, v)
+                assert set(order.graph.edges()) <= set(G.edges())
+            if rng.random() < 0.2:
+                u, v = rng.choice(list(order.graph.edges()))
+                order.remove_edge(u, v)
+            if rng.random() < 0.05:
+                order.remove_node(rng.choice(list(order)))
+            self.check(order)
+
+    def test_initial_graph(self):
+        G = nx.gn_graph(50, seed=1)
+        order = nx.DynamicTopologicalOrder(G)
+        self.check(order)
+        order.add_edges_from([(0, 50), (51, 49), (40, 30)])
+        self.check(order)
+        G.add_edge(0, 20)
+        assert not order.graph.has_edge(0, 20)
+        with pytest.raises(nx.NetworkXUnfeasible):
+            order.add_edge(0, 20)
+        self.check(order)
+
+    def test_errors(self):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.DynamicTopologicalOrder(nx.path_graph(3))
+        with pytest.raises(nx.NetworkXUnfeasible):
+            nx.DynamicTopologicalOrder(nx.cycle_graph(3, create_using=nx.DiGraph))
+        order = nx.DynamicTopologicalOrder()
+        with pytest.raises(nx.NetworkXUnfeasible):
+            order.add_edge(1, 1)
+        assert len(order) == 0
+        order.add_node(1)
+        with pytest.raises(nx.NetworkXError):
+            order.remove_edge(1, 2)
+        with pytest.raises(nx.NetworkXError):
+            order.remove_node(2)
+        assert list(order) == [1]
+        assert list(order.topological_generations()) == [[1]]
@@ -606,6 +606,104 @@ def test_ssp_source_missing2():
         list(nx.shortest_simple_paths(G, 0, 3))
 
 
+def _path_cost(G, path, weight):
+    if weight is None:
+        return len(path) - 1
+    return sum(G.edges[u, v][weight] for u, v in pairwise(path))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_ssp_tree_method(directed, weight):
+    from itertools import islice
+
+    for seed in range(10):
+        G = nx.gnp_random_graph(12, 0.3, seed=seed, directed=directed)
+        rng = random.Random(seed)
+        for u, v in G.edges():
+            G[u][v]["weight"] = rng.randint(1, 5)
+        if not nx.has_path(G, 0, 11):
+            continue
+        expected = list(
+            islice(nx.shortest_simple_paths(G, 0, 11, weight, "bidirectional"), 50)
+        )
+        paths = list(islice(nx.shortest_simple_paths(G, 0, 11, weight, "tree"), 50))
+        costs = [_path_cost(G, p, weight) for p in paths]
+        assert costs == [_path_cost(G, p, weight) for p in expected]
+        assert costs == sorted(costs)
+        assert len(set(map(tuple, paths))) == len(paths)
+        assert all(nx.is_simple_path(G, p) for p in paths)
+        assert all(p[0] == 0 and p[-1] == 11 for p in paths)
+
+
+def test_ssp_tree_method_all_paths():
+    G = nx.complete_graph(5)
+    paths = list(nx.shortest_simple_paths(G, 0, 4, method="tree"))
+    assert len(paths) == len(list(nx.all_simple_paths(G, 0, 4)))
+    assert paths[0] == [0, 4]
+
+
+def test_ssp_tree_method_weight_function():
+    G = nx.cycle_graph(6)
+    nx.add_path(G, [0, 6, 3])
+
+    def weight(u, v, d):
+        return None if {u, v} == {0, 6} else 1
+
+    paths = list(nx.shortest_simple_paths(G, 0, 3, weight, "tree"))
+    assert sorted(paths) == [[0, 1, 2, 3], [0, 5, 4, 3]]
+
+
+def test_ssp_tree_method_no_path():
+    G = nx.Graph()
+    nx.add_path(G, [0, 1, 2])
+    nx.add_path(G, [3, 4, 5])
+    with pytest.raises(nx.NetworkXNoPath):
+        list(nx.shortest_simple_paths(G, 0, 3, method="tree"))
+    with pytest.raises(nx.NodeNotFound):
+        list(nx.shortest_simple_paths(G, 0, 6, method="tree"))
+
+
+def test_ssp_parallel():
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice
+
+    G = nx.grid_2d_graph(5, 5)
+    rng = random.Random(1)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 9)
+    s, t = (0, 0), (4, 4)
+    expected = list(islice(nx.shortest_simple_paths(G, s, t, "weight", "tree"), 30))
+    with ThreadPoolExecutor(2) as executor:
+        paths = nx.shortest_simple_paths(G, s, t, "weight", executor=executor)
+        assert list(islice(paths, 30)) == expected
+    paths = nx.shortest_simple_paths(G, s, t, "weight", n_jobs=2)
+    assert list(islice(paths, 30)) == expected
+    paths.close()
+
+
+@pytest.mark.parametrize("weight", [None, "weight"])
+def test_ssp_process_pool(weight):
+    from concurrent.futures import ProcessPoolExecutor
+    from itertools import islice
+
+    G = nx.grid_2d_graph(4, 4)
+    rng = random.Random(2)
+    for u, v in G.edges():
+        G[u][v]["weight"] = rng.randint(1, 9)
+    s, t = (0, 0), (3, 3)
+    expected = list(islice(nx.shortest_simple_paths(G, s, t, weight, "tree"), 10))
+    with ProcessPoolExecutor(2) as executor:
+        paths = nx.shortest_simple_paths(G, s, t, weight, executor=executor)
+        assert list(islice(paths, 10)) == expected
+
+
+def test_ssp_unknown_method():
+    G = nx.path_graph(3)
+    with pytest.raises(ValueError, match="Unknown method"):
+        list(nx.shortest_simple_paths(G, 0, 2, method="yen"))
+
+
 def test_bidirectional_shortest_path_restricted_cycle():
     cycle = nx.cycle_graph(7)
     length, path = _bidirectional_shortest_path(cycle, 0, 3)
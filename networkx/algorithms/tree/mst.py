@@ -182,9 +182,9 @@ def kruskal_mst_edges(
     """
     subtrees = UnionFind()
     if G.is_multigraph():
-        edges = G.edges(keys=True, data=True)
+        edges = G.edges(keys=True, data=True, wrap=False)
     else:
-        edges = G.edges(data=True)
+        edges = G.edges(data=True, wrap=False)
 
     """
     Sort the edges of the graph with respect to the partition data. 
@@ -886,7 +886,7 @@ def random_spanning_tree(G, weight=None, *, multiplicative=True, seed=None):
             #    by calling total_spanning_tree_weight with weight=None
             else:
                 total = 0
-                for u, v, w in G.edges(data=weight):
+                for u, v, w in G.edges(data=weight, wrap=False):
                     total += w * nx.total_spanning_tree_weight(
                         nx.contracted_edge(G, edge=(u, v), self_loops=False), None
                     )
@@ -1097,7 +1097,7 @@ class SpanningTreeIterator:
             A Partition dataclass describing a partition on the edges of the
             graph.
         """
-        for u, v, d in self.G.edges(data=True):
+        for u, v, d in self.G.edges(data=True, wrap=False):
             if (u, v) in partition.partition_dict:
                 d[self.partition_key] = partition.partition_dict[(u, v)]
             else:
@@ -1107,6 +1107,6 @@ class SpanningTreeIterator:
         """
         Removes partition data from the graph
         """
-        for u, v, d in G.edges(data=True):
+        for u, v, d in G.edges(data=True, wrap=False):
             if self.partition_key in d:
                 del d[self.partition_key]
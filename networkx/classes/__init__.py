@@ -3,6 +3,7 @@ from .graph import Graph
 from .digraph import DiGraph
 from .multigraph import MultiGraph
 from .multidigraph import MultiDiGraph
+from .csrgraph import CSRGraph, CSRDiGraph
 from .ordered import *
 
 from .function import *
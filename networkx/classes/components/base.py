@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import (
     Any,
     Final,
@@ -11,11 +12,25 @@ from typing import (
     TypeVar,
     Set,
     ClassVar,
+    Tuple,
 )
 
 GRAPHERY_TYPE_FLAG_NAME: Final[str] = "_graphery_type_flag"
 GRAPHERY_WRAP_REF_NAME: Final[str] = "__ref"
+# the mangled name under which ContentWrapper.__init__ stores the content
+GRAPHERY_WRAP_REF_ATTR: Final[str] = f"_ContentWrapper{GRAPHERY_WRAP_REF_NAME}"
 GRAPHERY_TYPES: Final[Dict[str, Type[ContentWrapper]]] = {}
+# hashable built-in types whose instances cannot hold attributes; wrapping
+# them always takes the generated-subclass path, so it is precomputed per type
+GRAPHERY_FAST_WRAP_TYPES: Final[Tuple[Type, ...]] = (
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    tuple,
+    frozenset,
+)
 
 
 def collect_graphery_type(cls: Type[ContentWrapper]) -> Type[ContentWrapper]:
@@ -35,6 +50,7 @@ class _RefWrapper(Protocol[_T]):
 class ContentWrapper(_RefWrapper[_T]):
     _graphery_type_flag: str = "WrapperBase"
     _wrapped_types: Dict = {}
+    _fast_wrappers: Dict = {}
     _wrapped_type_prefix: str = "CW"
 
     def __init__(self, ref: _T) -> None:
@@ -46,9 +62,9 @@ class ContentWrapper(_RefWrapper[_T]):
     def graphery_type_flag(cls) -> str:
         return cls._graphery_type_flag
 
-    @property
-    def ref(self) -> _T:
-        return self.__ref
+    # C-level getter: `ref` is read on every hash and comparison of wrappers
+    # whose content type has no __hash__ or __eq__ of its own
+    ref = property(attrgetter(GRAPHERY_WRAP_REF_ATTR))
 
     @classmethod
     def _generate_class_name(cls, original_type: Type) -> str:
@@ -80,55 +96,143 @@ class ContentWrapper(_RefWrapper[_T]):
 
     @classmethod
     def _get_wrapped_hash(cls, **_) -> Callable:
+        get_ref = attrgetter(GRAPHERY_WRAP_REF_ATTR)
+
         def _wrapped_hash(wrapped_self: _RefWrapper) -> int:
-            return hash(cls.__getattribute__(wrapped_self, "ref"))
+            return hash(get_ref(wrapped_self))
 
         return _wrapped_hash
 
     @classmethod
     def _get_wrapped_eq(cls, **_) -> Callable:
+        get_ref = attrgetter(GRAPHERY_WRAP_REF_ATTR)
+
         def _wrapped_eq(wrapped_self: _RefWrapper, other) -> bool:
-            return cls.__getattribute__(wrapped_self, "ref") == other
+            return get_ref(wrapped_self) == other
 
         return _wrapped_eq
 
     @classmethod
-    def _get_wrapped_getattribute(cls, *, attrs: Set[str], **_) -> Callable:
-        def _wrapped_getattribute(wrapped_self: _RefWrapper, item: str) -> Any:
-            if item in attrs:
-                try:
-                    return getattr(
-                        cls.__getattribute__(wrapped_self, "ref"),
-                        # super().__getattribute__("__ref"),
-                        item,
-                    )
-                except AttributeError:
-                    return super().__getattribute__(item)
-            else:
-                return super().__getattribute__(item)
-
-        return _wrapped_getattribute
+    def _get_wrapped_reduce(cls, **_) -> Callable:
+        # generated types only exist in a process once their first content
+        # is wrapped, so pickles wrap the content again with `cls.wraps`
+        get_ref = attrgetter(GRAPHERY_WRAP_REF_ATTR)
+
+        def _wrapped_reduce(wrapped_self: _RefWrapper) -> Tuple:
+            return cls.wraps, (get_ref(wrapped_self),)
+
+        return _wrapped_reduce
+
+    @classmethod
+    def _get_wrapped_attribute(cls, *, name: str, **_) -> property:
+        # routes one attribute of the original type to the wrapped content;
+        # reads are a single C-level attrgetter call
+        get_ref = attrgetter(GRAPHERY_WRAP_REF_ATTR)
+
+        def _wrapped_set(wrapped_self: _RefWrapper, value) -> None:
+            setattr(get_ref(wrapped_self), name, value)
+
+        return property(attrgetter(f"{GRAPHERY_WRAP_REF_ATTR}.{name}"), _wrapped_set)
+
+    @staticmethod
+    def _get_wrapped_attribute_names(content: Any) -> Set[str]:
+        # the attributes routed to the content: the slots declared along the
+        # MRO of its type and the instance attributes of the first content
+        # wrapped, computed once per type
+        names = set(getattr(content, "__dict__", ()))
+        for klass in type(content).__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            names.update((slots,) if isinstance(slots, str) else slots)
+        # the wrapper keeps its own instance dict and weak references
+        names.difference_update(("__dict__", "__weakref__"))
+        return names
+
+    @classmethod
+    def _get_fast_wrapper(cls, *, wrapped_type: Type, original_type: Type) -> Callable:
+        # builds the wrapper in C-level calls only, equivalent to
+        # `wrapped_type(content)` without the generated __new__/__init__
+        flag = cls._graphery_type_flag
+        new = original_type.__new__
+        set_attr = object.__setattr__
+
+        if new is object.__new__:
+
+            def _fast_wrapper(content):
+                obj = new(wrapped_type)
+                set_attr(
+                    obj,
+                    "__dict__",
+                    {GRAPHERY_TYPE_FLAG_NAME: flag, GRAPHERY_WRAP_REF_ATTR: content},
+                )
+                return obj
+
+        else:
+
+            def _fast_wrapper(content):
+                obj = new(wrapped_type, content)
+                set_attr(
+                    obj,
+                    "__dict__",
+                    {GRAPHERY_TYPE_FLAG_NAME: flag, GRAPHERY_WRAP_REF_ATTR: content},
+                )
+                return obj
+
+        return _fast_wrapper
+
+    @classmethod
+    def _has_fast_wrapper(cls, original_type: Type) -> bool:
+        # whether every instance of `original_type` needs the generated
+        # wrapper type, and can be wrapped without calling its constructor
+        if original_type in GRAPHERY_FAST_WRAP_TYPES:
+            return True
+        return (
+            original_type.__new__ is object.__new__
+            and original_type.__setattr__ is object.__setattr__
+        )
 
     @classmethod
-    def _get_wrapped_setattr(cls, *, attrs: Set[str], **_) -> Callable:
-        def _wrapped_setattr(wrapped_self: _RefWrapper, name: str, value) -> Any:
-            if name in attrs:
-                try:
-                    setattr(
-                        cls.__getattribute__(wrapped_self, "ref"),
-                        # super().__getattribute__("__ref"),
-                        name,
-                        value,
-                    )
-                except AttributeError:
-                    return super().__setattr__(name, value)
-            else:
-                return super().__setattr__(name, value)
-
-        return _wrapped_setattr
+    def _generate_wrapped_type(cls, content: Any) -> Type[ContentWrapper]:
+        original_type = content.__class__
+        class_name = cls._generate_class_name(original_type)
+
+        attr_dict = {
+            "__new__": cls._get_wrapped_new(
+                original=content, original_type=original_type
+            ),
+            "__init__": cls._get_wrapped_init(),
+            "__reduce__": cls._get_wrapped_reduce(),
+        }
+        for name in cls._get_wrapped_attribute_names(content):
+            attr_dict[name] = cls._get_wrapped_attribute(name=name)
+        if original_type.__eq__ is object.__eq__:
+            attr_dict["__eq__"] = cls._get_wrapped_eq()
+        if original_type.__hash__ is object.__hash__:
+            attr_dict["__hash__"] = cls._get_wrapped_hash()
+
+        new_wrapped_type = type(
+            class_name,
+            (cls, original_type),
+            attr_dict,
+        )
+        cls._wrapped_types[original_type] = new_wrapped_type
+
+        from sys import modules
+
+        new_wrapped_type.__module__ = cls.__module__
+        setattr(modules[cls.__module__], class_name, new_wrapped_type)
+
+        if cls._has_fast_wrapper(original_type):
+            cls._fast_wrappers[original_type] = cls._get_fast_wrapper(
+                wrapped_type=new_wrapped_type, original_type=original_type
+            )
+        return new_wrapped_type
 
     @classmethod
     def wraps(cls, content: _T) -> ContentWrapper:
+        fast_wrapper = cls._fast_wrappers.get(content.__class__, None)
+        if fast_wrapper is not None:
+            return fast_wrapper(content)
+
         if content is None:
             raise TypeError(f"{cls.__name__} cannot wrap None")
 
@@ -138,44 +242,9 @@ class ContentWrapper(_RefWrapper[_T]):
         try:
             setattr(content, GRAPHERY_TYPE_FLAG_NAME, cls._graphery_type_flag)
         except AttributeError:
-            original_type = content.__class__
-            new_wrapped_type = cls._wrapped_types.get(original_type, None)
-            attr_set = {
-                *getattr(content, "__dict__", ()),
-                *getattr(content, "__slots__", ()),
-            }
-
+            new_wrapped_type = cls._wrapped_types.get(content.__class__, None)
             if new_wrapped_type is None:
-                class_name = cls._generate_class_name(original_type)
-
-                attr_dict = {
-                    "__new__": cls._get_wrapped_new(
-                        original=content, original_type=original_type
-                    ),
-                    "__init__": cls._get_wrapped_init(),
-                    "__getattribute__": cls._get_wrapped_getattribute(
-                        attrs=attr_set,
-                    ),
-                    "__setattr__": cls._get_wrapped_setattr(
-                        attrs=attr_set,
-                    ),
-                }
-                if original_type.__eq__ is object.__eq__:
-                    attr_dict["__eq__"] = cls._get_wrapped_eq()
-                if original_type.__hash__ is object.__hash__:
-                    attr_dict["__hash__"] = cls._get_wrapped_hash()
-
-                new_wrapped_type = type(
-                    class_name,
-                    (cls, original_type),
-                    attr_dict,
-                )
-                cls._wrapped_types[original_type] = new_wrapped_type
-
-                from sys import modules
-
-                new_wrapped_type.__module__ = cls.__module__
-                setattr(modules[cls.__module__], class_name, new_wrapped_type)
+                new_wrapped_type = cls._generate_wrapped_type(content)
             content = new_wrapped_type(content)
 
         return content
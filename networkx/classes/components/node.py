@@ -9,6 +9,7 @@ from .base import ContentWrapper, collect_graphery_type, GRAPHERY_TYPE_FLAG_NAME
 class Node(ContentWrapper):
     _graphery_type_flag = "Node"
     _wrapped_types = {}
+    _fast_wrappers = {}
     _wrapped_type_prefix = "N"
 
     @classmethod
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ..base import ContentWrapper, GRAPHERY_TYPE_FLAG_NAME
 from ..node import Node
 from .test_base import WrapperTestBase, B, A, C
 import pytest
@@ -39,3 +40,97 @@ class TestNode(WrapperTestBase):
         super(TestNode, self).test_user_defined_immutable_class(
             defined_cls, init_value, mod_fn, mod_val
         )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            pytest.param(1),
+            pytest.param(1.5),
+            pytest.param(1j),
+            pytest.param("str"),
+            pytest.param(b"bytes"),
+            pytest.param((1, "a")),
+            pytest.param(frozenset({1, 2})),
+        ],
+    )
+    def test_built_in_fast_wrapper(self, content):
+        # the first call builds the wrapped type and registers the fast wrapper
+        first = Node.wraps(content)
+        assert content.__class__ in Node._fast_wrappers
+
+        wrapped = Node.wraps(content)
+        assert wrapped is not first
+        assert type(wrapped) is type(first)
+        self._equal_test(wrapped, content)
+        self._repr_equal_test(wrapped, content)
+        self._hash_test(wrapped, content)
+        self._type_equal_test(wrapped, content)
+        self._test_wrap_ref_equal_test(wrapped, content)
+        self._test_pickle(wrapped)
+        expected = {GRAPHERY_TYPE_FLAG_NAME: "Node", "_ContentWrapper__ref": content}
+        assert wrapped.__dict__ == first.__dict__ == expected
+        assert Node.wraps(wrapped) is wrapped
+
+    def test_fast_wrapper_not_shared(self):
+        assert Node._fast_wrappers is not ContentWrapper._fast_wrappers
+        assert Node.is_node(Node.wraps(1))
+        assert Node.is_node(Node.wraps(1))
+        assert not Node.is_node(ContentWrapper.wraps(1))
+        assert not Node.is_node(ContentWrapper.wraps(1))
+
+    def test_attribute_routing_per_type(self):
+        # attributes are routed once per type, types without attributes of
+        # their own keep the C-level attribute access of the original type
+        wrapped = Node.wraps(3)
+        assert "__getattribute__" not in type(wrapped).__dict__
+        assert "__setattr__" not in type(wrapped).__dict__
+        assert wrapped.ref == 3 and wrapped.real == 3
+
+        content = B(10)
+        wrapped = Node.wraps(content)
+        assert isinstance(type(wrapped).__dict__["a"], property)
+        assert wrapped.a == 10
+        content.change(20)
+        assert wrapped.a == 20
+        wrapped.a = 30
+        assert content.a == 30
+        assert wrapped.mod_attr == "30 mod"
+
+    def test_user_defined_fast_wrapper(self):
+        first = Node.wraps(B(1))
+        assert B in Node._fast_wrappers
+        content = B(2)
+        wrapped = Node.wraps(content)
+        assert type(wrapped) is type(first)
+        assert wrapped.ref is content
+        assert wrapped == content and hash(wrapped) == hash(content)
+        assert wrapped != B(2)
+        assert Node.wraps(wrapped) is wrapped
+        assert {wrapped: 1}[content] == 1
+        # instances that accept attributes are flagged, not wrapped
+        assert A not in Node._fast_wrappers
+        a = A(1)
+        assert Node.wraps(a) is a
+
+
+@pytest.mark.parametrize("content", [1, "str", (1, 2)])
+def test_pickle_in_new_interpreter(content):
+    # the generated wrapper types do not exist in a new interpreter until
+    # their first content is wrapped
+    import pickle
+    import subprocess
+    import sys
+
+    code = (
+        "import pickle, sys\n"
+        "n = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(repr(n), type(n).__name__)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        input=pickle.dumps(Node.wraps(content)),
+        capture_output=True,
+        check=True,
+    )
+    wrapped_type = type(Node.wraps(content)).__name__
+    assert out.stdout.decode().split() == [*repr(content).split(), wrapped_type]
@@ -0,0 +1,699 @@
+"""Immutable, array-backed snapshots of Graph and DiGraph.
+
+`CSRGraph` and `CSRDiGraph` store the adjacency structure in compressed
+sparse row (CSR) form: one offsets array (`indptr`) and one neighbor-index
+array (`indices`) over a contiguous node index. Node and edge attributes
+are kept as typed columns (one NumPy array per attribute name), so the
+per-edge cost is a few bytes instead of the dict-of-dict-of-dict used by
+`Graph`.
+
+The classes expose the read-only part of the `Graph`/`DiGraph` API
+(`adj`, `nodes`, `edges`, `degree`, `neighbors`, `has_edge`, ...) by
+presenting the arrays as read-only Mappings in place of the usual
+`_node`/`_adj`/`_succ`/`_pred` dicts, so algorithms that do not modify
+their input graph run on them unchanged. Any attempt to add or remove
+nodes or edges raises a `NetworkXError`, and node and edge attributes are
+read-only.
+
+>>> G = nx.path_graph(4)
+>>> G.add_edge(2, 3, weight=5)
+>>> C = nx.CSRGraph(G)
+>>> C.edges[2, 3]["weight"]
+5
+>>> nx.shortest_path_length(C, 0, 3, weight="weight")
+7
+"""
+from bisect import bisect_left
+from collections.abc import ItemsView, Mapping, ValuesView
+from copy import deepcopy
+from functools import cached_property
+
+import networkx as nx
+from networkx.classes.components import Node
+from networkx.classes.digraph import DiGraph
+from networkx.classes.function import frozen
+from networkx.classes.graph import Graph
+
+__all__ = ["CSRGraph", "CSRDiGraph"]
+
+
+class _CSRAttrView(Mapping):
+    """Read-only attribute dict of one node or edge, backed by typed columns.
+
+    `columns` maps an attribute name to a `(values, present)` pair where
+    `values` is a 1-D array and `present` is a boolean mask, or None when
+    every row holds the attribute.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns, index):
+        self._columns = columns
+        self._index = index
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __iter__(self):
+        i = self._index
+        return (
+            name
+            for name, (_, present) in self._columns.items()
+            if present is None or present[i]
+        )
+
+    def __contains__(self, name):
+        try:
+            present = self._columns[name][1]
+        except (KeyError, TypeError):
+            return False
+        return present is None or bool(present[self._index])
+
+    def __getitem__(self, name):
+        values, present = self._columns[name]
+        if present is not None and not present[self._index]:
+            raise KeyError(name)
+        return values.item(self._index)
+
+    def copy(self):
+        return dict(self)
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return deepcopy(dict(self), memo)
+
+    def __str__(self):
+        return str(dict(self))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class _CSRNeighborItems(ItemsView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return self._mapping._iter_items()
+
+
+class _CSRNeighborValues(ValuesView):
+    __slots__ = ()
+
+    def __iter__(self):
+        return (dd for _, dd in self._mapping._iter_items())
+
+
+class _CSRNeighbors(Mapping):
+    """Read-only neighbor mapping of one row of a `_CSRAdjacency`."""
+
+    __slots__ = ("_adj", "_start", "_stop")
+
+    def __init__(self, adj, start, stop):
+        self._adj = adj
+        self._start = start
+        self._stop = stop
+
+    def __len__(self):
+        return self._stop - self._start
+
+    def __iter__(self):
+        return map(
+            self._adj._nodes.__getitem__,
+            self._adj._indices[self._start : self._stop].tolist(),
+        )
+
+    def _position(self, nbr):
+        try:
+            j = self._adj._index[nbr]
+        except (KeyError, TypeError):
+            return -1
+        indices = self._adj._indices
+        pos = bisect_left(indices, j, self._start, self._stop)
+        if pos < self._stop and indices[pos] == j:
+            return pos
+        return -1
+
+    def __contains__(self, nbr):
+        return self._position(nbr) >= 0
+
+    def __getitem__(self, nbr):
+        pos = self._position(nbr)
+        if pos < 0:
+            raise KeyError(nbr)
+        return self._adj._edge_data(pos)
+
+    def _iter_items(self):
+        adj = self._adj
+        nodes, columns = adj._nodes, adj._edge_columns
+        start, stop = self._start, self._stop
+        if adj._edge_ids is None:
+            eids = range(start, stop)
+        else:
+            eids = adj._edge_ids[start:stop].tolist()
+        for j, e in zip(adj._indices[start:stop].tolist(), eids):
+            yield nodes[j], _CSRAttrView(columns, e)
+
+    def items(self):
+        return _CSRNeighborItems(self)
+
+    def values(self):
+        return _CSRNeighborValues(self)
+
+    def copy(self):
+        return {nbr: dd.copy() for nbr, dd in self._iter_items()}
+
+    def __str__(self):
+        return str(self.copy())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only node -> neighbor -> edge-attribute Mapping over CSR arrays.
+
+    Row `i` of the structure holds the neighbors of node `nodes[i]` as the
+    sorted node indices ``indices[indptr[i]:indptr[i + 1]]``. Edge attribute
+    columns are indexed by ``edge_ids[pos]``, or directly by the position
+    `pos` in `indices` when `edge_ids` is None.
+    """
+
+    __slots__ = (
+        "_nodes",
+        "_index",
+        "_indptr",
+        "_indices",
+        "_edge_ids",
+        "_edge_columns",
+    )
+
+    def __init__(self, nodes, index, indptr, indices, edge_ids, edge_columns):
+        self._nodes = nodes
+        self._index = index
+        self._indptr = indptr
+        self._indices = indices
+        self._edge_ids = edge_ids
+        self._edge_columns = edge_columns
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        i = self._index[n]
+        return _CSRNeighbors(self, self._indptr.item(i), self._indptr.item(i + 1))
+
+    def _edge_data(self, pos):
+        e = pos if self._edge_ids is None else self._edge_ids.item(pos)
+        return _CSRAttrView(self._edge_columns, e)
+
+    def copy(self):
+        return {n: self[n].copy() for n in self._nodes}
+
+    def __str__(self):
+        return str(self.copy())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+class _CSRNodeAtlas(Mapping):
+    """Read-only node -> node-attribute Mapping over typed columns."""
+
+    __slots__ = ("_nodes", "_index", "_columns")
+
+    def __init__(self, nodes, index, columns):
+        self._nodes = nodes
+        self._index = index
+        self._columns = columns
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        return _CSRAttrView(self._columns, self._index[n])
+
+    def items(self):
+        columns = self._columns
+        return zip(self._nodes, (_CSRAttrView(columns, i) for i in range(len(self))))
+
+    def copy(self):
+        return {n: dd.copy() for n, dd in self.items()}
+
+    def __str__(self):
+        return str(self.copy())
+
+    def __repr__(self):
+        return repr(self.copy())
+
+
+def _index_dtype(size):
+    import numpy as np
+
+    return np.int32 if size < np.iinfo(np.int32).max else np.int64
+
+
+def _typed_column(values, present, size):
+    """Returns a `(values, present)` column holding `values` at rows `present`.
+
+    `present` is a list of row numbers. The array dtype is inferred from the
+    values and falls back to `object` for anything non-numeric.
+    """
+    import numpy as np
+
+    try:
+        arr = np.asarray(values)
+    except (ValueError, OverflowError):
+        arr = None
+    if arr is None or arr.ndim != 1 or arr.dtype.kind not in "biufc":
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+    if len(present) == size:
+        return arr, None
+    column = np.zeros(size, dtype=arr.dtype)
+    mask = np.zeros(size, dtype=bool)
+    column[present] = arr
+    mask[present] = True
+    return column, mask
+
+
+def _columns_from_dicts(dicts):
+    """Returns typed columns `{name: (values, present)}` for a list of dicts."""
+    collected = {}
+    for i, d in enumerate(dicts):
+        for name, value in d.items():
+            try:
+                rows, values = collected[name]
+            except KeyError:
+                rows, values = collected[name] = ([], [])
+            rows.append(i)
+            values.append(value)
+    size = len(dicts)
+    return {
+        name: _typed_column(values, rows, size)
+        for name, (rows, values) in collected.items()
+    }
+
+
+def _columns_from_arrays(arrays, size, what):
+    """Returns typed columns for a dict of attribute name -> array of values."""
+    import numpy as np
+
+    columns = {}
+    for name, values in (arrays or {}).items():
+        values = np.asarray(values)
+        if values.shape != (size,):
+            raise nx.NetworkXError(
+                f"{what} attribute {name!r} must have shape ({size},), "
+                f"got {values.shape}"
+            )
+        columns[name] = (values, None)
+    return columns
+
+
+class CSRGraph(Graph):
+    """An immutable, array-backed undirected graph in CSR form.
+
+    A `CSRGraph` is a read-only snapshot of an undirected graph. Nodes are
+    numbered ``0 .. n-1`` in the order they are given, the neighbors of
+    every node are stored as a sorted slice of one index array, and node
+    and edge attributes are stored as typed columns (one array per
+    attribute name). It uses a small fraction of the memory of a `Graph`
+    with the same content.
+
+    The read-only `Graph` API is supported, so algorithms that only read
+    their input graph can be used unchanged. Adding or removing nodes or
+    edges raises `NetworkXError` (see `nx.freeze`), node and edge
+    attribute mappings are read-only, and `copy` returns a mutable `Graph`.
+
+    Neighbors are reported in node-index order, which may differ from the
+    order in which edges were added to the source graph.
+
+    Algorithms that build their result as an instance of the input graph's
+    class (``G.__class__()``) cannot fill it in; pass them a mutable
+    `copy` instead.
+
+    Requires NumPy.
+
+    Parameters
+    ----------
+    incoming_graph_data : input graph (optional, default: None)
+        Data to initialize graph. If None (default) an empty graph is
+        created. A NetworkX graph is copied with its node, edge and graph
+        attributes. Any other input accepted by `Graph` is first converted
+        with `Graph`. Directed and multigraph inputs are collapsed the same
+        way `Graph` collapses them.
+
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRDiGraph
+    Graph
+    freeze
+
+    Examples
+    --------
+    >>> G = nx.Graph([(0, 1, {"weight": 0.5}), (1, 2, {"weight": 2.0})])
+    >>> C = nx.CSRGraph(G)
+    >>> list(C.edges(data="weight"))
+    [(0, 1, 0.5), (1, 2, 2.0)]
+    >>> C.has_edge(2, 1), C.degree[1], sorted(C.neighbors(1))
+    (True, 2, [0, 2])
+    >>> C.add_edge(0, 2)
+    Traceback (most recent call last):
+    ...
+    networkx.exception.NetworkXError: Frozen graph can't be modified
+
+    Graphs can also be created directly from CSR arrays, for example those
+    of a SciPy sparse array, with `from_arrays`.
+    """
+
+    add_node = frozen
+    add_nodes_from = frozen
+    remove_node = frozen
+    remove_nodes_from = frozen
+    add_edge = frozen
+    add_edges_from = frozen
+    add_weighted_edges_from = frozen
+    remove_edge = frozen
+    remove_edges_from = frozen
+    update = frozen
+    clear = frozen
+    clear_edges = frozen
+    # checked by nx.is_frozen; must come after the `frozen` assignments above
+    frozen = True
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        import numpy as np
+
+        self.graph = self.graph_attr_dict_factory()
+        if incoming_graph_data is None:
+            empty = np.zeros(0, dtype=np.int32)
+            self._set_arrays([], np.zeros(1, dtype=np.int32), empty, None, {}, {})
+        else:
+            if not self._is_csr_source(incoming_graph_data):
+                incoming_graph_data = self._mutable_class()(incoming_graph_data)
+            self._set_from_graph(incoming_graph_data)
+            self.graph.update(incoming_graph_data.graph)
+        self.graph.update(attr)
+
+    @classmethod
+    def from_arrays(
+        cls, indptr, indices, nodes=None, edge_attrs=None, node_attrs=None, **attr
+    ):
+        """Returns a graph built directly from CSR arrays.
+
+        Parameters
+        ----------
+        indptr : array_like of int, shape (n + 1,)
+            Row offsets: the neighbors of node `i` are
+            ``indices[indptr[i]:indptr[i + 1]]``.
+        indices : array_like of int, shape (nnz,)
+            Neighbor node indices of all rows, concatenated.
+        nodes : sequence of nodes, optional (default= range(n))
+            The node for each index.
+        edge_attrs : dict of array_like, optional
+            Edge attribute columns, each of shape (nnz,) and aligned with
+            `indices`.
+        node_attrs : dict of array_like, optional
+            Node attribute columns, each of shape (n,).
+        attr : keyword arguments, optional
+            Graph attributes.
+
+        Returns
+        -------
+        G : CSRGraph or CSRDiGraph
+
+        Raises
+        ------
+        NetworkXError
+            If the arrays do not describe a valid CSR structure.
+
+        Notes
+        -----
+        For `CSRGraph` the structure must be symmetric: every undirected
+        edge is stored in both rows, with the same attributes. This is not
+        checked. Rows are sorted if they are not sorted already.
+
+        Examples
+        --------
+        >>> import scipy as sp
+        >>> import scipy.sparse  # call as sp.sparse
+        >>> A = sp.sparse.csr_array([[0, 2, 0], [2, 0, 1], [0, 1, 0]])
+        >>> C = nx.CSRGraph.from_arrays(
+        ...     A.indptr, A.indices, nodes="abc", edge_attrs={"weight": A.data}
+        ... )
+        >>> list(C.edges(data="weight"))
+        [('a', 'b', 2), ('b', 'c', 1)]
+        """
+        import numpy as np
+
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if indptr.ndim != 1 or indices.ndim != 1 or len(indptr) == 0:
+            raise nx.NetworkXError("indptr and indices must be 1-D arrays")
+        n = len(indptr) - 1
+        nnz = len(indices)
+        if indptr[0] != 0 or indptr[-1] != nnz or np.any(np.diff(indptr) < 0):
+            raise nx.NetworkXError("indptr is not a valid offsets array")
+        if nnz and (indices.min() < 0 or indices.max() >= n):
+            raise nx.NetworkXError("indices must be in range(len(indptr) - 1)")
+        nodes = list(range(n)) if nodes is None else list(nodes)
+        if len(nodes) != n:
+            raise nx.NetworkXError(f"expected {n} nodes, got {len(nodes)}")
+
+        edge_columns = _columns_from_arrays(edge_attrs, nnz, "edge")
+        node_columns = _columns_from_arrays(node_attrs, n, "node")
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        order = np.lexsort((indices, rows))
+        if np.any(order != np.arange(nnz)):
+            indices = indices[order]
+            edge_columns = {k: (v[order], p) for k, (v, p) in edge_columns.items()}
+
+        G = cls.__new__(cls)
+        G.graph = G.graph_attr_dict_factory()
+        G.graph.update(attr)
+        G._set_arrays(
+            [Node.wraps(v) for v in nodes],
+            indptr.astype(_index_dtype(nnz), copy=False),
+            indices.astype(_index_dtype(n), copy=False),
+            None,
+            edge_columns,
+            node_columns,
+        )
+        return G
+
+    def _is_csr_source(self, G):
+        """Whether `G` can be copied directly, without converting it first."""
+        return (
+            isinstance(G, Graph)
+            and not G.is_multigraph()
+            and G.is_directed() == self.is_directed()
+        )
+
+    def _mutable_class(self):
+        return self.to_undirected_class()
+
+    def _set_from_graph(self, G):
+        import numpy as np
+
+        nodes = list(G)
+        index = {n: i for i, n in enumerate(nodes)}
+        n = len(nodes)
+        src, dst, data = [], [], []
+        for u, v, dd in G.edges(data=True, wrap=False):
+            src.append(index[u])
+            dst.append(index[v])
+            data.append(dd)
+        m = len(data)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        if self.is_directed():
+            order = np.lexsort((dst, src))
+            # columns are indexed by CSR position
+            edge_ids = None
+            edge_columns = _columns_from_dicts([data[e] for e in order.tolist()])
+        else:
+            # store both directions of every edge (self-loops once), and
+            # index the shared columns through edge ids
+            loop = src == dst
+            eids = np.arange(m, dtype=_index_dtype(m))
+            src, dst = (
+                np.concatenate((src, dst[~loop])),
+                np.concatenate((dst, src[~loop])),
+            )
+            order = np.lexsort((dst, src))
+            edge_ids = np.concatenate((eids, eids[~loop]))[order]
+            edge_columns = _columns_from_dicts(data)
+        indptr = np.zeros(n + 1, dtype=_index_dtype(len(order)))
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        self._set_arrays(
+            nodes,
+            indptr,
+            dst[order].astype(_index_dtype(n)),
+            edge_ids,
+            edge_columns,
+            _columns_from_dicts([G._node[v] for v in nodes]),
+            index,
+        )
+
+    def _set_arrays(
+        self, nodes, indptr, indices, edge_ids, edge_columns, node_columns, index=None
+    ):
+        self._nodes = nodes
+        self._index = {v: i for i, v in enumerate(nodes)} if index is None else index
+        self._indptr = indptr
+        self._indices = indices
+        self._edge_ids = edge_ids
+        self._edge_columns = edge_columns
+        self._node_columns = node_columns
+
+    @cached_property
+    def _node(self):
+        return _CSRNodeAtlas(self._nodes, self._index, self._node_columns)
+
+    @cached_property
+    def _adj(self):
+        return _CSRAdjacency(
+            self._nodes,
+            self._index,
+            self._indptr,
+            self._indices,
+            self._edge_ids,
+            self._edge_columns,
+        )
+
+    def copy(self, as_view=False):
+        """Returns a mutable copy of the graph.
+
+        Parameters
+        ----------
+        as_view : bool, optional (default=False)
+            If True, the returned graph-view provides a read-only view
+            of the original graph without actually copying any data.
+
+        Returns
+        -------
+        G : Graph or DiGraph
+            A mutable copy of the graph (`Graph` for `CSRGraph` and `DiGraph`
+            for `CSRDiGraph`), or a read-only view if `as_view` is True.
+        """
+        if as_view is True:
+            return nx.graphviews.generic_graph_view(self)
+        G = self._mutable_class()()
+        G.graph.update(self.graph)
+        G.add_nodes_from((n, d.copy()) for n, d in self._node.items())
+        G.add_edges_from(
+            (u, v, d.copy()) for u, v, d in self.edges(data=True, wrap=False)
+        )
+        return G
+
+
+class CSRDiGraph(CSRGraph, DiGraph):
+    """An immutable, array-backed directed graph in CSR form.
+
+    The directed counterpart of `CSRGraph`: successors are stored in CSR
+    form and predecessors in the transposed (CSC) form, which is built on
+    first use. Edge attribute columns are shared by both directions.
+
+    Parameters
+    ----------
+    incoming_graph_data : input graph (optional, default: None)
+        Data to initialize graph. If None (default) an empty graph is
+        created. A NetworkX graph is copied with its node, edge and graph
+        attributes. Any other input accepted by `DiGraph` is first
+        converted with `DiGraph`.
+
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRGraph
+    DiGraph
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+    >>> C = nx.CSRDiGraph(G)
+    >>> list(C.successors(0)), list(C.predecessors(0))
+    ([1], [2])
+    >>> C.in_degree[2], C.out_degree[2]
+    (1, 1)
+    """
+
+    def _mutable_class(self):
+        return self.to_directed_class()
+
+    def reverse(self, copy=True):
+        """Returns the reverse of the graph.
+
+        The reverse is a graph with the same nodes and edges
+        but with the directions of the edges reversed.
+
+        Parameters
+        ----------
+        copy : bool optional (default=True)
+            If True, return a new CSRDiGraph holding the reversed edges.
+            If False, the reverse graph is created using a view of
+            the original graph.
+        """
+        if not copy:
+            return nx.graphviews.reverse_view(self)
+        pred = self._pred
+        H = self.__class__.__new__(self.__class__)
+        H.graph = deepcopy(self.graph)
+        H._set_arrays(
+            self._nodes,
+            pred._indptr,
+            pred._indices,
+            pred._edge_ids,
+            self._edge_columns,
+            self._node_columns,
+            self._index,
+        )
+        return H
+
+    @cached_property
+    def _succ(self):
+        return self._adj
+
+    @cached_property
+    def _pred(self):
+        import numpy as np
+
+        n, nnz = len(self._nodes), len(self._indices)
+        rows = np.repeat(np.arange(n, dtype=self._indices.dtype), np.diff(self._indptr))
+        order = np.lexsort((rows, self._indices))
+        indptr = np.zeros(n + 1, dtype=self._indptr.dtype)
+        np.cumsum(np.bincount(self._indices, minlength=n), out=indptr[1:])
+        edge_ids = order if self._edge_ids is None else self._edge_ids[order]
+        return _CSRAdjacency(
+            self._nodes,
+            self._index,
+            indptr,
+            rows[order],
+            edge_ids.astype(_index_dtype(nnz), copy=False),
+            self._edge_columns,
+        )
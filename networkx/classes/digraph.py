@@ -226,6 +226,13 @@ class DiGraph(Graph):
         dict which holds attribute values keyed by attribute name.
         It should require no arguments and return a dict-like object.
 
+    wrap_edges : bool, (default: True)
+        Whether edge views report edges as `Edge`/`DataEdge` wrappers
+        (`MultiEdge`/`DataMultiEdge` with keys). If False, edge views
+        report plain tuples of the stored nodes, which is considerably
+        faster to iterate. It can also be set on a single graph instance,
+        and any single view can override it with its `wrap` argument.
+
     Typically, if your extension doesn't impact the data structure all
     methods will inherited without issue except: `to_directed/to_undirected`.
     By default these methods create a DiGraph/Graph class and you probably
@@ -855,7 +862,7 @@ class DiGraph(Graph):
     def edges(self):
         """An OutEdgeView of the DiGraph as G.edges or G.edges().
 
-        edges(self, nbunch=None, data=False, default=None)
+        edges(self, nbunch=None, data=False, default=None, wrap=None)
 
         The OutEdgeView provides set-like operations on the edge-tuples
         as well as edge attribute lookup. When called, it also provides
@@ -878,6 +885,9 @@ class DiGraph(Graph):
         default : value, optional (default=None)
             Value used for edges that don't have the requested attribute.
             Only relevant if data is not True or False.
+        wrap : bool, optional (default=None)
+            If False, report plain tuples instead of edge wrappers.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
@@ -925,7 +935,7 @@ class DiGraph(Graph):
     def in_edges(self):
         """An InEdgeView of the Graph as G.in_edges or G.in_edges().
 
-        in_edges(self, nbunch=None, data=False, default=None):
+        in_edges(self, nbunch=None, data=False, default=None, wrap=None):
 
         Parameters
         ----------
@@ -938,6 +948,9 @@ class DiGraph(Graph):
         default : value, optional (default=None)
             Value used for edges that don't have the requested attribute.
             Only relevant if data is not True or False.
+        wrap : bool, optional (default=None)
+            If False, report plain tuples instead of edge wrappers.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
@@ -1232,6 +1245,8 @@ class DiGraph(Graph):
             H = self.__class__()
             H.graph.update(deepcopy(self.graph))
             H.add_nodes_from((n, deepcopy(d)) for n, d in self.nodes.items())
-            H.add_edges_from((v, u, deepcopy(d)) for u, v, d in self.edges(data=True))
+            H.add_edges_from(
+                (v, u, deepcopy(d)) for u, v, d in self.edges(data=True, wrap=False)
+            )
             return H
         return nx.graphviews.reverse_view(self)
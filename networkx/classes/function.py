@@ -813,7 +813,7 @@ def set_edge_attributes(G, values, name=None):
                         pass
         except AttributeError:
             # treat `values` as a constant
-            for u, v, data in G.edges(data=True):
+            for u, v, data in G.edges(data=True, wrap=False):
                 data[name] = values
     else:
         # `values` consists of doct-of-dict {edge: {attr: value}} shape
@@ -856,9 +856,9 @@ def get_edge_attributes(G, name):
     'red'
     """
     if G.is_multigraph():
-        edges = G.edges(keys=True, data=True)
+        edges = G.edges(keys=True, data=True, wrap=False)
     else:
-        edges = G.edges(data=True)
+        edges = G.edges(data=True, wrap=False)
     return {x[:-1]: x[-1][name] for x in edges if name in x[-1]}
 
 
@@ -1020,7 +1020,7 @@ def is_weighted(G, edge=None, weight="weight"):
         # Special handling required since: all([]) == True
         return False
 
-    return all(weight in data for u, v, data in G.edges(data=True))
+    return all(weight in data for u, v, data in G.edges(data=True, wrap=False))
 
 
 def is_negatively_weighted(G, edge=None, weight="weight"):
@@ -1073,7 +1073,10 @@ def is_negatively_weighted(G, edge=None, weight="weight"):
             raise nx.NetworkXError(msg)
         return weight in data and data[weight] < 0
 
-    return any(weight in data and data[weight] < 0 for u, v, data in G.edges(data=True))
+    return any(
+        weight in data and data[weight] < 0
+        for u, v, data in G.edges(data=True, wrap=False)
+    )
 
 
 def is_empty(G):
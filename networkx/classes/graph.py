@@ -225,6 +225,13 @@ class Graph:
         dict which holds attribute values keyed by attribute name.
         It should require no arguments and return a dict-like object.
 
+    wrap_edges : bool, (default: True)
+        Whether edge views report edges as `Edge`/`DataEdge` wrappers
+        (`MultiEdge`/`DataMultiEdge` with keys). If False, edge views
+        report plain tuples of the stored nodes, which is considerably
+        faster to iterate. It can also be set on a single graph instance,
+        and any single view can override it with its `wrap` argument.
+
     Typically, if your extension doesn't impact the data structure all
     methods will inherit without issue except: `to_directed/to_undirected`.
     By default these methods create a DiGraph/Graph class and you probably
@@ -272,6 +279,8 @@ class Graph:
     edge_attr_dict_factory = dict
     graph_attr_dict_factory = dict
 
+    wrap_edges = True
+
     def to_directed_class(self):
         """Returns the class to use for empty directed copies.
 
@@ -1264,7 +1273,7 @@ class Graph:
     def edges(self):
         """An EdgeView of the Graph as G.edges or G.edges().
 
-        edges(self, nbunch=None, data=False, default=None)
+        edges(self, nbunch=None, data=False, default=None, wrap=None)
 
         The EdgeView provides set-like operations on the edge-tuples
         as well as edge attribute lookup. When called, it also provides
@@ -1287,6 +1296,9 @@ class Graph:
         default : value, optional (default=None)
             Value used for edges that don't have the requested attribute.
             Only relevant if data is not True or False.
+        wrap : bool, optional (default=None)
+            If False, report plain tuples instead of edge wrappers.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
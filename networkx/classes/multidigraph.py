@@ -258,6 +258,13 @@ class MultiDiGraph(MultiGraph, DiGraph):
         dict which holds attribute values keyed by attribute name.
         It should require no arguments and return a dict-like object.
 
+    wrap_edges : bool, (default: True)
+        Whether edge views report edges as `Edge`/`DataEdge` wrappers
+        (`MultiEdge`/`DataMultiEdge` with keys). If False, edge views
+        report plain tuples of the stored nodes, which is considerably
+        faster to iterate. It can also be set on a single graph instance,
+        and any single view can override it with its `wrap` argument.
+
     Typically, if your extension doesn't impact the data structure all
     methods will inherited without issue except: `to_directed/to_undirected`.
     By default these methods create a DiGraph/Graph class and you probably
@@ -576,7 +583,7 @@ class MultiDiGraph(MultiGraph, DiGraph):
     def edges(self):
         """An OutMultiEdgeView of the Graph as G.edges or G.edges().
 
-        edges(self, nbunch=None, data=False, keys=False, default=None)
+        edges(self, nbunch=None, data=False, keys=False, default=None, wrap=None)
 
         The OutMultiEdgeView provides set-like operations on the edge-tuples
         as well as edge attribute lookup. When called, it also provides
@@ -609,6 +616,9 @@ class MultiDiGraph(MultiGraph, DiGraph):
         default : value, optional (default=None)
             Value used for edges that don't have the requested attribute.
             Only relevant if data is not True or False.
+        wrap : bool, optional (default=None)
+            If False, report plain tuples instead of edge wrappers.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
@@ -664,7 +674,7 @@ class MultiDiGraph(MultiGraph, DiGraph):
     def in_edges(self):
         """An InMultiEdgeView of the Graph as G.in_edges or G.in_edges().
 
-        in_edges(self, nbunch=None, data=False, keys=False, default=None)
+        in_edges(self, nbunch=None, data=False, keys=False, default=None, wrap=None)
 
         Parameters
         ----------
@@ -680,6 +690,9 @@ class MultiDiGraph(MultiGraph, DiGraph):
         default : value, optional (default=None)
             Value used for edges that don't have the requested attribute.
             Only relevant if data is not True or False.
+        wrap : bool, optional (default=None)
+            If False, report plain tuples instead of edge wrappers.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
@@ -945,7 +958,7 @@ class MultiDiGraph(MultiGraph, DiGraph):
             H.add_nodes_from((n, deepcopy(d)) for n, d in self._node.items())
             H.add_edges_from(
                 (v, u, k, deepcopy(d))
-                for u, v, k, d in self.edges(keys=True, data=True)
+                for u, v, k, d in self.edges(keys=True, data=True, wrap=False)
             )
             return H
         return nx.graphviews.reverse_view(self)
@@ -251,6 +251,13 @@ class MultiGraph(Graph):
         dict which holds attribute values keyed by attribute name.
         It should require no arguments and return a dict-like object.
 
+    wrap_edges : bool, (default: True)
+        Whether edge views report edges as `Edge`/`DataEdge` wrappers
+        (`MultiEdge`/`DataMultiEdge` with keys). If False, edge views
+        report plain tuples of the stored nodes, which is considerably
+        faster to iterate. It can also be set on a single graph instance,
+        and any single view can override it with its `wrap` argument.
+
     Typically, if your extension doesn't impact the data structure all
     methods will inherited without issue except: `to_directed/to_undirected`.
     By default these methods create a DiGraph/Graph class and you probably
@@ -790,7 +797,7 @@ class MultiGraph(Graph):
     def edges(self):
         """Returns an iterator over the edges.
 
-        edges(self, nbunch=None, data=False, keys=False, default=None)
+        edges(self, nbunch=None, data=False, keys=False, default=None, wrap=None)
 
         The MultiEdgeView provides set-like operations on the edge-tuples
         as well as edge attribute lookup. When called, it also provides
@@ -822,6 +829,9 @@ class MultiGraph(Graph):
         default : value, optional (default=None)
             Value used for edges that don't have the requested attribute.
             Only relevant if data is not True or False.
+        wrap : bool, optional (default=None)
+            If False, report plain tuples instead of edge wrappers.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
@@ -744,6 +744,7 @@ class OutEdgeDataView:
         "_adjdict",
         "_nodes_nbrs",
         "_report",
+        "_wrap",
     )
 
     def __getstate__(self):
@@ -752,12 +753,13 @@ class OutEdgeDataView:
             "nbunch": self._nbunch,
             "data": self._data,
             "default": self._default,
+            "wrap": self._wrap,
         }
 
     def __setstate__(self, state):
         self.__init__(**state)
 
-    def __init__(self, viewer, nbunch=None, data=False, default=None):
+    def __init__(self, viewer, nbunch=None, data=False, default=None, wrap=None):
         self._viewer = viewer
         adjdict = self._adjdict = viewer._adjdict
         if nbunch is None:
@@ -769,8 +771,22 @@ class OutEdgeDataView:
         self._nbunch = nbunch
         self._data = data
         self._default = default
-        # Set _report based on data and default
-        if data is True:
+        if wrap is None:
+            wrap = viewer._graph.wrap_edges
+        self._wrap = wrap
+        # Set _report based on data, default and wrap
+        if not wrap:
+            if data is True:
+                self._report = lambda n, nbr, dd: (n, nbr, dd)
+            elif data is False:
+                self._report = lambda n, nbr, dd: (n, nbr)
+            else:  # data is attribute name
+                self._report = (
+                    lambda n, nbr, dd: (n, nbr, dd[data])
+                    if data in dd
+                    else (n, nbr, default)
+                )
+        elif data is True:
             self._report = lambda n, nbr, dd: nx.DataEdge.wraps(n, nbr, dd)
         elif data is False:
             self._report = lambda n, nbr, dd: nx.Edge.wraps(n, nbr)
@@ -827,6 +843,9 @@ class EdgeDataView(OutEdgeDataView):
     nbunch : container of nodes, node or None (default None)
     data : False, True or string (default False)
     default : default value (default None)
+    wrap : bool or None (default None)
+        Report `Edge`/`DataEdge` wrappers if True and plain tuples if False.
+        None uses the `wrap_edges` setting of the graph.
 
     Examples
     --------
@@ -897,12 +916,15 @@ class OutMultiEdgeDataView(OutEdgeDataView):
             "keys": self.keys,
             "data": self._data,
             "default": self._default,
+            "wrap": self._wrap,
         }
 
     def __setstate__(self, state):
         self.__init__(**state)
 
-    def __init__(self, viewer, nbunch=None, data=False, keys=False, default=None):
+    def __init__(
+        self, viewer, nbunch=None, data=False, keys=False, default=None, wrap=None
+    ):
         self._viewer = viewer
         adjdict = self._adjdict = viewer._adjdict
         self.keys = keys
@@ -915,8 +937,35 @@ class OutMultiEdgeDataView(OutEdgeDataView):
         self._nbunch = nbunch
         self._data = data
         self._default = default
-        # Set _report based on data and default
-        if data is True:
+        if wrap is None:
+            wrap = viewer._graph.wrap_edges
+        self._wrap = wrap
+        # Set _report based on data, default and wrap
+        if not wrap:
+            if data is True:
+                if keys is True:
+                    self._report = lambda n, nbr, k, dd: (n, nbr, k, dd)
+                else:
+                    self._report = lambda n, nbr, k, dd: (n, nbr, dd)
+            elif data is False:
+                if keys is True:
+                    self._report = lambda n, nbr, k, dd: (n, nbr, k)
+                else:
+                    self._report = lambda n, nbr, k, dd: (n, nbr)
+            else:  # data is attribute name
+                if keys is True:
+                    self._report = (
+                        lambda n, nbr, k, dd: (n, nbr, k, dd[data])
+                        if data in dd
+                        else (n, nbr, k, default)
+                    )
+                else:
+                    self._report = (
+                        lambda n, nbr, k, dd: (n, nbr, dd[data])
+                        if data in dd
+                        else (n, nbr, default)
+                    )
+        elif data is True:
             if keys is True:
                 self._report = lambda n, nbr, k, dd: nx.DataMultiEdge.wraps(
                     n, nbr, k, dd
@@ -1074,9 +1123,10 @@ class OutEdgeView(Set, Mapping):
         return sum(len(nbrs) for n, nbrs in self._nodes_nbrs())
 
     def __iter__(self):
+        wrap = self._graph.wrap_edges
         for n, nbrs in self._nodes_nbrs():
             for nbr in nbrs:
-                yield nx.Edge.wraps(n, nbr)
+                yield nx.Edge.wraps(n, nbr) if wrap else (n, nbr)
 
     def __contains__(self, e):
         try:
@@ -1096,12 +1146,12 @@ class OutEdgeView(Set, Mapping):
         return self._adjdict[u][v]
 
     # EdgeDataView methods
-    def __call__(self, nbunch=None, data=False, default=None):
-        if nbunch is None and data is False:
+    def __call__(self, nbunch=None, data=False, default=None, wrap=None):
+        if nbunch is None and data is False and wrap is None:
             return self
-        return self.dataview(self, nbunch, data, default)
+        return self.dataview(self, nbunch, data, default, wrap)
 
-    def data(self, data=True, default=None, nbunch=None):
+    def data(self, data=True, default=None, nbunch=None, wrap=None):
         """
         Return a read-only view of edge data.
 
@@ -1118,6 +1168,11 @@ class OutEdgeView(Set, Mapping):
         nbunch : container of nodes, optional (default=None)
             Allows restriction to edges only involving certain nodes. All edges
             are considered by default.
+        wrap : bool or None, optional (default=None)
+            If True, edges are reported as `Edge`/`DataEdge` wrappers.
+            If False, edges are reported as plain tuples of the stored
+            nodes, skipping the wrapping and its validation.
+            If None, the graph's `wrap_edges` setting is used.
 
         Returns
         -------
@@ -1174,10 +1229,15 @@ class OutEdgeView(Set, Mapping):
 
         >>> G.edges.data("speed")
         EdgeDataView([(0, 1, None), (0, 2, None), (1, 2, None)])
+
+        ``wrap=False`` reports plain tuples instead of edge wrappers:
+
+        >>> type(next(iter(G.edges.data("dist", wrap=False))))
+        <class 'tuple'>
         """
-        if nbunch is None and data is False:
+        if nbunch is None and data is False and wrap is None:
             return self
-        return self.dataview(self, nbunch, data, default)
+        return self.dataview(self, nbunch, data, default, wrap)
 
     # String Methods
     def __str__(self):
@@ -1267,11 +1327,12 @@ class EdgeView(OutEdgeView):
         return sum(num_nbrs) // 2
 
     def __iter__(self):
+        wrap = self._graph.wrap_edges
         seen = {}
         for n, nbrs in self._nodes_nbrs():
             for nbr in list(nbrs):
                 if nbr not in seen:
-                    yield nx.Edge.wraps(n, nbr)
+                    yield nx.Edge.wraps(n, nbr) if wrap else (n, nbr)
             seen[n] = 1
         del seen
 
@@ -1301,9 +1362,10 @@ class InEdgeView(OutEdgeView):
         self._nodes_nbrs = self._adjdict.items
 
     def __iter__(self):
+        wrap = self._graph.wrap_edges
         for n, nbrs in self._nodes_nbrs():
             for nbr in nbrs:
-                yield nx.Edge.wraps(nbr, n)
+                yield nx.Edge.wraps(nbr, n) if wrap else (nbr, n)
 
     def __contains__(self, e):
         try:
@@ -1363,15 +1425,15 @@ class OutMultiEdgeView(OutEdgeView):
         u, v, k = e
         return self._adjdict[u][v][k]
 
-    def __call__(self, nbunch=None, data=False, keys=False, default=None):
-        if nbunch is None and data is False and keys is True:
+    def __call__(self, nbunch=None, data=False, keys=False, default=None, wrap=None):
+        if nbunch is None and data is False and keys is True and wrap is None:
             return self
-        return self.dataview(self, nbunch, data, keys, default)
+        return self.dataview(self, nbunch, data, keys, default, wrap)
 
-    def data(self, data=True, keys=False, default=None, nbunch=None):
-        if nbunch is None and data is False and keys is True:
+    def data(self, data=True, keys=False, default=None, nbunch=None, wrap=None):
+        if nbunch is None and data is False and keys is True and wrap is None:
             return self
-        return self.dataview(self, nbunch, data, keys, default)
+        return self.dataview(self, nbunch, data, keys, default, wrap)
 
 
 class MultiEdgeView(OutMultiEdgeView):
@@ -1385,12 +1447,13 @@ class MultiEdgeView(OutMultiEdgeView):
         return sum(1 for e in self)
 
     def __iter__(self):
+        wrap = self._graph.wrap_edges
         seen = {}
         for n, nbrs in self._nodes_nbrs():
             for nbr, kd in nbrs.items():
                 if nbr not in seen:
                     for k, dd in kd.items():
-                        yield nx.MultiEdge.wraps(n, nbr, k)
+                        yield nx.MultiEdge.wraps(n, nbr, k) if wrap else (n, nbr, k)
             seen[n] = 1
         del seen
 
@@ -1413,10 +1476,11 @@ class InMultiEdgeView(OutMultiEdgeView):
         self._nodes_nbrs = self._adjdict.items
 
     def __iter__(self):
+        wrap = self._graph.wrap_edges
         for n, nbrs in self._nodes_nbrs():
             for nbr, kdict in nbrs.items():
                 for key in kdict:
-                    yield nx.MultiEdge.wraps(nbr, n, key)
+                    yield nx.MultiEdge.wraps(nbr, n, key) if wrap else (nbr, n, key)
 
     def __contains__(self, e):
         N = len(e)
@@ -0,0 +1,244 @@
+import pickle
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import networkx as nx
+from networkx.utils import edges_equal, nodes_equal
+
+
+class TestCSRGraph:
+    graph_class = nx.Graph
+    csr_class = nx.CSRGraph
+
+    def setup_method(self):
+        G = self.graph_class()
+        G.add_edge(0, 1, weight=0.5, color="red")
+        G.add_edge(1, 2, weight=2.0)
+        G.add_edge(2, 2, weight=1.5)
+        G.add_edge("a", 0, weight=3.0)
+        G.add_node("iso", size=10)
+        G.add_node(0, size=1)
+        G.graph["name"] = "small"
+        self.G = G
+        self.C = self.csr_class(G)
+
+    def test_nodes(self):
+        C, G = self.C, self.G
+        assert list(C) == list(G)
+        assert len(C) == len(G)
+        assert "iso" in C and 7 not in C and [] not in C
+        assert dict(C.nodes(data="size")) == dict(G.nodes(data="size"))
+        assert nodes_equal(C.nodes(data=True), G.nodes(data=True))
+        assert all(nx.is_node(n) for n in C)
+
+    def test_edges(self):
+        C, G = self.C, self.G
+        assert C.number_of_edges() == G.number_of_edges()
+        assert edges_equal(C.edges(data=True), G.edges(data=True))
+        assert edges_equal(C.edges(data="weight"), G.edges(data="weight"))
+        assert edges_equal(C.edges(data="color"), G.edges(data="color"))
+        assert C.edges[0, 1] == {"weight": 0.5, "color": "red"}
+        assert C.edges[1, 2] == {"weight": 2.0}
+        assert "color" not in C.edges[1, 2]
+        assert C[0][1]["color"] == "red"
+        with pytest.raises(KeyError):
+            C.edges[1, 2]["color"]
+
+    def test_has_edge_and_neighbors(self):
+        C, G = self.C, self.G
+        for u in G:
+            assert sorted(C.neighbors(u), key=str) == sorted(G.neighbors(u), key=str)
+            for v in G:
+                assert C.has_edge(u, v) == G.has_edge(u, v)
+        assert not C.has_edge(0, "missing")
+        assert not C.has_edge("missing", 0)
+        with pytest.raises(nx.NetworkXError):
+            list(C.neighbors("missing"))
+
+    def test_degree(self):
+        C, G = self.C, self.G
+        assert dict(C.degree) == dict(G.degree)
+        assert dict(C.degree(weight="weight")) == dict(G.degree(weight="weight"))
+        assert C.size(weight="weight") == G.size(weight="weight")
+
+    def test_typed_columns(self):
+        C = self.C
+        values, present = C._edge_columns["weight"]
+        assert values.dtype == np.float64
+        assert present is None
+        values, present = C._edge_columns["color"]
+        assert values.dtype == object
+        assert present.sum() == 1
+        values, present = C._node_columns["size"]
+        assert values.dtype.kind == "i"
+        assert isinstance(C.nodes["iso"]["size"], int)
+
+    def test_frozen(self):
+        C = self.C
+        assert nx.is_frozen(C)
+        for method, args in [
+            (C.add_node, (5,)),
+            (C.add_nodes_from, ([5],)),
+            (C.remove_node, (0,)),
+            (C.add_edge, (0, 5)),
+            (C.add_edges_from, ([(0, 5)],)),
+            (C.remove_edge, (0, 1)),
+            (C.clear, ()),
+            (C.clear_edges, ()),
+        ]:
+            pytest.raises(nx.NetworkXError, method, *args)
+        with pytest.raises(TypeError):
+            C.edges[0, 1]["weight"] = 3
+        with pytest.raises(TypeError):
+            C.nodes[0]["size"] = 3
+
+    def test_copy(self):
+        C, G = self.C, self.G
+        H = C.copy()
+        assert type(H) is self.graph_class
+        assert edges_equal(H.edges(data=True), G.edges(data=True))
+        assert nodes_equal(H.nodes(data=True), G.nodes(data=True))
+        assert H.graph == G.graph
+        H.add_edge("new", 0)
+        H.edges[0, 1]["weight"] = 10
+        assert C.edges[0, 1]["weight"] == 0.5
+        view = C.copy(as_view=True)
+        assert edges_equal(view.edges, C.edges)
+
+    def test_subgraph(self):
+        C, G = self.C, self.G
+        S = C.subgraph([0, 1, "a"])
+        assert edges_equal(S.edges(data=True), G.subgraph([0, 1, "a"]).edges(data=True))
+        E = C.edge_subgraph([(0, 1)])
+        assert edges_equal(E.edges, [(0, 1)])
+
+    def test_to_directed_undirected(self):
+        C, G = self.C, self.G
+        assert edges_equal(
+            C.to_directed().edges(data=True), G.to_directed().edges(data=True)
+        )
+        assert edges_equal(
+            C.to_undirected().edges(data=True), G.to_undirected().edges(data=True)
+        )
+
+    def test_pickle(self):
+        C = self.C
+        P = pickle.loads(pickle.dumps(C, -1))
+        assert edges_equal(P.edges(data=True), C.edges(data=True))
+        assert nodes_equal(P.nodes(data=True), C.nodes(data=True))
+        assert P.graph == C.graph
+
+    def test_empty(self):
+        C = self.csr_class()
+        assert len(C) == 0
+        assert C.number_of_edges() == 0
+        assert list(C.edges) == []
+
+    def test_other_input(self):
+        C = self.csr_class([(1, 2), (2, 3)], day="Friday")
+        assert edges_equal(C.edges, [(1, 2), (2, 3)])
+        assert C.graph == {"day": "Friday"}
+
+    def test_algorithms(self):
+        G = nx.gnm_random_graph(60, 200, seed=42, directed=self.G.is_directed())
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (u * 7 + v * 3) % 11 + 1
+        C = self.csr_class(G)
+        assert dict(nx.all_pairs_dijkstra_path_length(C)) == dict(
+            nx.all_pairs_dijkstra_path_length(G)
+        )
+        assert dict(nx.all_pairs_shortest_path_length(C)) == dict(
+            nx.all_pairs_shortest_path_length(G)
+        )
+        bc_C = nx.betweenness_centrality(C, weight="weight")
+        bc_G = nx.betweenness_centrality(G, weight="weight")
+        assert bc_C == pytest.approx(bc_G)
+
+
+class TestCSRDiGraph(TestCSRGraph):
+    graph_class = nx.DiGraph
+    csr_class = nx.CSRDiGraph
+
+    def test_successors_predecessors(self):
+        C, G = self.C, self.G
+        for u in G:
+            assert sorted(C.successors(u), key=str) == sorted(G.successors(u), key=str)
+            assert sorted(C.predecessors(u), key=str) == sorted(
+                G.predecessors(u), key=str
+            )
+        assert dict(C.in_degree(weight="weight")) == dict(G.in_degree(weight="weight"))
+        assert dict(C.out_degree) == dict(G.out_degree)
+        assert edges_equal(C.in_edges(data=True), G.in_edges(data=True))
+        assert C.pred[1][0] == {"weight": 0.5, "color": "red"}
+
+    def test_reverse(self):
+        C, G = self.C, self.G
+        for R in (C.reverse(), C.reverse(copy=False)):
+            assert edges_equal(R.edges(data=True), G.reverse().edges(data=True))
+        assert type(C.reverse()) is nx.CSRDiGraph
+
+
+@pytest.mark.parametrize(
+    "graph_class, csr_class, expected_class",
+    [
+        (nx.Graph, nx.CSRDiGraph, nx.DiGraph),
+        (nx.DiGraph, nx.CSRGraph, nx.Graph),
+        (nx.MultiGraph, nx.CSRGraph, nx.Graph),
+    ],
+)
+def test_converted_input(graph_class, csr_class, expected_class):
+    G = graph_class([(0, 1, {"w": 1}), (1, 0, {"w": 2}), (1, 2, {"w": 3})])
+    expected = expected_class(G)
+    C = csr_class(G)
+    assert edges_equal(C.edges(data=True), expected.edges(data=True))
+
+
+class TestFromArrays:
+    def test_from_arrays(self):
+        indptr = [0, 1, 3, 4]
+        indices = [1, 2, 0, 1]
+        C = nx.CSRGraph.from_arrays(
+            indptr,
+            indices,
+            nodes="abc",
+            edge_attrs={"weight": [1.0, 2.0, 1.0, 2.0]},
+            node_attrs={"size": [1, 2, 3]},
+            name="abc",
+        )
+        assert list(C) == ["a", "b", "c"]
+        assert edges_equal(C.edges(data="weight"), [("a", "b", 1.0), ("b", "c", 2.0)])
+        assert C.nodes["c"]["size"] == 3
+        assert C.name == "abc"
+
+    def test_from_arrays_unsorted_rows(self):
+        C = nx.CSRDiGraph.from_arrays([0, 2, 2], [1, 0], edge_attrs={"weight": [5, 6]})
+        assert list(C.edges(data="weight")) == [(0, 0, 6), (0, 1, 5)]
+        assert list(C.predecessors(1)) == [0]
+
+    def test_from_scipy(self):
+        sp = pytest.importorskip("scipy")
+        import scipy.sparse  # call as sp.sparse
+
+        G = nx.gnm_random_graph(30, 80, seed=1, directed=True)
+        A = nx.to_scipy_sparse_array(G, format="csr")
+        C = nx.CSRDiGraph.from_arrays(A.indptr, A.indices, edge_attrs={"w": A.data})
+        assert edges_equal(C.edges, G.edges)
+
+    @pytest.mark.parametrize(
+        "indptr, indices, nodes, edge_attrs",
+        [
+            ([[0, 1]], [0], None, None),
+            ([], [], None, None),
+            ([1, 1], [], None, None),
+            ([0, 2], [0], None, None),
+            ([0, 1, 0], [0], None, None),
+            ([0, 1], [1], None, None),
+            ([0, 1], [0], "ab", None),
+            ([0, 1], [0], None, {"w": [1, 2]}),
+        ],
+    )
+    def test_from_arrays_invalid(self, indptr, indices, nodes, edge_attrs):
+        with pytest.raises(nx.NetworkXError):
+            nx.CSRGraph.from_arrays(indptr, indices, nodes, edge_attrs)
@@ -389,6 +389,31 @@ class TestEdgeDataView:
         assert len(H.edges()) == 9
         assert len(H.edges) == 9
 
+    def test_wrap(self):
+        evr = self.eview(self.G)
+        for data in (False, True, "foo"):
+            wrapped = list(evr(data=data))
+            plain = list(evr(data=data, wrap=False))
+            assert plain == wrapped
+            assert all(nx.is_edge(e) for e in wrapped)
+            assert all(type(e) is tuple for e in plain)
+            assert all(e in evr(data=data, wrap=False) for e in wrapped)
+
+    def test_wrap_edges_graph_default(self):
+        G = self.G.copy()
+        G.wrap_edges = False
+        evr = self.eview(G)
+        assert all(type(e) is tuple for e in evr(data=True))
+        assert all(nx.is_edge(e) for e in evr(data=True, wrap=True))
+        assert self.G.wrap_edges is True
+
+    def test_wrap_pickle(self):
+        import pickle
+
+        ev = self.eview(self.G)(data=True, wrap=False)
+        pev = pickle.loads(pickle.dumps(ev, -1))
+        assert all(type(e) is tuple for e in pev)
+
 
 class TestOutEdgeDataView(TestEdgeDataView):
     @classmethod
@@ -565,6 +590,17 @@ class TestEdgeView:
         cls.G = nx.path_graph(9)
         cls.eview = nx.reportviews.EdgeView
 
+    def test_wrap_edges(self):
+        G = self.G.copy()
+        ev = self.eview(G)
+        wrapped = list(ev)
+        G.wrap_edges = False
+        plain = list(ev)
+        assert plain == wrapped
+        assert all(type(e) is tuple for e in plain)
+        assert ev(wrap=True) is not ev
+        assert all(nx.is_edge(e) for e in ev(wrap=True))
+
     def test_pickle(self):
         import pickle
 
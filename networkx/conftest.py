@@ -321,16 +321,20 @@ except ImportError:
 collect_ignore = []
 
 needs_numpy = [
+    "algorithms/approximation/clustering_coefficient.py",
     "algorithms/approximation/traveling_salesman.py",
     "algorithms/centrality/current_flow_closeness.py",
     "algorithms/node_classification/__init__.py",
     "algorithms/non_randomness.py",
     "algorithms/shortest_paths/dense.py",
+    "classes/csrgraph.py",
     "linalg/bethehessianmatrix.py",
     "linalg/laplacianmatrix.py",
+    "readwrite/binary.py",
     "utils/misc.py",
 ]
 needs_scipy = [
+    "algorithms/approximation/clustering_coefficient.py",
     "algorithms/approximation/traveling_salesman.py",
     "algorithms/assortativity/correlation.py",
     "algorithms/assortativity/mixing.py",
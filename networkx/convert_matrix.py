@@ -26,6 +26,7 @@ nx_agraph, nx_pydot
 """
 
 import itertools
+import operator
 import warnings
 from collections import defaultdict
 
@@ -782,7 +783,7 @@ def to_numpy_recarray(G, nodelist=None, dtype=None, order=None):
     M = np.zeros((nlen, nlen), dtype=dtype, order=order)
 
     names = M.dtype.names
-    for u, v, attrs in G.edges(data=True):
+    for u, v, attrs in G.edges(data=True, wrap=False):
         if (u in nodeset) and (v in nodeset):
             i, j = index[u], index[v]
             values = tuple(attrs[n] for n in names)
@@ -873,6 +874,7 @@ def to_scipy_sparse_array(G, nodelist=None, dtype=None, weight="weight", format=
     .. [1] Scipy Dev. References, "Sparse Matrices",
        https://docs.scipy.org/doc/scipy/reference/sparse.html
     """
+    import numpy as np
     import scipy as sp
     import scipy.sparse  # call as sp.sparse
 
@@ -892,41 +894,86 @@ def to_scipy_sparse_array(G, nodelist=None, dtype=None, weight="weight", format=
                 if n not in G:
                     raise nx.NetworkXError(f"Node {n} in nodelist is not in G")
             raise nx.NetworkXError("nodelist contains duplicates.")
-        if nlen < len(G):
-            G = G.subgraph(nodelist)
 
-    index = dict(zip(nodelist, range(nlen)))
-    coefficients = zip(
-        *((index[u], index[v], wt) for u, v, wt in G.edges(data=weight, default=1))
-    )
-    try:
-        row, col, data = coefficients
-    except ValueError:
-        # there is no edge in the subgraph
-        row, col, data = [], [], []
-
-    if G.is_directed():
-        A = sp.sparse.coo_array((data, (row, col)), shape=(nlen, nlen), dtype=dtype)
-    else:
-        # symmetrize matrix
-        d = data + data
-        r = row + col
-        c = col + row
-        # selfloop entries get double counted when symmetrizing
-        # so we subtract the data on the diagonal
-        selfloops = list(nx.selfloop_edges(G, data=weight, default=1))
-        if selfloops:
-            diag_index, diag_data = zip(*((index[u], -wt) for u, v, wt in selfloops))
-            d += diag_data
-            r += diag_index
-            c += diag_index
-        A = sp.sparse.coo_array((d, (r, c)), shape=(nlen, nlen), dtype=dtype)
+    A = None
+    # views of a CSR graph keep the empty arrays of a new graph, and their
+    # adjacency is that of the viewed graph
+    if (
+        isinstance(G, nx.CSRGraph)
+        and getattr(G._adj, "_indptr", None) is G._indptr
+        and nodelist == list(G)
+    ):
+        A = _csr_graph_array(G, nlen, dtype, weight)
+    if A is None:
+        # Gather the adjacency rows in `nodelist` order and translate all
+        # their neighbors and edge values in single passes. Undirected
+        # adjacencies already hold both directions of every edge (and
+        # self-loops once), so the rows form the symmetric matrix as is.
+        index = dict(zip(nodelist, range(nlen)))
+        adj = G._adj
+        rows = [adj[u] for u in nodelist]
+        if nlen < len(G):
+            rows = [{v: dd for v, dd in nbrs.items() if v in index} for nbrs in rows]
+        indptr = np.zeros(nlen + 1, dtype=np.intp)
+        np.cumsum(list(map(len, rows)), out=indptr[1:])
+        nnz = int(indptr[-1])
+        indices = np.fromiter(
+            map(index.__getitem__, itertools.chain.from_iterable(rows)),
+            dtype=np.intp,
+            count=nnz,
+        )
+        edge_data = itertools.chain.from_iterable(
+            map(operator.methodcaller("values"), rows)
+        )
+        if G.is_multigraph():
+            if weight is None:
+                data = list(map(len, edge_data))
+            else:
+                data = [
+                    sum(d.get(weight, 1) for d in keydict.values())
+                    for keydict in edge_data
+                ]
+        elif weight is None:
+            data = np.ones(nnz, dtype=int)
+        else:
+            data = [dd.get(weight, 1) for dd in edge_data]
+        A = sp.sparse.csr_array(
+            (data, indices, indptr), shape=(nlen, nlen), dtype=dtype
+        )
+        A.sort_indices()
     try:
         return A.asformat(format)
     except ValueError as err:
         raise nx.NetworkXError(f"Unknown sparse matrix format: {format}") from err
 
 
+def _csr_graph_array(G, nlen, dtype, weight):
+    """Returns the adjacency array of a :class:`CSRGraph` built directly from
+    its CSR arrays, or None if the `weight` column is not numeric.
+
+    """
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    column = G._edge_columns.get(weight) if weight is not None else None
+    if column is None:
+        data = np.ones(len(G._indices), dtype=int)
+    else:
+        values, present = column
+        if values.dtype.kind not in "biufc":
+            return None
+        if G._edge_ids is not None:
+            values = values[G._edge_ids]
+            present = None if present is None else present[G._edge_ids]
+        if present is not None:
+            values = np.where(present, values, 1)
+        data = values
+    return sp.sparse.csr_array(
+        (data, G._indices, G._indptr), shape=(nlen, nlen), dtype=dtype, copy=True
+    )
+
+
 def to_scipy_sparse_matrix(G, nodelist=None, dtype=None, weight="weight", format="csr"):
     """Returns the graph adjacency matrix as a SciPy sparse matrix.
 
@@ -1113,11 +1160,12 @@ def _csr_gen_triples(A):
     an iterable of weighted edge triples.
 
     """
+    import numpy as np
+
     nrows = A.shape[0]
-    data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(nrows):
-        for j in range(indptr[i], indptr[i + 1]):
-            yield i, indices[j], data[j]
+    indptr = A.indptr
+    row = np.repeat(np.arange(nrows), np.diff(indptr))
+    return zip(row.tolist(), A.indices.tolist(), A.data.tolist())
 
 
 def _csc_gen_triples(A):
@@ -1125,11 +1173,12 @@ def _csc_gen_triples(A):
     an iterable of weighted edge triples.
 
     """
+    import numpy as np
+
     ncols = A.shape[1]
-    data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(ncols):
-        for j in range(indptr[i], indptr[i + 1]):
-            yield indices[j], i, data[j]
+    indptr = A.indptr
+    col = np.repeat(np.arange(ncols), np.diff(indptr))
+    return zip(A.indices.tolist(), col.tolist(), A.data.tolist())
 
 
 def _coo_gen_triples(A):
@@ -1137,8 +1186,7 @@ def _coo_gen_triples(A):
     of weighted edge triples.
 
     """
-    row, col, data = A.row, A.col, A.data
-    return zip(row, col, data)
+    return zip(A.row.tolist(), A.col.tolist(), A.data.tolist())
 
 
 def _dok_gen_triples(A):
@@ -1241,6 +1289,9 @@ def from_scipy_sparse_array(
         raise nx.NetworkXError(f"Adjacency matrix not square: nx,ny={A.shape}")
     # Make sure we get even the isolated nodes of the graph.
     G.add_nodes_from(range(n))
+    if type(G) in (nx.Graph, nx.DiGraph):
+        _add_weighted_edges_bulk(G, A, edge_attribute)
+        return G
     # Create an iterable over (u, v, w) triples and for each triple, add an
     # edge from u to v with weight w.
     triples = _generate_weighted_edges(A)
@@ -1272,6 +1323,89 @@ def from_scipy_sparse_array(
     return G
 
 
+def _add_weighted_edges_bulk(G, A, weight):
+    """Adds the weighted edges of the sparse array `A` between the integer
+    nodes of the freshly built :class:`Graph` or :class:`DiGraph` `G`.
+
+    This is equivalent to adding ``_generate_weighted_edges(A)`` with
+    ``G.add_weighted_edges_from`` but fills each adjacency dict in one
+    update. A symmetric array in canonical format only needs its upper
+    triangle to build an undirected graph.
+
+    """
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    nodes = list(G._node)
+    if G.is_directed():
+        row, col, data = _weighted_edge_arrays(A)
+        datadicts = [{weight: w} for w in data]
+        _update_grouped(G._succ, nodes, row, col, datadicts)
+        _update_grouped(G._pred, nodes, col, row, datadicts)
+        return
+    if (
+        A.format in ("csr", "csc", "coo")
+        and A.has_canonical_format
+        and (A != A.T).nnz == 0
+    ):
+        row, col, data = _weighted_edge_arrays(sp.sparse.triu(A, format="csr"))
+        datadicts = [{weight: w} for w in data]
+        # Entries above the diagonal first reach the later node's dict, which
+        # keeps the neighbor order of a sequential row-major insertion.
+        _update_grouped(G._adj, nodes, col, row, datadicts)
+        _update_grouped(G._adj, nodes, row, col, datadicts)
+        return
+    adj = [G._adj[u] for u in nodes]
+    for u, v, w in _generate_weighted_edges(A):
+        nbrs = adj[u]
+        datadict = nbrs.get(v)
+        if datadict is None:
+            datadict = {weight: w}
+            nbrs[nodes[v]] = datadict
+            adj[v][nodes[u]] = datadict
+        else:
+            datadict[weight] = w
+
+
+def _weighted_edge_arrays(A):
+    """Returns the row and column index arrays of the entries of `A` and the
+    list of their values, in the order of :func:`_generate_weighted_edges`
+    for every format without repeated entries.
+
+    """
+    import numpy as np
+
+    if A.format == "csr":
+        row = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        col = A.indices
+    elif A.format == "csc":
+        row = A.indices
+        col = np.repeat(np.arange(A.shape[1]), np.diff(A.indptr))
+    else:
+        A = A.tocoo()
+        row, col = A.row, A.col
+    return row, col, A.data.tolist()
+
+
+def _update_grouped(adj, nodes, keys, nbrs, datadicts):
+    """Adds ``nodes[nbrs[i]]: datadicts[i]`` to ``adj[nodes[keys[i]]]`` for
+    every entry `i`, one dict update per key node.
+
+    Entries are grouped with a stable sort, so a repeated entry keeps its
+    last value just like sequential insertion would.
+
+    """
+    import numpy as np
+
+    order = np.argsort(keys, kind="stable")
+    starts = np.searchsorted(keys[order], np.arange(len(nodes) + 1)).tolist()
+    nbr_nodes = list(map(nodes.__getitem__, nbrs[order].tolist()))
+    nbr_data = list(map(datadicts.__getitem__, order.tolist()))
+    for u, start, stop in zip(nodes, starts, starts[1:]):
+        if start != stop:
+            adj[u].update(zip(nbr_nodes[start:stop], nbr_data[start:stop]))
+
+
 def to_numpy_array(
     G,
     nodelist=None,
@@ -1474,7 +1608,7 @@ def to_numpy_array(
                 "Structured arrays are not supported for MultiGraphs"
             )
         d = defaultdict(list)
-        for u, v, wt in G.edges(data=weight, default=1.0):
+        for u, v, wt in G.edges(data=weight, default=1.0, wrap=False):
             d[(idx[u], idx[v])].append(wt)
         i, j = np.array(list(d.keys())).T  # indices
         wts = [multigraph_weight(ws) for ws in d.values()]  # reduced weights
@@ -1484,7 +1618,7 @@ def to_numpy_array(
         # Special branch: multi-attr adjacency from structured dtypes
         if edge_attrs:
             # Extract edges with all data
-            for u, v, data in G.edges(data=True):
+            for u, v, data in G.edges(data=True, wrap=False):
                 i.append(idx[u])
                 j.append(idx[v])
                 wts.append(data)
@@ -1497,7 +1631,7 @@ def to_numpy_array(
                     A[attr][j, i] = attr_data
             return A
 
-        for u, v, wt in G.edges(data=weight, default=1.0):
+        for u, v, wt in G.edges(data=weight, default=1.0, wrap=False):
             i.append(idx[u])
             j.append(idx[v])
             wts.append(wt)
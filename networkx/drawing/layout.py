@@ -355,6 +355,7 @@ def spring_layout(
     center=None,
     dim=2,
     seed=None,
+    method="auto",
 ):
     """Position nodes using Fruchterman-Reingold force-directed algorithm.
 
@@ -424,11 +425,47 @@ def spring_layout(
         if None, the random number generator is the RandomState instance used
         by numpy.random.
 
+    method : string (default: "auto")
+        The algorithm, one of
+
+        - "force": the forces between all pairs of nodes are computed on
+          every iteration, which takes time quadratic in the number of nodes.
+        - "multilevel": the graph is coarsened repeatedly by merging
+          neighboring nodes, and the layout of each coarser graph is the
+          starting point for the next finer one. The repulsive forces are
+          approximated with a Barnes-Hut tree [1]_, so an iteration takes
+          O(n log n + m) time, and `iterations` applies to each level.
+          This scales to graphs with millions of nodes.
+        - "auto": "multilevel" for graphs with at least 5000 nodes,
+          otherwise "force".
+
     Returns
     -------
     pos : dict
         A dictionary of positions keyed by node
 
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the above.
+
+    Notes
+    -----
+    The multilevel method follows [2]_: at every level pairs of neighboring
+    nodes joined by heavy edges are merged, and nodes that are left over
+    join the cluster of a neighbor. Fixed nodes are never merged, so they
+    keep their positions on all levels. A merged node repels the others
+    with the combined force of the nodes it stands for.
+
+    References
+    ----------
+    .. [1] J. Barnes and P. Hut:
+       A hierarchical O(N log N) force-calculation algorithm.
+       Nature 324, 446-449, 1986.
+    .. [2] C. Walshaw:
+       A multilevel algorithm for force-directed graph drawing.
+       Journal of Graph Algorithms and Applications 7(3), 253-285, 2003.
+
     Examples
     --------
     >>> G = nx.path_graph(4)
@@ -439,6 +476,8 @@ def spring_layout(
     """
     import numpy as np
 
+    if method not in ("auto", "force", "multilevel"):
+        raise ValueError(f"Unknown method {method!r}")
     G, center = _process_params(G, center, dim)
 
     if fixed is not None:
@@ -469,27 +508,38 @@ def spring_layout(
     if len(G) == 1:
         return {nx.utils.arbitrary_element(G.nodes()): center}
 
-    try:
-        # Sparse matrix
-        if len(G) < 500:  # sparse solver for large graphs
-            raise ValueError
-        A = nx.to_scipy_sparse_array(G, weight=weight, dtype="f")
-        if k is None and fixed is not None:
-            # We must adjust k by domain size for layouts not near 1x1
-            nnodes, _ = A.shape
-            k = dom_size / np.sqrt(nnodes)
-        pos = _sparse_fruchterman_reingold(
-            A, k, pos_arr, fixed, iterations, threshold, dim, seed
-        )
-    except ValueError:
-        A = nx.to_numpy_array(G, weight=weight)
+    if method == "auto":
+        method = "multilevel" if len(G) >= 5000 else "force"
+    if method == "multilevel":
+        A = nx.to_scipy_sparse_array(G, weight=weight, dtype="d")
         if k is None and fixed is not None:
             # We must adjust k by domain size for layouts not near 1x1
-            nnodes, _ = A.shape
-            k = dom_size / np.sqrt(nnodes)
-        pos = _fruchterman_reingold(
+            k = dom_size / np.sqrt(len(G))
+        pos = _multilevel_fruchterman_reingold(
             A, k, pos_arr, fixed, iterations, threshold, dim, seed
         )
+    else:
+        try:
+            # Sparse matrix
+            if len(G) < 500:  # sparse solver for large graphs
+                raise ValueError
+            A = nx.to_scipy_sparse_array(G, weight=weight, dtype="f")
+            if k is None and fixed is not None:
+                # We must adjust k by domain size for layouts not near 1x1
+                nnodes, _ = A.shape
+                k = dom_size / np.sqrt(nnodes)
+            pos = _sparse_fruchterman_reingold(
+                A, k, pos_arr, fixed, iterations, threshold, dim, seed
+            )
+        except ValueError:
+            A = nx.to_numpy_array(G, weight=weight)
+            if k is None and fixed is not None:
+                # We must adjust k by domain size for layouts not near 1x1
+                nnodes, _ = A.shape
+                k = dom_size / np.sqrt(nnodes)
+            pos = _fruchterman_reingold(
+                A, k, pos_arr, fixed, iterations, threshold, dim, seed
+            )
     if fixed is None and scale is not None:
         pos = rescale_layout(pos, scale=scale) + center
     pos = dict(zip(G, pos))
@@ -635,8 +685,286 @@ def _sparse_fruchterman_reingold(
     return pos
 
 
+@np_random_state(7)
+def _multilevel_fruchterman_reingold(
+    A, k=None, pos=None, fixed=None, iterations=50, threshold=1e-4, dim=2, seed=None
+):
+    # Position nodes in adjacency matrix A using Fruchterman-Reingold on a
+    # hierarchy of coarsened graphs, with the repulsive forces approximated
+    # by a Barnes-Hut tree.
+    # Entry point for NetworkX graph is fruchterman_reingold_layout()
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+
+    try:
+        nnodes, _ = A.shape
+    except AttributeError as err:
+        msg = "fruchterman_reingold() takes an adjacency matrix as input"
+        raise nx.NetworkXError(msg) from err
+    A = sp.sparse.csr_array(A, dtype=float)
+    A.setdiag(0)
+    A.eliminate_zeros()
+
+    is_fixed = np.zeros(nnodes, dtype=bool)
+    if fixed is not None:
+        is_fixed[fixed] = True
+    if pos is not None:
+        pos = pos.astype(float)
+    # optimal distance between nodes
+    if k is None:
+        k = np.sqrt(1.0 / nnodes)
+
+    # coarsen until the graph is small or stops shrinking
+    mass = np.ones(nnodes)
+    levels = [(A, mass, is_fixed, pos)]
+    labels = []
+    while A.shape[0] > _COARSEST_LEVEL:
+        n = A.shape[0]
+        label, nc = _coarsen(A + A.T, is_fixed, seed)
+        if nc > 0.8 * n:
+            break
+        P = sp.sparse.csr_array((np.ones(n), (np.arange(n), label)), shape=(n, nc))
+        A = (P.T @ A @ P).tocsr()
+        A.setdiag(0)
+        A.eliminate_zeros()
+        is_fixed = np.bincount(label, is_fixed, minlength=nc) > 0
+        if pos is not None:
+            # the initial positions are the centers of mass of the clusters
+            pos = np.column_stack(
+                [np.bincount(label, mass * x, minlength=nc) for x in pos.T]
+            )
+        mass = np.bincount(label, mass, minlength=nc)
+        if pos is not None:
+            pos /= mass[:, None]
+        levels.append((A, mass, is_fixed, pos))
+        labels.append(label)
+
+    A, mass, is_fixed, pos = levels[-1]
+    if pos is None:
+        # random initial positions
+        pos = seed.rand(A.shape[0], dim)
+    # the initial "temperature" is about .1 of domain area (=1x1)
+    # this is the largest step allowed in the dynamics.
+    extent = max(np.ptp(pos, axis=0).max(), k)
+    t = 0.1 * extent
+    for level in range(len(levels) - 1, -1, -1):
+        A, mass, is_fixed, init = levels[level]
+        n = A.shape[0]
+        if level < len(levels) - 1:
+            # place the nodes of each cluster around its position
+            pos = pos[labels[level]]
+            pos += seed.uniform(-0.5 * k, 0.5 * k, pos.shape)
+            # finer levels only need to settle the nodes locally
+            t = max(0.1 * extent * (len(levels[-1][1]) / n) ** (1 / dim), 2 * k)
+        if init is not None:
+            pos[is_fixed] = init[is_fixed]
+        # large levels start close to equilibrium and need fewer iterations
+        its = min(iterations, max(int(iterations * (1000 / n) ** 0.5), 5))
+        pos = _force_directed(A, mass, pos, is_fixed, k, t, its, threshold * extent)
+    return pos
+
+
+# graphs with at most this many nodes are not coarsened further
+_COARSEST_LEVEL = 50
+
+
+def _coarsen(A, fixed, seed):
+    # Group the nodes of the symmetric sparse matrix A into clusters of two
+    # or more nodes, joined by heavy edges where possible.
+    # Returns the cluster of each node and the number of clusters.
+    import numpy as np
+
+    n = A.shape[0]
+    indptr, indices = A.indptr, A.indices
+    rows = np.repeat(np.arange(n), np.diff(indptr))
+    # random edge priorities, the same in both directions of an edge
+    u = np.minimum(rows, indices).astype(np.uint64)
+    v = np.maximum(rows, indices).astype(np.uint64)
+    h = u * np.uint64(0x9E3779B97F4A7C15) ^ v * np.uint64(0xC2B2AE3D27D4EB4F)
+    h ^= np.uint64(seed.randint(2**31))
+    h ^= h >> np.uint64(31)
+    h *= np.uint64(0xBF58476D1CE4E5B9)
+    h ^= h >> np.uint64(29)
+    priority = np.abs(A.data) * (1 + (h >> np.uint64(11)) * 2.0**-53)
+
+    def best_neighbor(valid):
+        # the valid edge with the highest priority out of each node, or -1
+        best = np.full(n, -1)
+        edges = np.flatnonzero(valid)
+        if len(edges):
+            key = np.lexsort((-priority[edges], rows[edges]))
+            edges = edges[key]
+            first = np.r_[True, rows[edges[1:]] != rows[edges[:-1]]]
+            best[rows[edges[first]]] = indices[edges[first]]
+        return best
+
+    # a maximal-ish matching: nodes that choose each other are matched
+    free = ~fixed.copy()
+    match = np.full(n, -1)
+    nodes = np.arange(n)
+    for _ in range(4):
+        choice = best_neighbor(free[rows] & free[indices])
+        mutual = choice >= 0
+        mutual[mutual] = choice[choice[mutual]] == nodes[mutual]
+        if not mutual.any():
+            break
+        match[mutual] = choice[mutual]
+        free[mutual] = False
+    matched = match >= 0
+    label = np.where(matched, np.minimum(nodes, match), nodes)
+    # nodes left over join the cluster of a matched neighbor
+    choice = best_neighbor(free[rows] & matched[indices])
+    join = choice >= 0
+    label[join] = label[choice[join]]
+    _, label = np.unique(label, return_inverse=True)
+    return label, label.max() + 1
+
+
+def _force_directed(A, mass, pos, fixed, k, t, iterations, threshold):
+    # Fruchterman-Reingold iterations on sparse A where node j repels with
+    # the force of mass[j] nodes, starting from temperature t.
+    import numpy as np
+
+    n, dim = pos.shape
+    rows = np.repeat(np.arange(n), np.diff(A.indptr))
+    cols = A.indices
+    # simple cooling scheme.
+    # linearly step down by dt on each iteration so last iteration is size dt.
+    dt = t / (iterations + 1)
+    for iteration in range(iterations):
+        displacement = _repulsion(pos, mass, k)
+        # attraction along the edges
+        delta = pos[cols] - pos[rows]
+        distance = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        delta *= (A.data * distance / k)[:, None]
+        for d in range(dim):
+            displacement[:, d] += np.bincount(rows, delta[:, d], minlength=n)
+        # update positions, moving each node by at most t
+        length = np.sqrt(np.einsum("ij,ij->i", displacement, displacement))
+        np.clip(length, 1e-12, None, out=length)
+        delta_pos = displacement * (np.minimum(length, t) / length)[:, None]
+        delta_pos[fixed] = 0.0
+        pos += delta_pos
+        # cool temperature
+        t -= dt
+        if np.linalg.norm(delta_pos) / np.sqrt(n) < threshold:
+            break
+    return pos
+
+
+def _repulsion(pos, mass, k, theta=1.2, chunk=50000):
+    # The repulsive displacements sum(mass[j] * k**2 * delta_ij / |delta_ij|**2)
+    # over j != i with delta_ij = pos[i] - pos[j], approximated by a
+    # Barnes-Hut tree: a cell far enough from a node acts on it as a single
+    # mass at its center of mass.
+    import numpy as np
+
+    n, dim = pos.shape
+    # enforce minimum distance of 0.01 * k
+    min_d2 = (0.01 * k) ** 2
+    displacement = np.zeros((n, dim))
+
+    def add(node, delta, m, d2, start):
+        f = m / np.maximum(d2, min_d2)
+        for d in range(dim):
+            w = delta[:, d] * f
+            displacement[start : start + chunk, d] += np.bincount(
+                node - start, w, minlength=min(chunk, n - start)
+            )
+
+    if n <= 1000:
+        # exact, blockwise
+        for start in range(0, n, chunk):
+            block = pos[start : start + chunk]
+            delta = block[:, None, :] - pos[None, :, :]
+            d2 = np.maximum(np.einsum("ijk,ijk->ij", delta, delta), min_d2)
+            f = mass[None, :] / d2
+            f[np.arange(len(block)), np.arange(start, start + len(block))] = 0
+            displacement[start : start + chunk] = np.einsum("ijk,ij->ik", delta, f)
+        return displacement * k * k
+
+    # the cells of a 2**dim-ary tree of depth levels, as Morton codes
+    lo = pos.min(axis=0)
+    side = np.ptp(pos, axis=0).max() or 1.0
+    depth = min(int(np.ceil(np.log2(n) / dim)) + 1, 62 // dim)
+    cell = ((pos - lo) * ((1 << depth) / side)).astype(np.int64)
+    np.clip(cell, 0, (1 << depth) - 1, out=cell)
+    code = np.zeros(n, dtype=np.int64)
+    for b in range(depth):
+        for d in range(dim):
+            code |= ((cell[:, d] >> b) & 1) << (b * dim + d)
+    # work in the order of the codes, in which the nodes of each cell are
+    # consecutive and nearby nodes are close
+    order = np.argsort(code, kind="stable")
+    code = code[order]
+    pos = pos[order]
+    mass = mass[order]
+    moment = pos * mass[:, None]
+    # for each level: center and mass of each cell, the cell of each node,
+    # and the range of children of each cell in the next level
+    tree = []
+    for level in range(1, depth + 1):
+        key = code >> (dim * (depth - level))
+        new = np.r_[True, key[1:] != key[:-1]]
+        start = np.flatnonzero(new)
+        m = np.add.reduceat(mass, start)
+        center = np.add.reduceat(moment, start) / m[:, None]
+        tree.append([key[start], m, center, np.cumsum(new) - 1])
+    for level in range(depth - 1):
+        parent = tree[level + 1][0] >> dim
+        keys = tree[level][0]
+        tree[level].append(np.searchsorted(parent, keys, "left"))
+        tree[level].append(np.searchsorted(parent, keys, "right"))
+
+    theta2 = theta * theta
+    ncells = len(tree[0][0])
+    for start in range(0, n, chunk):
+        nodes = np.arange(start, min(start + chunk, n))
+        node = np.repeat(nodes, ncells)
+        c = np.tile(np.arange(ncells), len(nodes))
+        for level in range(depth):
+            _, m, center, node_cell = tree[level][:4]
+            delta = pos[node] - center[c]
+            d2 = np.einsum("ij,ij->i", delta, delta)
+            own = node_cell[node] == c
+            if level == depth - 1:
+                # leaves: act on the node with all other nodes in its cell
+                far = ~own
+                rest = m[c[own]] - mass[node[own]]
+                inner = rest > 0
+                i = node[own][inner]
+                other = m[c[own]][inner, None] * center[c[own]][inner]
+                other = (other - mass[i, None] * pos[i]) / rest[inner, None]
+                d = pos[i] - other
+                add(i, d, rest[inner], np.einsum("ij,ij->i", d, d), start)
+            else:
+                width = side / (1 << (level + 1))
+                far = ~own & (width * width < theta2 * d2)
+            add(node[far], delta[far], m[c[far]], d2[far], start)
+            if level == depth - 1:
+                break
+            # open the near cells
+            node, c = node[~far], c[~far]
+            first, last = tree[level][4][c], tree[level][5][c]
+            counts = last - first
+            node = np.repeat(node, counts)
+            offset = np.repeat(np.cumsum(counts) - counts, counts)
+            c = np.repeat(first, counts) + (np.arange(len(node)) - offset)
+    displacement[order] = displacement.copy()
+    return displacement * k * k
+
+
 def kamada_kawai_layout(
-    G, dist=None, pos=None, weight="weight", scale=1, center=None, dim=2
+    G,
+    dist=None,
+    pos=None,
+    weight="weight",
+    scale=1,
+    center=None,
+    dim=2,
+    method="auto",
+    pivots=100,
 ):
     """Position nodes using Kamada-Kawai path-length cost-function.
 
@@ -668,11 +996,54 @@ def kamada_kawai_layout(
     dim : int
         Dimension of layout.
 
+    method : string (default: "auto")
+        The algorithm, one of
+
+        - "dense": the Kamada-Kawai cost function over all pairs of nodes
+          is minimized, which takes memory and time quadratic in the
+          number of nodes.
+        - "sparse": the sparse stress model [1]_ is minimized by stress
+          majorization. Its terms are the edges and the distances of every
+          node to `pivots` pivot nodes, so it takes O(pivots * n + m)
+          memory and time per iteration. If `pos` is None, the initial
+          positions are computed by pivot MDS [2]_.
+        - "auto": "sparse" for graphs with at least 1000 nodes, otherwise
+          "dense".
+
+    pivots : int (default: 100)
+        The number of pivot nodes for the sparse method. More pivots give
+        layouts closer to those of the dense method.
+
     Returns
     -------
     pos : dict
         A dictionary of positions keyed by node
 
+    Raises
+    ------
+    ValueError
+        If `method` is not one of the above.
+
+    Notes
+    -----
+    The sparse method chooses the pivots one after the other as the node
+    farthest from the pivots chosen so far. A pivot stands in for the nodes
+    for which it is the nearest pivot, so the term for the distance of a
+    node to a pivot is weighted by the number of those nodes that are
+    closer to the pivot than to the node. The sparse method treats
+    directed graphs as undirected and places nodes in different
+    components about as far apart as the two farthest nodes of a
+    component.
+
+    References
+    ----------
+    .. [1] M. Ortmann, M. Klimenta and U. Brandes:
+       A sparse stress model.
+       Journal of Graph Algorithms and Applications 21(5), 791-821, 2017.
+    .. [2] U. Brandes and C. Pich:
+       Eigensolver methods for progressive multidimensional scaling of
+       large data. Graph Drawing 2006, LNCS 4372, 42-53, 2007.
+
     Examples
     --------
     >>> G = nx.path_graph(4)
@@ -680,10 +1051,19 @@ def kamada_kawai_layout(
     """
     import numpy as np
 
+    if method not in ("auto", "dense", "sparse"):
+        raise ValueError(f"Unknown method {method!r}")
     G, center = _process_params(G, center, dim)
     nNodes = len(G)
     if nNodes == 0:
         return {}
+    if method == "auto":
+        method = "sparse" if nNodes >= 1000 else "dense"
+    if method == "sparse":
+        pos_arr = None if pos is None else np.array([pos[n] for n in G])
+        pos = _sparse_stress(G, dist, pos_arr, weight, dim, pivots)
+        pos = rescale_layout(pos, scale=scale) + center
+        return dict(zip(G, pos))
 
     if dist is None:
         dist = dict(nx.shortest_path_length(G, weight=weight))
@@ -760,6 +1140,114 @@ def _kamada_kawai_costfn(pos_vec, np, invdist, meanweight, dim):
     return (cost, grad.ravel())
 
 
+def _sparse_stress(G, dist, pos, weight, dim, pivots, iterations=100, tol=1e-4):
+    # Stress majorization with the terms of the sparse stress model: the
+    # edges, and the distances from each node to a set of pivot nodes that
+    # stand in for the nodes close to them.
+    import numpy as np
+    import scipy as sp
+    import scipy.sparse  # call as sp.sparse
+    import scipy.sparse.csgraph  # call as sp.sparse.csgraph
+
+    nodes = list(G)
+    n = len(nodes)
+    index = {v: i for i, v in enumerate(nodes)}
+    # the ideal length of each edge, the shortest of parallel edges
+    edges = {}
+    for u, v, d in G.edges(data=True):
+        i, j = sorted((index[u], index[v]))
+        if i == j:
+            continue
+        if dist is not None:
+            length = min(dist[u].get(v, np.inf), dist[v].get(u, np.inf))
+        else:
+            length = 1 if weight is None else d.get(weight, 1)
+        edges[i, j] = min(length, edges.get((i, j), np.inf))
+    # csgraph needs 32 bit indices
+    u, v = np.array(list(edges), dtype=np.int32).reshape(-1, 2).T
+    length = np.array(list(edges.values()), dtype=float)
+    A = sp.sparse.csr_array((length, (u, v)), shape=(n, n))
+    # edges of length zero only count for the distances
+    u, v, length = u[length > 0], v[length > 0], length[length > 0]
+
+    def distances(i):
+        if dist is None:
+            return sp.sparse.csgraph.dijkstra(A, directed=False, indices=i)
+        row = dist.get(nodes[i], {})
+        return np.array([row.get(v, np.inf) for v in nodes], dtype=float)
+
+    # pivots are chosen one after the other as the node farthest from the
+    # pivots so far; nodes in components without a pivot come first
+    k = min(pivots, n)
+    pivot = np.zeros(k, dtype=int)
+    D = np.empty((k, n))
+    gap = np.full(n, np.inf)
+    for p in range(k):
+        D[p] = distances(pivot[p])
+        np.minimum(gap, D[p], out=gap)
+        if p + 1 < k:
+            pivot[p + 1] = np.argmax(gap)
+    # pairs of nodes in different components are placed about as far
+    # apart as the farthest pair of nodes in a component
+    finite = np.isfinite(D)
+    far = D[finite].max() if finite.any() else 1
+    D[~finite] = far or 1
+
+    if pos is None:
+        # pivot MDS: the coordinates are the projections of the double
+        # centered squared distances to the pivots on their main axes
+        C = D**2
+        C -= C.mean(axis=0)
+        C -= C.mean(axis=1)[:, None]
+        C *= -0.5
+        _, vecs = np.linalg.eigh(C @ C.T)
+        pos = C.T @ vecs[:, ::-1][:, :dim]
+        if pos.shape[1] < dim:
+            pos = np.hstack([pos, np.zeros((n, dim - pos.shape[1]))])
+    pos = pos.astype(float)
+
+    # a pivot stands in for the nodes in its region (the nodes for which it
+    # is the nearest pivot) that are closer to it than to the node
+    region = np.argmin(D, axis=0)
+    W = np.zeros((k, n))
+    for p in range(k):
+        r = np.sort(D[p, region == p])
+        close = D[p] > 0
+        W[p, close] = np.searchsorted(r, D[p, close] / 2, "right") / D[p, close] ** 2
+    edge_weight = length**-2.0
+    weight_sum = W.sum(axis=0)
+    weight_sum += np.bincount(u, edge_weight, n) + np.bincount(v, edge_weight, n)
+    weight_sum[weight_sum == 0] = 1
+
+    # each node moves to where its terms would be satisfied on average
+    for _ in range(iterations):
+        new = np.zeros((n, dim))
+        for p in range(k):
+            delta = pos - pos[pivot[p]]
+            norm = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+            norm[norm == 0] = 1
+            delta *= (W[p] * D[p] / norm)[:, None]
+            delta += W[p][:, None] * pos[pivot[p]]
+            new += delta
+        delta = pos[u] - pos[v]
+        norm = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        norm[norm == 0] = 1
+        delta *= (edge_weight * length / norm)[:, None]
+        for d in range(dim):
+            new[:, d] += np.bincount(
+                u, edge_weight * pos[v, d] + delta[:, d], minlength=n
+            )
+            new[:, d] += np.bincount(
+                v, edge_weight * pos[u, d] - delta[:, d], minlength=n
+            )
+        new /= weight_sum[:, None]
+        change = np.linalg.norm(new - pos) / (np.linalg.norm(pos) or 1)
+        pos = new
+        if change < tol:
+            break
+    return pos
+
+
 def spectral_layout(G, weight="weight", scale=1, center=None, dim=2):
     """Position nodes using the eigenvectors of the graph Laplacian.
 
@@ -186,6 +186,64 @@ class TestLayout:
         for axis in range(2):
             assert pos[(0, 0)][axis] == pytest.approx(npos[(0, 0)][axis], abs=1e-7)
 
+    def test_spring_multilevel(self):
+        G = nx.grid_2d_graph(20, 20)
+        pos = nx.spring_layout(G, method="multilevel", seed=42)
+        arr = np.array(list(pos.values()))
+        again = nx.spring_layout(G, method="multilevel", seed=42)
+        assert (arr == np.array(list(again.values()))).all()
+        assert np.abs(arr).max() == pytest.approx(1)
+        # the grid is unfolded: neighbors are much closer than average
+        edge = np.mean([np.linalg.norm(pos[u] - pos[v]) for u, v in G.edges])
+        assert edge < 0.1 * np.mean(np.linalg.norm(arr[:, None] - arr, axis=-1))
+        for dim in (1, 3):
+            pos = nx.spring_layout(self.Gi, method="multilevel", dim=dim, seed=42)
+            assert pos[(0, 0)].shape == (dim,)
+
+    def test_spring_multilevel_init_pos_and_fixed(self):
+        # directed edges and isolated nodes
+        G = nx.DiGraph(nx.convert_node_labels_to_integers(self.bigG).edges)
+        G.add_nodes_from(range(625, 635))
+        pos = nx.circular_layout(G)
+        fixed = [0, 1, 2, 630]
+        npos = nx.spring_layout(G, pos=pos, fixed=fixed, method="multilevel", seed=1)
+        for v in fixed:
+            assert tuple(npos[v]) == tuple(pos[v])
+        assert np.ptp(np.array(list(npos.values()))) > 1e-3
+        pytest.raises(ValueError, nx.spring_layout, G, method="spring")
+
+    def test_barnes_hut_repulsion(self):
+        from networkx.drawing.layout import _repulsion
+
+        rng = np.random.RandomState(42)
+        pos = rng.rand(2000, 2)
+        pos[:500] *= 0.1
+        mass = rng.randint(1, 4, 2000).astype(float)
+        k = 0.02
+        delta = pos[:, None] - pos
+        d2 = np.maximum((delta**2).sum(axis=-1), (0.01 * k) ** 2)
+        np.fill_diagonal(d2, np.inf)
+        exact = np.einsum("ijk,ij->ik", delta, mass / d2) * k * k
+        approx = _repulsion(pos, mass, k)
+        error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(error) < 0.05
+
+    def test_coarsen(self):
+        from networkx.drawing.layout import _coarsen
+
+        G = nx.star_graph(5)
+        G.add_edges_from([(6, 7), (7, 8), (8, 9), (9, 6), (10, 11)])
+        G.add_node(12)
+        A = nx.to_scipy_sparse_array(G, nodelist=range(13))
+        fixed = np.zeros(13, dtype=bool)
+        fixed[10] = True
+        label, n = _coarsen(A, fixed, np.random.RandomState(42))
+        assert n == len(set(label))
+        # the star is one cluster, fixed and isolated nodes are on their own
+        assert len(set(label[:6])) == 1
+        assert len(set(label[6:10])) == 2
+        assert n == 6
+
     def test_center_parameter(self):
         G = nx.path_graph(1)
         nx.random_layout(G, center=(1, 1))
@@ -295,6 +353,46 @@ class TestLayout:
 
         pytest.raises(ValueError, nx.multipartite_layout, G, align="foo")
 
+    def test_kamada_kawai_sparse(self):
+        def stress(pos):
+            nodes = list(G)
+            D = nx.floyd_warshall_numpy(G, nodelist=nodes)
+            X = np.array([pos[v] for v in nodes])
+            i, j = np.triu_indices(len(G), 1)
+            e, d = np.linalg.norm(X[i] - X[j], axis=1), D[i, j]
+            s = (e / d).sum() / ((e / d) ** 2).sum()
+            return np.mean((s * e - d) ** 2 / d**2)
+
+        G = nx.grid_2d_graph(12, 12)
+        dense = nx.kamada_kawai_layout(G, method="dense")
+        sparse = nx.kamada_kawai_layout(G, method="sparse", pivots=20)
+        assert stress(sparse) < 1.1 * stress(dense)
+        assert np.abs(np.array(list(sparse.values()))).max() == pytest.approx(1)
+        # the given distances and initial positions are used
+        dist = dict(nx.shortest_path_length(G))
+        pos = nx.kamada_kawai_layout(G, dist=dist, pos=sparse, method="sparse")
+        assert stress(pos) < 1.1 * stress(dense)
+        for dim in (1, 3):
+            pos = nx.kamada_kawai_layout(G, method="sparse", dim=dim)
+            assert pos[(0, 0)].shape == (dim,)
+        pytest.raises(ValueError, nx.kamada_kawai_layout, G, method="stress")
+
+    def test_kamada_kawai_sparse_graph_types(self):
+        G = nx.MultiDiGraph(nx.cycle_graph(6))
+        G.add_edge(0, 3, weight=0.5)
+        G.add_edge(0, 3, weight=5)
+        G.add_edge(6, 7)
+        G.add_nodes_from([8, 9])
+        G.add_edge(8, 8)
+        pos = nx.kamada_kawai_layout(G, method="sparse")
+        assert len(pos) == 10
+        assert all(np.isfinite(p).all() for p in pos.values())
+        # the shortest of the parallel edges
+        assert np.linalg.norm(pos[0] - pos[3]) < np.linalg.norm(pos[0] - pos[2])
+        assert nx.kamada_kawai_layout(nx.empty_graph(1), method="sparse") == {
+            0: pytest.approx([0, 0])
+        }
+
     def test_kamada_kawai_costfn_1d(self):
         costfn = nx.drawing.layout._kamada_kawai_costfn
 
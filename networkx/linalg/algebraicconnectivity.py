@@ -109,18 +109,24 @@ def _preprocess_graph(G, weight):
         H = nx.MultiGraph()
         H.add_nodes_from(G)
         H.add_weighted_edges_from(
-            ((u, v, e.get(weight, 1.0)) for u, v, e in G.edges(data=True) if u != v),
+            (
+                (u, v, e.get(weight, 1.0))
+                for u, v, e in G.edges(data=True, wrap=False)
+                if u != v
+            ),
             weight=weight,
         )
         G = H
     if not G.is_multigraph():
         edges = (
-            (u, v, abs(e.get(weight, 1.0))) for u, v, e in G.edges(data=True) if u != v
+            (u, v, abs(e.get(weight, 1.0)))
+            for u, v, e in G.edges(data=True, wrap=False)
+            if u != v
         )
     else:
         edges = (
             (u, v, sum(abs(e.get(weight, 1.0)) for e in G[u][v].values()))
-            for u, v in G.edges()
+            for u, v in G.edges(wrap=False)
             if u != v
         )
     H = nx.Graph()
@@ -48,6 +48,7 @@ from networkx.readwrite.adjlist import *
 from networkx.readwrite.multiline_adjlist import *
 from networkx.readwrite.edgelist import *
 from networkx.readwrite.gpickle import *
+from networkx.readwrite.binary import *
 from networkx.readwrite.pajek import *
 from networkx.readwrite.leda import *
 from networkx.readwrite.sparse6 import *
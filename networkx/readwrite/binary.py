@@ -0,0 +1,298 @@
+"""
+*************
+Binary Graphs
+*************
+Read and write graphs in a memory-mappable binary format.
+
+The binary format stores the arrays of a :class:`~networkx.CSRGraph` or
+:class:`~networkx.CSRDiGraph` (the node table, the CSR offsets and
+neighbor indices, and one typed column per node or edge attribute) as raw
+little-endian arrays. `read_binary` maps the file into memory with
+:class:`numpy.memmap` instead of parsing it, so opening even a very large
+graph takes little more than building the node table, and the edge data
+is only read from disk when it is used.
+
+Requires NumPy.
+
+Format
+------
+A file starts with the 8 bytes ``b"NXGRAPH\\x00"``, followed by the length
+of a UTF-8 JSON header as an unsigned 64-bit little-endian integer, and
+the header itself. The header describes the graph (directedness, graph
+attributes, how nodes are stored) and gives the dtype, shape and offset of
+every array. The arrays follow the header, each aligned to 64 bytes;
+offsets are counted from the end of the header padding.
+
+Nodes must be all integers or all strings. Integer nodes are stored as one
+``int64`` array. String nodes, and string valued attributes, are stored as
+a table of UTF-8 byte offsets and a blob of the concatenated bytes.
+Numeric and boolean attributes are stored as arrays of their own dtype,
+with a boolean mask when not every node or edge has the attribute. Graph
+attributes are stored in the header and must be JSON serializable.
+"""
+import json
+import struct
+
+import networkx as nx
+from networkx.utils import not_implemented_for, open_file
+
+__all__ = ["read_binary", "write_binary"]
+
+_MAGIC = b"NXGRAPH\x00"
+_VERSION = 1
+_ALIGN = 64
+
+
+def _string_table(strings):
+    """Returns the UTF-8 byte offsets and blob of a sequence of strings."""
+    import numpy as np
+
+    encoded = [str.encode(s) for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _strings(offsets, blob):
+    """Returns the list of strings of a string table."""
+    data = blob.tobytes()
+    bounds = offsets.tolist()
+    return [data[i:j].decode() for i, j in zip(bounds[:-1], bounds[1:])]
+
+
+class _Writer:
+    """Collects named arrays and their header entries."""
+
+    def __init__(self):
+        self.arrays = []
+        self.specs = {}
+        self.size = 0
+
+    def add(self, name, arr):
+        import numpy as np
+
+        arr = np.ascontiguousarray(arr)
+        arr = arr.astype(arr.dtype.newbyteorder("<"), copy=False)
+        self.specs[name] = {
+            "dtype": arr.dtype.str,
+            "shape": len(arr),
+            "offset": self.size,
+        }
+        self.arrays.append(arr)
+        self.size += -(-arr.nbytes // _ALIGN) * _ALIGN
+        return name
+
+    def add_column(self, name, attr, column, what):
+        values, present = column
+        spec = {"present": None}
+        if present is not None:
+            spec["present"] = self.add(f"{name}.present", present)
+        if values.dtype.kind in "biufc":
+            spec["values"] = self.add(name, values)
+            return spec
+        if present is not None:
+            values = values[present]
+        if not all(isinstance(v, str) for v in values):
+            raise nx.NetworkXError(
+                f"{what} attribute {attr!r} must be numeric or a string"
+            )
+        offsets, blob = _string_table(values)
+        spec["offsets"] = self.add(f"{name}.offsets", offsets)
+        spec["values"] = self.add(name, blob)
+        return spec
+
+    def write(self, header, fh):
+        start = len(_MAGIC) + 8 + len(header)
+        padding = -start % _ALIGN
+        fh.write(_MAGIC)
+        fh.write(struct.pack("<Q", len(header)))
+        fh.write(header)
+        fh.write(b"\x00" * padding)
+        for arr in self.arrays:
+            fh.write(arr.tobytes())
+            fh.write(b"\x00" * (-arr.nbytes % _ALIGN))
+
+
+@open_file(2, mode="wb")
+def _write_file(writer, header, path):
+    writer.write(header, path)
+
+
+@not_implemented_for("multigraph")
+def write_binary(G, path):
+    """Write a graph in the memory-mappable binary format.
+
+    Parameters
+    ----------
+    G : Graph or DiGraph
+       A NetworkX graph. Graphs other than `CSRGraph` and `CSRDiGraph` are
+       first converted to one of them.
+
+    path : file or string
+       File or filename to write. The file is read back with a memory map,
+       so it should not be compressed.
+
+    Raises
+    ------
+    NetworkXError
+        If the nodes are not all integers or all strings, if a node or edge
+        attribute has values other than numbers or strings, or if a graph
+        attribute is not JSON serializable.
+
+    NetworkXNotImplemented
+        If `G` is a multigraph.
+
+    See Also
+    --------
+    read_binary
+    CSRGraph
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary(G, "test.nxg")
+    """
+    import numpy as np
+
+    csr_class = nx.CSRDiGraph if G.is_directed() else nx.CSRGraph
+    if not isinstance(G, csr_class):
+        G = csr_class(G)
+
+    writer = _Writer()
+    nodes = G._nodes
+    if all(isinstance(n, int) and not isinstance(n, bool) for n in nodes):
+        try:
+            writer.add("nodes", np.array(nodes, dtype=np.int64))
+        except OverflowError as err:
+            raise nx.NetworkXError("integer nodes must fit in 64 bits") from err
+        node_kind = "int"
+    elif all(isinstance(n, str) for n in nodes):
+        offsets, blob = _string_table(nodes)
+        writer.add("nodes.offsets", offsets)
+        writer.add("nodes", blob)
+        node_kind = "str"
+    else:
+        raise nx.NetworkXError("nodes must be all integers or all strings")
+    writer.add("indptr", G._indptr)
+    writer.add("indices", G._indices)
+    if G._edge_ids is not None:
+        writer.add("edge_ids", G._edge_ids)
+
+    header = {
+        "version": _VERSION,
+        "directed": G.is_directed(),
+        "node_kind": node_kind,
+        "graph": G.graph,
+        "node_columns": {
+            attr: writer.add_column(f"node{i}", attr, column, "node")
+            for i, (attr, column) in enumerate(G._node_columns.items())
+        },
+        "edge_columns": {
+            attr: writer.add_column(f"edge{i}", attr, column, "edge")
+            for i, (attr, column) in enumerate(G._edge_columns.items())
+        },
+        "edge_ids": G._edge_ids is not None,
+    }
+    header["arrays"] = writer.specs
+    # the file is only opened once the graph is known to be writable
+    try:
+        header = json.dumps(header).encode()
+    except TypeError as err:
+        raise nx.NetworkXError(
+            f"graph attributes must be JSON serializable: {err}"
+        ) from err
+    _write_file(writer, header, path)
+
+
+@open_file(0, mode="rb")
+def read_binary(path):
+    """Read a graph in the memory-mappable binary format.
+
+    The file is mapped into memory with :class:`numpy.memmap`, and the
+    returned graph uses the mapped arrays directly. Only the node table is
+    loaded eagerly; edges and attributes are read from the file as they
+    are accessed.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.
+
+    Returns
+    -------
+    G : CSRGraph or CSRDiGraph
+       A read-only graph over the mapped arrays.
+
+    Raises
+    ------
+    NetworkXError
+        If the file is not in the binary graph format.
+
+    See Also
+    --------
+    write_binary
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary(G, "test.nxg")
+    >>> H = nx.read_binary("test.nxg")
+    >>> list(H.edges)
+    [(0, 1), (1, 2), (2, 3)]
+    """
+    import numpy as np
+
+    from networkx.classes.components import Node
+
+    try:
+        buf = np.memmap(path, dtype=np.uint8, mode="r")
+    except ValueError as err:
+        raise nx.NetworkXError("not a binary graph file") from err
+    prefix = len(_MAGIC) + 8
+    if len(buf) < prefix or bytes(buf[: len(_MAGIC)]) != _MAGIC:
+        raise nx.NetworkXError("not a binary graph file")
+    (length,) = struct.unpack("<Q", bytes(buf[len(_MAGIC) : prefix]))
+    header = json.loads(bytes(buf[prefix : prefix + length]).decode())
+    if header["version"] != _VERSION:
+        raise nx.NetworkXError(f"unsupported version {header['version']}")
+    start = prefix + length
+    start += -start % _ALIGN
+
+    def array(name):
+        spec = header["arrays"][name]
+        dtype = np.dtype(spec["dtype"])
+        offset = start + spec["offset"]
+        return buf[offset : offset + spec["shape"] * dtype.itemsize].view(dtype)
+
+    def column(spec):
+        present = None if spec["present"] is None else array(spec["present"])
+        values = array(spec["values"])
+        if "offsets" not in spec:
+            return values, present
+        strings = _strings(array(spec["offsets"]), values)
+        if present is None:
+            values = np.empty(len(strings), dtype=object)
+            values[:] = strings
+        else:
+            values = np.zeros(len(present), dtype=object)
+            values[present] = strings
+        return values, present
+
+    if header["node_kind"] == "int":
+        nodes = array("nodes").tolist()
+    else:
+        nodes = _strings(array("nodes.offsets"), array("nodes"))
+
+    cls = nx.CSRDiGraph if header["directed"] else nx.CSRGraph
+    G = cls.__new__(cls)
+    G.graph = G.graph_attr_dict_factory()
+    G.graph.update(header["graph"])
+    G._set_arrays(
+        [Node.wraps(n) for n in nodes],
+        array("indptr"),
+        array("indices"),
+        array("edge_ids") if header["edge_ids"] else None,
+        {name: column(spec) for name, spec in header["edge_columns"].items()},
+        {name: column(spec) for name, spec in header["node_columns"].items()},
+    )
+    return G
@@ -34,10 +34,22 @@ __all__ = [
     "read_edgelist",
     "read_weighted_edgelist",
     "write_weighted_edgelist",
+    "read_edgelist_batches",
 ]
 
+import os
+import re
+from itertools import islice
+from operator import methodcaller
+
 import networkx as nx
 from networkx.utils import open_file
+from networkx.utils.decorators import fopeners
+
+# number of lines parsed at a time
+_CHUNKSIZE = 100_000
+# the non-ASCII whitespace characters that str.split also splits on
+_UNICODE_SPACE = re.compile(r"[^\S\x00-\x7f]")
 
 
 def generate_edgelist(G, delimiter=" ", data=True):
@@ -235,9 +247,119 @@ def parse_edgelist(
     --------
     read_weighted_edgelist
     """
+    G = nx.empty_graph(0, create_using)
+    lines = iter(lines)
+    while True:
+        chunk = list(islice(lines, _CHUNKSIZE))
+        if not chunk:
+            return G
+        text = "\n".join(chunk)
+        trailing = sum(map(methodcaller("endswith", "\n"), chunk))
+        if text.count("\n") != len(chunk) - 1 + trailing:
+            # some line holds a newline of its own
+            text = None
+        G.add_edges_from(_parse_chunk(chunk, text, comments, delimiter, nodetype, data))
+
+
+def _parse_chunk(lines, text, comments, delimiter, nodetype, data):
+    """Returns an iterator over the edges `(u, v, edgedata)` in `lines`.
+
+    `text` holds the lines joined by newlines, or is None if that would not
+    keep the lines apart. Lines that all hold the same number of fields are
+    then split and converted column by column. Anything else, like comments,
+    dictionary edge data or parse errors, is parsed one line at a time.
+    """
+    if text is not None:
+        columns = _split_columns(text, comments, delimiter)
+        if columns is not None:
+            edges = _edges_from_columns(columns, nodetype, data)
+            if edges is not None:
+                return edges
+    return _parse_lines(lines, comments, delimiter, nodetype, data)
+
+
+def _split_columns(text, comments, delimiter):
+    """Returns the fields of the lines in `text` as a list of columns, or None.
+
+    All lines are tokenized in one go, and NumPy checks that every line
+    has the same number of fields. None is returned when NumPy is missing,
+    or the lines have comments, different numbers of fields, or characters
+    the byte-level check does not handle.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    if comments is not None and comments in text:
+        return None
+    if not text.isascii() and _UNICODE_SPACE.search(text):
+        return None
+    if delimiter is None:
+        buf = np.frombuffer(text.encode(), dtype=np.uint8)
+        # the ASCII whitespace of str.split
+        space = np.zeros(256, dtype=bool)
+        space[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+        space = space[buf]
+        starts = ~space
+        starts[1:] &= space[:-1]
+        newlines = np.flatnonzero(buf == 10)
+        line = np.searchsorted(newlines, np.flatnonzero(starts))
+        counts = np.bincount(line, minlength=len(newlines) + 1)
+        k = counts.max()
+        # blank lines have no fields and are skipped
+        if k < 2 or np.any((counts != 0) & (counts != k)):
+            return None
+        tokens = text.split()
+    else:
+        sep = delimiter.encode()
+        if len(sep) != 1 or sep == b"\n":
+            return None
+        # blank lines have no edge, and would shift the fields of the rest
+        text = "\n".join([s for s in map(str.strip, text.split("\n")) if s])
+        if not text:
+            return None
+        buf = np.frombuffer(text.encode(), dtype=np.uint8)
+        newlines = np.flatnonzero(buf == 10)
+        line = np.searchsorted(newlines, np.flatnonzero(buf == sep[0]))
+        counts = np.bincount(line, minlength=len(newlines) + 1)
+        k = counts[0] + 1
+        if k < 2 or np.any(counts != k - 1):
+            return None
+        tokens = text.replace("\n", delimiter).split(delimiter)
+    return [tokens[i::k] for i in range(k)]
+
+
+def _edges_from_columns(columns, nodetype, data):
+    """Returns an iterator over the edges for columns of fields, or None if
+    they cannot be converted column by column.
+    """
+    u, v, *d = columns
+    if nodetype is not None:
+        try:
+            u = list(map(nodetype, u))
+            v = list(map(nodetype, v))
+        except Exception:
+            return None
+    if not d or data is False:
+        return zip(u, v, [{} for _ in u])
+    if data is True or len(d) != len(data):
+        return None
+    edgedata = [{} for _ in u]
+    for (edge_key, edge_type), column in zip(data, d):
+        try:
+            column = list(map(edge_type, column))
+        except Exception:
+            return None
+        for dd, value in zip(edgedata, column):
+            dd[edge_key] = value
+    return zip(u, v, edgedata)
+
+
+def _parse_lines(lines, comments, delimiter, nodetype, data):
+    """Yields the edges `(u, v, edgedata)` in `lines`, one line at a time."""
     from ast import literal_eval
 
-    G = nx.empty_graph(0, create_using)
     for line in lines:
         if comments is not None:
             p = line.find(comments)
@@ -292,8 +414,7 @@ def parse_edgelist(
                         f"to type {edge_type}."
                     ) from err
                 edgedata.update({edge_key: edge_value})
-        G.add_edge(u, v, **edgedata)
-    return G
+        yield u, v, edgedata
 
 
 @open_file(0, mode="rb")
@@ -372,15 +493,103 @@ def read_edgelist(
     Since nodes must be hashable, the function nodetype must return hashable
     types (e.g. int, float, str, frozenset - or tuples of those, etc.)
     """
-    lines = (line if isinstance(line, str) else line.decode(encoding) for line in path)
-    return parse_edgelist(
-        lines,
-        comments=comments,
-        delimiter=delimiter,
-        create_using=create_using,
-        nodetype=nodetype,
-        data=data,
-    )
+    G = nx.empty_graph(0, create_using)
+    for edges in _read_chunks(path, comments, delimiter, nodetype, data, encoding):
+        G.add_edges_from(edges)
+    return G
+
+
+def _read_chunks(fh, comments, delimiter, nodetype, data, encoding, chunksize=None):
+    """Yields iterators over the edges of consecutive chunks of lines of a
+    file."""
+    fh = iter(fh)
+    while True:
+        chunk = list(islice(fh, chunksize or _CHUNKSIZE))
+        if not chunk:
+            return
+        # decode the whole chunk at once
+        text = chunk[0][:0].join(chunk)
+        if not isinstance(text, str):
+            text = text.decode(encoding)
+        lines = text.split("\n")
+        yield _parse_chunk(lines, text, comments, delimiter, nodetype, data)
+
+
+def read_edgelist_batches(
+    path,
+    comments="#",
+    delimiter=None,
+    nodetype=None,
+    data=True,
+    encoding="utf-8",
+    batch_size=100_000,
+):
+    """Yields the edges of an edge list file in batches, without building a
+    graph.
+
+    The file is read and parsed `batch_size` lines at a time, like
+    :func:`read_edgelist` does, so memory use does not grow with the size
+    of the file.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it must be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The character used to indicate the start of a comment. To specify that
+       no character should be treated as a comment, use ``comments=None``.
+    delimiter : string, optional
+       The string used to separate values.  The default is whitespace.
+    nodetype : int, float, str, Python type, optional
+       Convert node data from strings to specified type
+    data : bool or list of (label,type) tuples
+       Tuples specifying dictionary key names and types for edge data
+    encoding: string, optional
+       Specify which encoding to use when reading file.
+    batch_size : int, optional (default=100000)
+       The number of lines per batch.
+
+    Yields
+    ------
+    edges : list
+       The edges ``(u, v, edgedata)`` of the next `batch_size` lines, in
+       file order. A batch is empty if its lines hold no edges.
+
+    Examples
+    --------
+    >>> nx.write_edgelist(nx.path_graph(5), "test.edgelist", data=False)
+    >>> for edges in nx.read_edgelist_batches("test.edgelist", batch_size=2):
+    ...     print(edges)
+    [('0', '1', {}), ('1', '2', {})]
+    [('2', '3', {}), ('3', '4', {})]
+
+    Batches can be fed to a graph, or to anything else that consumes edges:
+
+    >>> G = nx.Graph()
+    >>> for edges in nx.read_edgelist_batches("test.edgelist", nodetype=int):
+    ...     G.add_edges_from(edges)
+    >>> list(G.edges)
+    [(0, 1), (1, 2), (2, 3), (3, 4)]
+
+    See Also
+    --------
+    read_edgelist
+    """
+    if isinstance(path, (str, os.PathLike)):
+        path = os.fspath(path)
+        opener = fopeners.get(os.path.splitext(path)[1], open)
+        with opener(path, mode="rb") as fh:
+            for edges in _read_chunks(
+                fh, comments, delimiter, nodetype, data, encoding, batch_size
+            ):
+                yield list(edges)
+    else:
+        for edges in _read_chunks(
+            path, comments, delimiter, nodetype, data, encoding, batch_size
+        ):
+            yield list(edges)
 
 
 def write_weighted_edgelist(G, path, comments="#", delimiter=" ", encoding="utf-8"):
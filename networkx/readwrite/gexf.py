@@ -22,6 +22,7 @@ from xml.etree.ElementTree import (
     Element,
     ElementTree,
     SubElement,
+    iterparse,
     register_namespace,
     tostring,
 )
@@ -133,7 +134,14 @@ def generate_gexf(G, encoding="utf-8", prettyprint=True, version="1.2draft"):
 
 
 @open_file(0, mode="rb")
-def read_gexf(path, node_type=None, relabel=False, version="1.2draft"):
+def read_gexf(
+    path,
+    node_type=None,
+    relabel=False,
+    version="1.2draft",
+    edge_callback=None,
+    batch_size=10000,
+):
     """Read graph in GEXF format from path.
 
     "GEXF (Graph Exchange XML Format) is a language for describing
@@ -152,6 +160,16 @@ def read_gexf(path, node_type=None, relabel=False, version="1.2draft"):
     version : string (default: 1.2draft)
     Version of GEFX File Format (see http://gexf.net/schema.html)
        Supported values: "1.1draft", "1.2draft"
+    edge_callback : callable or None (default: None)
+       If given, edges are not added to the graph. Instead they are passed
+       to ``edge_callback`` in lists of at most `batch_size` tuples
+       ``(u, v, key, data)``, where `key` is the GEXF edge id (or the
+       "networkx_key" attribute) and `data` is the dict of edge attributes.
+       A "mutual" edge is passed as two tuples. The returned graph then has
+       only the nodes and the graph attributes. Cannot be combined with
+       `relabel`.
+    batch_size : int (default: 10000)
+       The maximum number of edges passed to `edge_callback` at once.
 
     Returns
     -------
@@ -164,11 +182,24 @@ def read_gexf(path, node_type=None, relabel=False, version="1.2draft"):
     This implementation does not support mixed graphs (directed and undirected
     edges together).
 
+    The file is parsed incrementally: each node and edge is added to the
+    graph as soon as its element has been read and is then discarded, so
+    the memory used is proportional to the graph rather than to the XML
+    document. The ``<attributes>`` declarations must therefore come before
+    the nodes and edges, as the GEXF schema requires.
+
     References
     ----------
     .. [1] GEXF File Format, http://gexf.net/
     """
-    reader = GEXFReader(node_type=node_type, version=version)
+    if relabel and edge_callback is not None:
+        raise nx.NetworkXError("relabel cannot be used with edge_callback")
+    reader = GEXFReader(
+        node_type=node_type,
+        version=version,
+        edge_callback=edge_callback,
+        batch_size=batch_size,
+    )
     if relabel:
         G = relabel_gexf_graph(reader(path))
     else:
@@ -681,27 +712,103 @@ class GEXFWriter(GEXF):
 class GEXFReader(GEXF):
     # Class to read GEXF format files
     # use read_gexf() function
-    def __init__(self, node_type=None, version="1.2draft"):
+
+    # Hack to handle Gephi0.7beta bug: edges may have an undeclared
+    # "weight" attribute
+    weight_attr = {"weight": {"type": "double", "mode": "static", "title": "weight"}}
+
+    def __init__(
+        self, node_type=None, version="1.2draft", edge_callback=None, batch_size=10000
+    ):
         self.construct_types()
         self.node_type = node_type
         # assume simple graph and test for multigraph on read
         self.simple_graph = True
         self.set_version(version)
+        self.edge_callback = edge_callback
+        self.batch_size = batch_size
 
     def __call__(self, stream):
-        self.xml = ElementTree(file=stream)
-        g = self.xml.find(f"{{{self.NS_GEXF}}}graph")
-        if g is not None:
-            return self.make_graph(g)
+        # Parse incrementally: nodes and edges are added as soon as their
+        # element is complete and are then removed from the tree.
+        G = None
+        edges = []
+        # the open elements, from the root down
+        stack = []
+        for event, elem in iterparse(stream, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if len(stack) == 2 and G is None and self.find_version(elem.tag):
+                    G = self.start_graph(elem)
+                    node_attr, edge_attr = {}, dict(self.weight_attr)
+                continue
+            stack.pop()
+            if G is None:
+                continue
+            if len(stack) == 1:
+                # end of the graph
+                if edges:
+                    self.edge_callback(edges)
+                return self.finish_graph(G)
+            if len(stack) == 2:
+                if elem.tag == f"{{{self.NS_GEXF}}}attributes":
+                    self.add_attributes(G, elem, node_attr, edge_attr)
+            elif len(stack) == 3:
+                parent = stack[-1]
+                if parent.tag == f"{{{self.NS_GEXF}}}nodes":
+                    if elem.tag == f"{{{self.NS_GEXF}}}node":
+                        self.add_node(G, elem, node_attr)
+                    parent.remove(elem)
+                elif parent.tag == f"{{{self.NS_GEXF}}}edges":
+                    if elem.tag == f"{{{self.NS_GEXF}}}edge":
+                        if self.edge_callback is None:
+                            self.add_edge(G, elem, edge_attr)
+                        else:
+                            edges.extend(self.decode_edge(G, elem, edge_attr))
+                            if len(edges) >= self.batch_size:
+                                self.edge_callback(edges)
+                                edges = []
+                    parent.remove(elem)
+        raise nx.NetworkXError("No <graph> element in GEXF file.")
+
+    def find_version(self, tag):
+        # set the version whose graph element has the given tag,
+        # return False if there is none
+        if tag == f"{{{self.NS_GEXF}}}graph":
+            return True
         # try all the versions
         for version in self.versions:
-            self.set_version(version)
-            g = self.xml.find(f"{{{self.NS_GEXF}}}graph")
-            if g is not None:
-                return self.make_graph(g)
-        raise nx.NetworkXError("No <graph> element in GEXF file.")
+            if tag == f"{{{self.versions[version]['NS_GEXF']}}}graph":
+                self.set_version(version)
+                return True
+        return False
 
     def make_graph(self, graph_xml):
+        G = self.start_graph(graph_xml)
+        # node and edge attributes
+        attributes_elements = graph_xml.findall(f"{{{self.NS_GEXF}}}attributes")
+        # dictionaries to hold attributes
+        node_attr = {}
+        edge_attr = dict(self.weight_attr)
+        for a in attributes_elements:
+            self.add_attributes(G, a, node_attr, edge_attr)
+
+        # add nodes
+        nodes_element = graph_xml.find(f"{{{self.NS_GEXF}}}nodes")
+        if nodes_element is not None:
+            for node_xml in nodes_element.findall(f"{{{self.NS_GEXF}}}node"):
+                self.add_node(G, node_xml, node_attr)
+
+        # add edges
+        edges_element = graph_xml.find(f"{{{self.NS_GEXF}}}edges")
+        if edges_element is not None:
+            for edge_xml in edges_element.findall(f"{{{self.NS_GEXF}}}edge"):
+                self.add_edge(G, edge_xml, edge_attr)
+
+        return self.finish_graph(G)
+
+    def start_graph(self, graph_xml):
+        # return the empty graph of graph_xml with the graph attributes
         # start with empty DiGraph or MultiDiGraph
         edgedefault = graph_xml.get("defaultedgetype", None)
         if edgedefault == "directed":
@@ -730,48 +837,25 @@ class GEXFReader(GEXF):
         if self.timeformat == "date":
             self.timeformat = "string"
 
-        # node and edge attributes
-        attributes_elements = graph_xml.findall(f"{{{self.NS_GEXF}}}attributes")
-        # dictionaries to hold attributes and attribute defaults
-        node_attr = {}
-        node_default = {}
-        edge_attr = {}
-        edge_default = {}
-        for a in attributes_elements:
-            attr_class = a.get("class")
-            if attr_class == "node":
-                na, nd = self.find_gexf_attributes(a)
-                node_attr.update(na)
-                node_default.update(nd)
-                G.graph["node_default"] = node_default
-            elif attr_class == "edge":
-                ea, ed = self.find_gexf_attributes(a)
-                edge_attr.update(ea)
-                edge_default.update(ed)
-                G.graph["edge_default"] = edge_default
-            else:
-                raise  # unknown attribute class
-
-        # Hack to handle Gephi0.7beta bug
-        # add weight attribute
-        ea = {"weight": {"type": "double", "mode": "static", "title": "weight"}}
-        ed = {}
-        edge_attr.update(ea)
-        edge_default.update(ed)
-        G.graph["edge_default"] = edge_default
-
-        # add nodes
-        nodes_element = graph_xml.find(f"{{{self.NS_GEXF}}}nodes")
-        if nodes_element is not None:
-            for node_xml in nodes_element.findall(f"{{{self.NS_GEXF}}}node"):
-                self.add_node(G, node_xml, node_attr)
+        G.graph["edge_default"] = {}
+        return G
 
-        # add edges
-        edges_element = graph_xml.find(f"{{{self.NS_GEXF}}}edges")
-        if edges_element is not None:
-            for edge_xml in edges_element.findall(f"{{{self.NS_GEXF}}}edge"):
-                self.add_edge(G, edge_xml, edge_attr)
+    def add_attributes(self, G, attributes_element, node_attr, edge_attr):
+        # add the attribute declarations and defaults of an attributes element
+        attr_class = attributes_element.get("class")
+        if attr_class == "node":
+            na, nd = self.find_gexf_attributes(attributes_element)
+            node_attr.update(na)
+            G.graph.setdefault("node_default", {}).update(nd)
+        elif attr_class == "edge":
+            ea, ed = self.find_gexf_attributes(attributes_element)
+            edge_attr.update(ea)
+            edge_attr.update(self.weight_attr)
+            G.graph["edge_default"].update(ed)
+        else:
+            raise  # unknown attribute class
 
+    def finish_graph(self, G):
         # switch to Graph or DiGraph if no parallel edges were found.
         if self.simple_graph:
             if G.is_directed():
@@ -903,6 +987,17 @@ class GEXFReader(GEXF):
 
     def add_edge(self, G, edge_element, edge_attr):
         # add an edge to the graph
+        edges = self.decode_edge(G, edge_element, edge_attr)
+        source, target = edges[0][:2]
+        if G.has_edge(source, target):
+            # seen this edge before - this is a multigraph
+            self.simple_graph = False
+        for u, v, key, data in edges:
+            G.add_edge(u, v, key=key, **data)
+
+    def decode_edge(self, G, edge_element, edge_attr):
+        # return the list of (u, v, key, data) edges of edge_element,
+        # with both directions of a mutual edge
 
         # raise error if we find mixed directed and undirected edges
         edge_direction = edge_element.get("type")
@@ -946,12 +1041,10 @@ class GEXFReader(GEXF):
         if edge_label is not None:
             data["label"] = edge_label
 
-        if G.has_edge(source, target):
-            # seen this edge before - this is a multigraph
-            self.simple_graph = False
-        G.add_edge(source, target, key=edge_id, **data)
+        edges = [(source, target, edge_id, data)]
         if edge_direction == "mutual":
-            G.add_edge(target, source, key=edge_id, **data)
+            edges.append((target, source, edge_id, dict(data)))
+        return edges
 
     def decode_attr_elements(self, gexf_keys, obj_xml):
         # Use the key information to decode the attr XML
@@ -40,6 +40,7 @@ http://graphml.graphdrawing.org/specification.html for the specification and
 http://graphml.graphdrawing.org/primer/graphml-primer.html
 for examples.
 """
+import io
 import warnings
 from collections import defaultdict
 
@@ -233,7 +234,14 @@ def generate_graphml(
 
 
 @open_file(0, mode="rb")
-def read_graphml(path, node_type=str, edge_key_type=int, force_multigraph=False):
+def read_graphml(
+    path,
+    node_type=str,
+    edge_key_type=int,
+    force_multigraph=False,
+    edge_callback=None,
+    batch_size=10000,
+):
     """Read graph in GraphML format from path.
 
     Parameters
@@ -253,6 +261,18 @@ def read_graphml(path, node_type=str, edge_key_type=int, force_multigraph=False)
        If True, return a multigraph with edge keys. If False (the default)
        return a multigraph when multiedges are in the graph.
 
+    edge_callback : callable or None (default: None)
+       If given, edges are not added to the graph. Instead they are passed
+       to ``edge_callback`` in lists of at most `batch_size` tuples
+       ``(u, v, key, data)``, where `key` is the GraphML edge id converted
+       with `edge_key_type` (or the "key" attribute, or None) and `data` is
+       the dict of edge attributes. The returned graph then has only the
+       nodes and the graph attributes, and is a multigraph only if
+       `force_multigraph` is True.
+
+    batch_size : int (default: 10000)
+       The maximum number of edges passed to `edge_callback` at once.
+
     Returns
     -------
     graph: NetworkX graph
@@ -283,6 +303,12 @@ def read_graphml(path, node_type=str, edge_key_type=int, force_multigraph=False)
     there is no "key" attribute a default NetworkX multigraph edge key
     will be provided.
 
+    The file is parsed incrementally: each node and edge is added to the
+    graph as soon as its element has been read and is then discarded, so
+    the memory used is proportional to the graph rather than to the XML
+    document. Keys must therefore be declared before the graph that uses
+    them, as the GraphML schema requires.
+
     Files with the yEd "yfiles" extension can be read. The type of the node's
     shape is preserved in the `shape_type` node attribute.
 
@@ -290,7 +316,9 @@ def read_graphml(path, node_type=str, edge_key_type=int, force_multigraph=False)
     the file to "file.graphml.gz".
 
     """
-    reader = GraphMLReader(node_type, edge_key_type, force_multigraph)
+    reader = GraphMLReader(
+        node_type, edge_key_type, force_multigraph, edge_callback, batch_size
+    )
     # need to check for multiple graphs
     glist = list(reader(path=path))
     if len(glist) == 0:
@@ -306,7 +334,12 @@ def read_graphml(path, node_type=str, edge_key_type=int, force_multigraph=False)
 
 
 def parse_graphml(
-    graphml_string, node_type=str, edge_key_type=int, force_multigraph=False
+    graphml_string,
+    node_type=str,
+    edge_key_type=int,
+    force_multigraph=False,
+    edge_callback=None,
+    batch_size=10000,
 ):
     """Read graph in GraphML format from string.
 
@@ -327,6 +360,18 @@ def parse_graphml(
        If True, return a multigraph with edge keys. If False (the default)
        return a multigraph when multiedges are in the graph.
 
+    edge_callback : callable or None (default: None)
+       If given, edges are not added to the graph. Instead they are passed
+       to ``edge_callback`` in lists of at most `batch_size` tuples
+       ``(u, v, key, data)``, where `key` is the GraphML edge id converted
+       with `edge_key_type` (or the "key" attribute, or None) and `data` is
+       the dict of edge attributes. The returned graph then has only the
+       nodes and the graph attributes, and is a multigraph only if
+       `force_multigraph` is True.
+
+    batch_size : int (default: 10000)
+       The maximum number of edges passed to `edge_callback` at once.
+
 
     Returns
     -------
@@ -365,7 +410,9 @@ def parse_graphml(
     will be provided.
 
     """
-    reader = GraphMLReader(node_type, edge_key_type, force_multigraph)
+    reader = GraphMLReader(
+        node_type, edge_key_type, force_multigraph, edge_callback, batch_size
+    )
     # need to check for multiple graphs
     glist = list(reader(string=graphml_string))
     if len(glist) == 0:
@@ -837,27 +884,89 @@ write_graphml = write_graphml_lxml
 class GraphMLReader(GraphML):
     """Read a GraphML document.  Produces NetworkX graph objects."""
 
-    def __init__(self, node_type=str, edge_key_type=int, force_multigraph=False):
+    def __init__(
+        self,
+        node_type=str,
+        edge_key_type=int,
+        force_multigraph=False,
+        edge_callback=None,
+        batch_size=10000,
+    ):
         self.construct_types()
         self.node_type = node_type
         self.edge_key_type = edge_key_type
         self.multigraph = force_multigraph  # If False, test for multiedges
         self.edge_ids = {}  # dict mapping (u,v) tuples to edge id attributes
+        self.edge_callback = edge_callback
+        self.batch_size = batch_size
 
     def __call__(self, path=None, string=None):
-        from xml.etree.ElementTree import ElementTree, fromstring
+        from xml.etree.ElementTree import iterparse
 
         if path is not None:
-            self.xml = ElementTree(file=path)
+            source = path
         elif string is not None:
-            self.xml = fromstring(string)
+            if isinstance(string, str):
+                source = io.StringIO(string)
+            else:
+                source = io.BytesIO(string)
         else:
             raise ValueError("Must specify either 'path' or 'string' as kwarg")
-        (keys, defaults) = self.find_graphml_keys(self.xml)
-        for g in self.xml.findall(f"{{{self.NS_GRAPHML}}}graph"):
-            yield self.make_graph(g, keys, defaults)
+        yield from self.parse_graphs(iterparse(source, events=("start", "end")))
 
-    def make_graph(self, graph_xml, graphml_keys, defaults, G=None):
+    def parse_graphs(self, events):
+        """Yields the graphs in a stream of `iterparse` events.
+
+        Keys must be declared before the graphs that use them. Nodes and
+        edges of the top-level graphs are added as soon as their element is
+        complete and are then removed from the tree, so that the parsed
+        document does not accumulate in memory.
+        """
+        graph_tag = f"{{{self.NS_GRAPHML}}}graph"
+        node_tag = f"{{{self.NS_GRAPHML}}}node"
+        edge_tag = f"{{{self.NS_GRAPHML}}}edge"
+        key_tag = f"{{{self.NS_GRAPHML}}}key"
+        hyperedge_tag = f"{{{self.NS_GRAPHML}}}hyperedge"
+        keys, defaults = {}, {}
+        G = None
+        edges = []
+        # the open elements, from the root down
+        stack = []
+        for event, elem in events:
+            if event == "start":
+                stack.append(elem)
+                if len(stack) == 2 and elem.tag == graph_tag:
+                    G = self.start_graph(elem, keys, defaults)
+                elif len(stack) == 3 and G is not None and elem.tag == hyperedge_tag:
+                    raise nx.NetworkXError("GraphML reader doesn't support hyperedges")
+                continue
+            stack.pop()
+            if len(stack) == 1:
+                if elem.tag == key_tag:
+                    self.add_graphml_key(elem, keys, defaults)
+                elif elem.tag == graph_tag:
+                    if edges:
+                        self.edge_callback(edges)
+                        edges = []
+                    yield self.finish_graph(G, elem, keys)
+                    G = None
+                    stack[-1].remove(elem)
+            elif len(stack) == 2 and G is not None:
+                if elem.tag == node_tag:
+                    self.add_node(G, elem, keys, defaults)
+                    stack[-1].remove(elem)
+                elif elem.tag == edge_tag:
+                    if self.edge_callback is None:
+                        self.add_edge(G, elem, keys)
+                    else:
+                        edges.append(self.decode_edge(G, elem, keys))
+                        if len(edges) >= self.batch_size:
+                            self.edge_callback(edges)
+                            edges = []
+                    stack[-1].remove(elem)
+
+    def start_graph(self, graph_xml, graphml_keys, defaults, G=None):
+        """Returns the graph to fill in for `graph_xml`, with its defaults."""
         # set default graph type
         edgedefault = graph_xml.get("edgedefault", None)
         if G is None:
@@ -876,6 +985,10 @@ class GraphMLReader(GraphML):
                 G.graph["node_default"].update({name: python_type(value)})
             if key_for == "edge":
                 G.graph["edge_default"].update({name: python_type(value)})
+        return G
+
+    def make_graph(self, graph_xml, graphml_keys, defaults, G=None):
+        G = self.start_graph(graph_xml, graphml_keys, defaults, G)
         # hyperedges are not supported
         hyperedge = graph_xml.find(f"{{{self.NS_GRAPHML}}}hyperedge")
         if hyperedge is not None:
@@ -886,6 +999,10 @@ class GraphMLReader(GraphML):
         # add edges
         for edge_xml in graph_xml.findall(f"{{{self.NS_GRAPHML}}}edge"):
             self.add_edge(G, edge_xml, graphml_keys)
+        return self.finish_graph(G, graph_xml, graphml_keys)
+
+    def finish_graph(self, G, graph_xml, graphml_keys):
+        """Adds the graph data and returns the graph in its final type."""
         # add graph data
         data = self.decode_data_elements(graphml_keys, graph_xml)
         G.graph.update(data)
@@ -917,6 +1034,22 @@ class GraphMLReader(GraphML):
 
     def add_edge(self, G, edge_element, graphml_keys):
         """Add an edge to the graph."""
+        source, target, edge_id, data = self.decode_edge(G, edge_element, graphml_keys)
+        raw_id = edge_element.get("id")
+        if raw_id:
+            # self.edge_ids is used by `make_graph` method for non-multigraphs
+            self.edge_ids[source, target] = raw_id
+
+        if G.has_edge(source, target):
+            # mark this as a multigraph
+            self.multigraph = True
+
+        # Use add_edges_from to avoid error with add_edge when `'key' in data`
+        # Note there is only one edge here...
+        G.add_edges_from([(source, target, edge_id, data)])
+
+    def decode_edge(self, G, edge_element, graphml_keys):
+        """Returns the edge of `edge_element` as ``(u, v, key, data)``."""
         # warn on finding unsupported ports tag
         ports = edge_element.find(f"{{{self.NS_GRAPHML}}}port")
         if ports is not None:
@@ -939,22 +1072,13 @@ class GraphMLReader(GraphML):
         # attribute is specified
         edge_id = edge_element.get("id")
         if edge_id:
-            # self.edge_ids is used by `make_graph` method for non-multigraphs
-            self.edge_ids[source, target] = edge_id
             try:
                 edge_id = self.edge_key_type(edge_id)
             except ValueError:  # Could not convert.
                 pass
         else:
             edge_id = data.get("key")
-
-        if G.has_edge(source, target):
-            # mark this as a multigraph
-            self.multigraph = True
-
-        # Use add_edges_from to avoid error with add_edge when `'key' in data`
-        # Note there is only one edge here...
-        G.add_edges_from([(source, target, edge_id, data)])
+        return source, target, edge_id, data
 
     def decode_data_elements(self, graphml_keys, obj_xml):
         """Use the key information to decode the data XML if present."""
@@ -1019,32 +1143,34 @@ class GraphMLReader(GraphML):
         graphml_keys = {}
         graphml_key_defaults = {}
         for k in graph_element.findall(f"{{{self.NS_GRAPHML}}}key"):
-            attr_id = k.get("id")
-            attr_type = k.get("attr.type")
-            attr_name = k.get("attr.name")
-            yfiles_type = k.get("yfiles.type")
-            if yfiles_type is not None:
-                attr_name = yfiles_type
-                attr_type = "yfiles"
-            if attr_type is None:
-                attr_type = "string"
-                warnings.warn(f"No key type for id {attr_id}. Using string")
-            if attr_name is None:
-                raise nx.NetworkXError(f"Unknown key for id {attr_id}.")
-            graphml_keys[attr_id] = {
-                "name": attr_name,
-                "type": self.python_type[attr_type],
-                "for": k.get("for"),
-            }
-            # check for "default" sub-element of key element
-            default = k.find(f"{{{self.NS_GRAPHML}}}default")
-            if default is not None:
-                # Handle default values identically to data element values
-                python_type = graphml_keys[attr_id]["type"]
-                if python_type == bool:
-                    graphml_key_defaults[attr_id] = self.convert_bool[
-                        default.text.lower()
-                    ]
-                else:
-                    graphml_key_defaults[attr_id] = python_type(default.text)
+            self.add_graphml_key(k, graphml_keys, graphml_key_defaults)
         return graphml_keys, graphml_key_defaults
+
+    def add_graphml_key(self, k, graphml_keys, graphml_key_defaults):
+        """Adds the key declared by the key element `k`, and its default."""
+        attr_id = k.get("id")
+        attr_type = k.get("attr.type")
+        attr_name = k.get("attr.name")
+        yfiles_type = k.get("yfiles.type")
+        if yfiles_type is not None:
+            attr_name = yfiles_type
+            attr_type = "yfiles"
+        if attr_type is None:
+            attr_type = "string"
+            warnings.warn(f"No key type for id {attr_id}. Using string")
+        if attr_name is None:
+            raise nx.NetworkXError(f"Unknown key for id {attr_id}.")
+        graphml_keys[attr_id] = {
+            "name": attr_name,
+            "type": self.python_type[attr_type],
+            "for": k.get("for"),
+        }
+        # check for "default" sub-element of key element
+        default = k.find(f"{{{self.NS_GRAPHML}}}default")
+        if default is not None:
+            # Handle default values identically to data element values
+            python_type = graphml_keys[attr_id]["type"]
+            if python_type == bool:
+                graphml_key_defaults[attr_id] = self.convert_bool[default.text.lower()]
+            else:
+                graphml_key_defaults[attr_id] = python_type(default.text)
@@ -0,0 +1,92 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import networkx as nx
+from networkx.utils import edges_equal, nodes_equal
+
+
+class TestBinary:
+    @classmethod
+    def setup_class(cls):
+        G = nx.Graph(name="test", number=1)
+        e = [("a", "b"), ("b", "c"), ("c", "d"), ("d", "é"), ("é", "f"), ("a", "f")]
+        G.add_edges_from(e, width=10)
+        G.add_edge("a", "a", width=2, label="loop")
+        G.add_node("g", color="green")
+        G.nodes["a"]["size"] = 3
+        cls.G = G
+        cls.DG = nx.DiGraph(G)
+
+    def check(self, G, H):
+        assert list(H) == list(G)
+        assert H.is_directed() == G.is_directed()
+        assert nodes_equal(H.nodes(data=True), G.nodes(data=True))
+        assert edges_equal(H.edges(data=True), G.edges(data=True))
+        assert H.graph == G.graph
+
+    @pytest.mark.parametrize("name", ("G", "DG"))
+    def test_roundtrip(self, name, tmp_path):
+        G = getattr(self, name)
+        fname = tmp_path / "test.nxg"
+        nx.write_binary(G, fname)
+        H = nx.read_binary(fname)
+        self.check(G, H)
+        csr_class = nx.CSRDiGraph if G.is_directed() else nx.CSRGraph
+        assert type(H) is csr_class
+        assert isinstance(H._indices, np.memmap)
+        assert not H._indices.flags.writeable
+        assert nx.is_frozen(H)
+        assert isinstance(H.edges["a", "b"]["width"], int)
+        assert H.nodes["a"]["size"] == 3 and "size" not in H.nodes["b"]
+        if G.is_directed():
+            assert edges_equal(H.in_edges(data=True), G.in_edges(data=True))
+
+    def test_csr_graph_and_file_object(self, tmp_path):
+        G = nx.gnm_random_graph(100, 300, seed=42, directed=True)
+        for u, v, d in G.edges(data=True):
+            d["weight"] = (u + v) / 7
+        C = nx.CSRDiGraph(G)
+        fh = io.BytesIO()
+        nx.write_binary(C, fh)
+        with open(tmp_path / "test.nxg", "wb") as f:
+            f.write(fh.getvalue())
+        with open(tmp_path / "test.nxg", "rb") as f:
+            H = nx.read_binary(f)
+        self.check(C, H)
+        assert dict(nx.all_pairs_dijkstra_path_length(H)) == dict(
+            nx.all_pairs_dijkstra_path_length(G)
+        )
+
+    def test_empty(self, tmp_path):
+        for G in (nx.Graph(), nx.DiGraph()):
+            nx.write_binary(G, tmp_path / "empty.nxg")
+            self.check(G, nx.read_binary(tmp_path / "empty.nxg"))
+
+    @pytest.mark.parametrize(
+        "G",
+        (
+            nx.Graph([((0, 1), (1, 1))]),
+            nx.Graph([(1, "a")]),
+            nx.Graph([(0, 2**70)]),
+            nx.Graph([(0, 1, {"data": [1]})]),
+            nx.Graph([(0, 1)], data={1, 2}),
+        ),
+    )
+    def test_unsupported(self, G, tmp_path):
+        with pytest.raises(nx.NetworkXError):
+            nx.write_binary(G, tmp_path / "test.nxg")
+        assert not (tmp_path / "test.nxg").exists()
+
+    def test_multigraph(self, tmp_path):
+        with pytest.raises(nx.NetworkXNotImplemented):
+            nx.write_binary(nx.MultiGraph(), tmp_path / "test.nxg")
+
+    def test_not_binary(self, tmp_path):
+        fname = tmp_path / "test.nxg"
+        for data in (b"", b"not a graph at all"):
+            fname.write_bytes(data)
+            with pytest.raises(nx.NetworkXError):
+                nx.read_binary(fname)
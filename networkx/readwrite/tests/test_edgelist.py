@@ -169,6 +169,92 @@ def test_comments_None():
     assert edges_equal(G.edges, H.edges)
 
 
+@pytest.mark.parametrize(
+    ("lines", "kwargs"),
+    (
+        (["1 2", "2 3", "3 4"], {}),
+        (["1 2\n", "\n", "  2\t3 \r\n", "3 4\n"], {}),
+        (["1 2 x", "2 3", "3 4"], {"data": False}),
+        (["1 2 3.5", "2\x1c3 1", "3 4 2"], {"data": (("weight", float),)}),
+        (["1 2 3", "4"], {"data": False}),
+        (["1 2", "2 3 # comment", "3 4"], {}),
+        (["1 2 3", "2 3\n4 5", "3 4 3"], {"data": False}),
+        (["é ü", "ü\xa0ß", "ß é"], {}),
+        (["é ü", "ü ß"], {"data": False}),
+        (["1,2,a", " 2, 3,b", "", "3,4,c,"], {"delimiter": ",", "data": False}),
+        (
+            ["1,2,1", " 2, 3,2\n", "\n", "3,4,3"],
+            {"delimiter": ",", "data": (("w", int),)},
+        ),
+        (["1;;2", "2;;3"], {"delimiter": ";;"}),
+        (["a"], {"delimiter": ","}),
+        ([","], {"delimiter": "\t"}),
+        (["1 2", "2 3 {'weight': 3}"], {"data": True}),
+    ),
+)
+def test_parse_edgelist_chunk(lines, kwargs):
+    from networkx.readwrite.edgelist import _parse_chunk, _parse_lines
+
+    text = "\n".join(lines)
+    args = (
+        kwargs.get("comments", "#"),
+        kwargs.get("delimiter"),
+        kwargs.get("nodetype"),
+        kwargs.get("data", True),
+    )
+    expected = list(_parse_lines(lines, *args))
+    if text.count("\n") == len(lines) - 1 + sum(s.endswith("\n") for s in lines):
+        assert list(_parse_chunk(lines, text, *args)) == expected
+    G = nx.parse_edgelist(lines, **kwargs)
+    assert edges_equal(G.edges(data=True), expected)
+
+
+def test_read_edgelist_no_delimiter():
+    # lines without the delimiter hold no edges
+    G = nx.read_edgelist(io.BytesIO(b"a\nb\n"), delimiter=",")
+    assert len(G) == 0
+
+
+def test_parse_edgelist_chunk_nodetype():
+    from networkx.readwrite.edgelist import _parse_chunk
+
+    lines = ["1 2 3", "2 3 4"]
+    edges = list(_parse_chunk(lines, "\n".join(lines), "#", None, int, (("w", int),)))
+    assert edges == [(1, 2, {"w": 3}), (2, 3, {"w": 4})]
+    assert all(type(x) is int for u, v, d in edges for x in (u, v, d["w"]))
+
+
+def test_read_edgelist_chunks(monkeypatch):
+    monkeypatch.setattr(nx.readwrite.edgelist, "_CHUNKSIZE", 3)
+    lines = [f"{i} {i + 1} {i / 2}" for i in range(20)]
+    lines[7] = "# comment"
+    text = "\n".join(lines) + "\n"
+    expected = nx.parse_edgelist(lines, nodetype=int, data=(("weight", float),))
+    G = nx.read_edgelist(
+        io.BytesIO(text.encode()), nodetype=int, data=(("weight", float),)
+    )
+    assert list(G) == list(expected)
+    assert edges_equal(G.edges(data=True), expected.edges(data=True))
+
+
+def test_read_edgelist_batches(tmp_path):
+    G = nx.gnm_random_graph(50, 200, seed=42)
+    fname = tmp_path / "test.edgelist.gz"
+    nx.write_edgelist(G, fname, data=False)
+    batches = list(nx.read_edgelist_batches(fname, nodetype=int, batch_size=64))
+    assert [len(edges) for edges in batches] == [64, 64, 64, 8]
+    edges = [e for edges in batches for e in edges]
+    assert edges == [(u, v, {}) for u, v in G.edges]
+    with open(tmp_path / "test.edgelist", "wb") as fh:
+        fh.write(b"0 1 7\n# comment\n1 2 8\n")
+    with open(tmp_path / "test.edgelist", "rb") as fh:
+        batches = nx.read_edgelist_batches(fh, data=(("weight", int),), batch_size=2)
+        assert list(batches) == [
+            [("0", "1", {"weight": 7})],
+            [("1", "2", {"weight": 8})],
+        ]
+
+
 class TestEdgelist:
     @classmethod
     def setup_class(cls):
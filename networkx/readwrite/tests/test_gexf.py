@@ -545,3 +545,69 @@ gexf.net/1.2draft http://www.gexf.net/1.2draft/gexf.xsd" version="1.2">
         assert sorted(sorted(e) for e in G.edges()) == sorted(
             sorted(e) for e in H.edges()
         )
+
+    def test_edge_callback(self):
+        fh = io.BytesIO(self.attribute_fh.getvalue())
+        G = nx.read_gexf(fh)
+        batches = []
+        fh.seek(0)
+        H = nx.read_gexf(fh, edge_callback=batches.append, batch_size=2)
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert H.number_of_edges() == 0
+        assert sorted(H.nodes(data=True)) == sorted(G.nodes(data=True))
+        assert H.graph == G.graph
+        H.add_edges_from((u, v, d) for b in batches for u, v, k, d in b)
+        assert sorted(H.edges(data=True)) == sorted(G.edges(data=True))
+
+        s = """<?xml version="1.0" encoding="UTF-8"?>
+<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">
+    <graph mode="static" defaultedgetype="directed">
+        <nodes>
+            <node id="0" label="Hello" />
+            <node id="1" label="Word" />
+        </nodes>
+        <edges>
+            <edge id="a" source="0" target="1" type="mutual" weight="2" />
+        </edges>
+    </graph>
+</gexf>
+"""
+        batches = []
+        G = nx.read_gexf(io.BytesIO(s.encode("UTF-8")), edge_callback=batches.append)
+        assert batches == [
+            [
+                ("0", "1", "a", {"id": "a", "weight": 2.0}),
+                ("1", "0", "a", {"id": "a", "weight": 2.0}),
+            ]
+        ]
+        assert list(G) == ["0", "1"]
+        pytest.raises(
+            nx.NetworkXError,
+            nx.read_gexf,
+            io.BytesIO(s.encode("UTF-8")),
+            relabel=True,
+            edge_callback=batches.append,
+        )
+
+    def test_incremental_read(self, monkeypatch):
+        G = nx.path_graph(10000)
+        fh = io.BytesIO()
+        nx.write_gexf(G, fh)
+        fh.seek(0)
+        sizes = []
+        iterparse = nx.readwrite.gexf.iterparse
+
+        def tracked_iterparse(source, events):
+            nodes = []
+            for event, elem in iterparse(source, events):
+                if event == "start" and elem.tag.endswith("}nodes"):
+                    nodes = elem
+                yield event, elem
+                sizes.append(len(nodes))
+
+        monkeypatch.setattr(nx.readwrite.gexf, "iterparse", tracked_iterparse)
+        H = nx.read_gexf(fh, node_type=int)
+        assert sorted(H.edges) == sorted(G.edges)
+        assert len(sizes) > 2 * len(G)
+        # the parser reads ahead by a bounded number of elements
+        assert max(sizes) < 2000
@@ -1091,6 +1091,48 @@ line2]]></data>
         H = nx.parse_graphml(s)
         assert sorted(H.nodes(data=True)) == expected
 
+    def test_edge_callback(self):
+        G = nx.read_graphml(io.BytesIO(self.attribute_data.encode("UTF-8")))
+        batches = []
+        fh = io.BytesIO(self.attribute_data.encode("UTF-8"))
+        H = nx.read_graphml(fh, edge_callback=batches.append, batch_size=4)
+        assert [len(b) for b in batches] == [4, 3]
+        assert nodes_equal(H.nodes(data=True), G.nodes(data=True))
+        assert H.number_of_edges() == 0
+        assert H.graph == G.graph
+        assert ("n0", "n2", "e0", {"weight": 1.0}) in batches[0]
+        H.add_edges_from((u, v, dict(d, id=k)) for b in batches for u, v, k, d in b)
+        assert edges_equal(H.edges(data=True), G.edges(data=True))
+
+        batches = []
+        H = nx.parse_graphml(self.simple_directed_data, edge_callback=batches.append)
+        assert len(batches) == 1
+        assert sorted(batches[0][:2]) == [
+            ("n0", "n2", "foo", {}),
+            ("n1", "n2", None, {}),
+        ]
+
+    def test_incremental_read(self):
+        from xml.etree.ElementTree import iterparse
+
+        G = nx.path_graph(10000)
+        s = "\n".join(nx.generate_graphml(G))
+        sizes = []
+
+        def events():
+            graph = []
+            for event, elem in iterparse(io.StringIO(s), events=("start", "end")):
+                if event == "start" and elem.tag.endswith("graph"):
+                    graph = elem
+                yield event, elem
+                sizes.append(len(graph))
+
+        (H,) = nx.readwrite.graphml.GraphMLReader(node_type=int).parse_graphs(events())
+        assert edges_equal(G.edges, H.edges)
+        assert len(sizes) > 2 * (len(G) + G.number_of_edges())
+        # the parser reads ahead by a bounded number of elements
+        assert max(sizes) < 2000
+
 
 class TestWriteGraphML(BaseGraphML):
     writer = staticmethod(nx.write_graphml_lxml)
@@ -157,12 +157,16 @@ def _relabel_inplace(G, mapping):
         if multigraph:
             new_edges = [
                 (new, new if old == target else target, key, data)
-                for (_, target, key, data) in G.edges(old, data=True, keys=True)
+                for (_, target, key, data) in G.edges(
+                    old, data=True, keys=True, wrap=False
+                )
             ]
             if directed:
                 new_edges += [
                     (new if old == source else source, new, key, data)
-                    for (source, _, key, data) in G.in_edges(old, data=True, keys=True)
+                    for (source, _, key, data) in G.in_edges(
+                        old, data=True, keys=True, wrap=False
+                    )
                 ]
             # Ensure new edges won't overwrite existing ones
             seen = set()
@@ -176,12 +180,12 @@ def _relabel_inplace(G, mapping):
         else:
             new_edges = [
                 (new, new if old == target else target, data)
-                for (_, target, data) in G.edges(old, data=True)
+                for (_, target, data) in G.edges(old, data=True, wrap=False)
             ]
             if directed:
                 new_edges += [
                     (new if old == source else source, new, data)
-                    for (source, _, data) in G.in_edges(old, data=True)
+                    for (source, _, data) in G.in_edges(old, data=True, wrap=False)
                 ]
         G.remove_node(old)
         G.add_edges_from(new_edges)
@@ -195,7 +199,7 @@ def _relabel_copy(G, mapping):
     if G.is_multigraph():
         new_edges = [
             (mapping.get(n1, n1), mapping.get(n2, n2), k, d.copy())
-            for (n1, n2, k, d) in G.edges(keys=True, data=True)
+            for (n1, n2, k, d) in G.edges(keys=True, data=True, wrap=False)
         ]
 
         # check for conflicting edge-keys
@@ -215,7 +219,7 @@ def _relabel_copy(G, mapping):
     else:
         H.add_edges_from(
             (mapping.get(n1, n1), mapping.get(n2, n2), d.copy())
-            for (n1, n2, d) in G.edges(data=True)
+            for (n1, n2, d) in G.edges(data=True, wrap=False)
         )
     H.graph.update(G.graph)
     return H
@@ -283,6 +283,91 @@ def test_from_scipy_sparse_array_formats(sparse_format):
     assert graphs_equal(expected, nx.from_scipy_sparse_array(A))
 
 
+@pytest.mark.parametrize("sparse_format", ("csr", "csc", "coo", "dok", "lil"))
+@pytest.mark.parametrize("graph_class", (nx.Graph, nx.DiGraph))
+def test_from_scipy_sparse_array_asymmetric(sparse_format, graph_class):
+    """The bulk insertion matches add_weighted_edges_from for any entry order."""
+    A = sp.sparse.coo_array(
+        [[1, 3, 0, 0], [4, 0, 1, 0], [0, 5, 0, 2], [0, 0, 0, 0]]
+    ).asformat(sparse_format)
+    expected = graph_class()
+    expected.add_nodes_from(range(4))
+    expected.add_weighted_edges_from(nx.convert_matrix._generate_weighted_edges(A))
+    G = nx.from_scipy_sparse_array(A, create_using=graph_class)
+    assert graphs_equal(G, expected)
+    assert all(nx.is_node(v) for nbrs in G._adj.values() for v in nbrs)
+    if sparse_format != "dok":
+        assert all(type(w) is int for _, _, w in G.edges(data="weight"))
+
+
+def test_from_scipy_sparse_array_duplicate_entries():
+    A = sp.sparse.coo_array(([1.0, 2.0, 3.0], ([0, 0, 1], [1, 1, 0])), shape=(2, 2))
+    for graph_class in (nx.Graph, nx.DiGraph):
+        expected = graph_class()
+        expected.add_nodes_from(range(2))
+        expected.add_weighted_edges_from(zip(A.row, A.col, A.data))
+        G = nx.from_scipy_sparse_array(A, create_using=graph_class)
+        assert graphs_equal(G, expected)
+
+
+@pytest.mark.parametrize("weight", ("weight", "other", None))
+def test_to_scipy_sparse_array_subset_and_multigraph(weight):
+    G = nx.MultiGraph()
+    G.add_edge(0, 1, weight=2)
+    G.add_edge(0, 1, weight=3)
+    G.add_edge(1, 2)
+    G.add_edge(2, 2, weight=4)
+    G.add_edge(3, 0, weight=5)
+    nodelist = [2, 1, 0]
+    expected = np.zeros((3, 3))
+    for u, v, wt in G.edges(data=weight, default=1):
+        if u in nodelist and v in nodelist:
+            i, j = nodelist.index(u), nodelist.index(v)
+            expected[i, j] += wt
+            if i != j:
+                expected[j, i] += wt
+    A = nx.to_scipy_sparse_array(G, nodelist=nodelist, weight=weight)
+    assert A.has_sorted_indices
+    np.testing.assert_equal(A.toarray(), expected)
+
+
+@pytest.mark.parametrize("csr_class", (nx.CSRGraph, nx.CSRDiGraph))
+def test_to_scipy_sparse_array_csr_graph(csr_class):
+    G = nx.gnm_random_graph(20, 60, seed=3, directed=csr_class is nx.CSRDiGraph)
+    for u, v, d in G.edges(data=True):
+        if (u + v) % 3:
+            d["weight"] = u + v / 10
+    C = csr_class(G)
+    for weight in ("weight", "missing", None):
+        A = nx.to_scipy_sparse_array(C, weight=weight, format="csr")
+        B = nx.to_scipy_sparse_array(G, weight=weight, format="csr")
+        assert A.dtype == B.dtype
+        np.testing.assert_equal(A.toarray(), B.toarray())
+        assert not np.shares_memory(A.indices, C._indices)
+    nodelist = list(C)[::-1]
+    np.testing.assert_equal(
+        nx.to_scipy_sparse_array(C, nodelist).toarray(),
+        nx.to_scipy_sparse_array(G, nodelist).toarray(),
+    )
+
+
+@pytest.mark.parametrize("csr_class", (nx.CSRGraph, nx.CSRDiGraph))
+def test_to_scipy_sparse_array_csr_graph_views(csr_class):
+    G = nx.gnm_random_graph(10, 30, seed=4, directed=csr_class is nx.CSRDiGraph)
+    C = csr_class(G)
+    views = [
+        (C.subgraph(range(7)), G.subgraph(range(7))),
+        (C.copy(as_view=True), G),
+    ]
+    if C.is_directed():
+        views.append((C.reverse(copy=False), G.reverse(copy=False)))
+    for view, H in views:
+        np.testing.assert_equal(
+            nx.to_scipy_sparse_array(view).toarray(),
+            nx.to_scipy_sparse_array(H).toarray(),
+        )
+
+
 # NOTE: remove when to/from_sparse_matrix deprecations expire
 def test_scipy_sparse_matrix_deprecations():
     G = nx.path_graph(3)
@@ -0,0 +1,196 @@
+"""
+Helpers for running graph algorithms on a pool of worker processes.
+
+The algorithms using these helpers accept ``n_jobs`` and ``executor``
+arguments. The graph is sent to each worker process once, when the worker
+starts, and the work is split into chunks of items (usually nodes) that are
+dispatched to the workers. Results come back in the order of the chunks.
+"""
+import itertools
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+__all__ = ["chunks", "effective_n_jobs", "parallel_graph_imap"]
+
+
+def effective_n_jobs(n_jobs=None):
+    """Returns the number of worker processes requested by `n_jobs`.
+
+    Parameters
+    ----------
+    n_jobs : int or None, optional (default=None)
+        None means a single process. Negative values count back from the
+        number of CPUs, so -1 means all of them and -2 all but one.
+
+    Returns
+    -------
+    int
+        The number of worker processes, at least 1.
+
+    Raises
+    ------
+    ValueError
+        If `n_jobs` is 0.
+
+    Examples
+    --------
+    >>> from networkx.utils import effective_n_jobs
+    >>> effective_n_jobs(None)
+    1
+    >>> effective_n_jobs(4)
+    4
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs == 0 has no meaning")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+def chunks(iterable, n):
+    """Yields tuples of `n` consecutive items of `iterable`.
+
+    The last tuple holds the remaining items and may be shorter.
+
+    Examples
+    --------
+    >>> from networkx.utils import chunks
+    >>> list(chunks(range(7), 3))
+    [(0, 1, 2), (3, 4, 5), (6,)]
+    """
+    it = iter(iterable)
+    while True:
+        x = tuple(itertools.islice(it, n))
+        if not x:
+            return
+        yield x
+
+
+# The graph shared by the tasks of a worker process, set by its initializer.
+_worker_graph = None
+
+
+def _set_worker_graph(G):
+    global _worker_graph
+    _worker_graph = G
+
+
+def _call_with_worker_graph(func, chunk, args):
+    return func(_worker_graph, chunk, *args)
+
+
+def _call_with_graph(func, G, chunk, args):
+    return func(G, chunk, *args)
+
+
+class _GraphProcessPool(ProcessPoolExecutor):
+    """A process pool whose workers hold the graph `G`, which can be passed
+    as the executor of several calls of :func:`parallel_graph_imap` for the
+    same graph, so that `G` is only sent to the workers once."""
+
+    def __init__(self, G, n_workers):
+        super().__init__(n_workers, initializer=_set_worker_graph, initargs=(G,))
+        self.graph = G
+
+
+def _graph_task(func, G, pool):
+    """Returns the task that calls ``func(G, chunk, *args)`` for the
+    arguments ``(chunk, args)`` on `pool`, which only sends `G` along if the
+    workers of `pool` do not hold it already."""
+    if isinstance(pool, _GraphProcessPool) and pool.graph is G:
+        return partial(_call_with_worker_graph, func)
+    return partial(_call_with_graph, func, G)
+
+
+def parallel_graph_imap(
+    func, G, items, args=(), n_jobs=None, executor=None, chunksize=None
+):
+    """Yields ``func(G, chunk, *args)`` for consecutive chunks of `items`,
+    evaluating the chunks in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        A function taking the graph, a tuple of items and `args`. It has to
+        be picklable (a module level function) to run in worker processes.
+
+    G : NetworkX graph
+        The graph handed to `func`.
+
+    items : iterable
+        The items to split into chunks, for example the source nodes.
+
+    args : tuple, optional (default=())
+        Extra positional arguments for `func`.
+
+    n_jobs : int or None, optional (default=None)
+        The number of worker processes, see :func:`effective_n_jobs`. With a
+        single process the chunks are evaluated one by one in the calling
+        process.
+
+    executor : :class:`concurrent.futures.Executor`, optional (default=None)
+        An executor to run the chunks on instead of a new process pool. The
+        graph is then passed along with every chunk. `n_jobs` only sets how
+        many chunks are in flight at once, and defaults to the number of CPUs.
+
+    chunksize : int, optional (default=None)
+        The number of items per chunk. By default the items are split into
+        about four chunks per worker.
+
+    Yields
+    ------
+    The return value of `func` for each chunk, in the order of `items`.
+
+    Notes
+    -----
+    A new process pool sends `G` to each worker once, when the worker
+    starts (without any copy on platforms that fork). Only a bounded number
+    of chunks is in flight at any time, so results are streamed and a
+    consumer that stops early does not wait for the remaining work.
+
+    Examples
+    --------
+    >>> from networkx.utils import parallel_graph_imap
+    >>> def degrees(G, nodes):
+    ...     return [G.degree(n) for n in nodes]
+    >>> G = nx.path_graph(5)
+    >>> list(parallel_graph_imap(degrees, G, G, chunksize=2))
+    [[1, 2], [2, 2], [1]]
+    """
+    if executor is None:
+        n_workers = effective_n_jobs(n_jobs)
+    else:
+        n_workers = effective_n_jobs(-1 if n_jobs is None else n_jobs)
+    if chunksize is None:
+        items = list(items)
+        chunksize = max(1, math.ceil(len(items) / (4 * n_workers)))
+
+    if executor is None and n_workers == 1:
+        for chunk in chunks(items, chunksize):
+            yield func(G, chunk, *args)
+        return
+
+    if executor is None:
+        pool = _GraphProcessPool(G, n_workers)
+    else:
+        pool = executor
+    task = _graph_task(func, G, pool)
+
+    window = deque()
+    try:
+        for chunk in chunks(items, chunksize):
+            if len(window) == 2 * n_workers:
+                yield window.popleft().result()
+            window.append(pool.submit(task, chunk, args))
+        while window:
+            yield window.popleft().result()
+    finally:
+        for future in window:
+            future.cancel()
+        if executor is None:
+            pool.shutdown(wait=True, cancel_futures=True)
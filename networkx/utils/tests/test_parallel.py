@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import networkx as nx
+from networkx.utils import chunks, effective_n_jobs, parallel_graph_imap
+
+
+def _degrees(G, nodes, offset=0):
+    return [G.degree(n) + offset for n in nodes]
+
+
+def test_effective_n_jobs():
+    assert effective_n_jobs() == 1
+    assert effective_n_jobs(3) == 3
+    assert effective_n_jobs(-1) >= 1
+    assert effective_n_jobs(-1000) == 1
+    with pytest.raises(ValueError):
+        effective_n_jobs(0)
+
+
+def test_chunks():
+    assert list(chunks(range(7), 3)) == [(0, 1, 2), (3, 4, 5), (6,)]
+    assert list(chunks([], 3)) == []
+    assert list(chunks(iter("ab"), 5)) == [("a", "b")]
+
+
+@pytest.mark.parametrize("n_jobs", (None, 1, 2))
+def test_parallel_graph_imap(n_jobs):
+    G = nx.star_graph(10)
+    result = parallel_graph_imap(_degrees, G, G, args=(1,), n_jobs=n_jobs)
+    assert [d for chunk in result for d in chunk] == [11] + [2] * 10
+
+
+@pytest.mark.parametrize("chunksize", (None, 1, 4))
+def test_parallel_graph_imap_executor(chunksize):
+    G = nx.path_graph(9)
+    with ThreadPoolExecutor(3) as executor:
+        result = parallel_graph_imap(
+            _degrees, G, G, executor=executor, n_jobs=2, chunksize=chunksize
+        )
+        degrees = [d for chunk in result for d in chunk]
+    assert degrees == [1] + [2] * 7 + [1]
+
+
+def test_parallel_graph_imap_early_exit():
+    G = nx.path_graph(100)
+    with ThreadPoolExecutor(2) as executor:
+        result = parallel_graph_imap(_degrees, G, G, executor=executor, chunksize=1)
+        assert next(result) == [1]
+        result.close()
+
+
+def test_parallel_graph_imap_spawn():
+    # workers of a new interpreter unpickle the wrapped nodes of the graph
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    G = nx.path_graph(6)
+    expected = dict(nx.all_pairs_shortest_path_length(G))
+    with ProcessPoolExecutor(2, mp_context=get_context("spawn")) as executor:
+        result = nx.all_pairs_shortest_path_length(G, executor=executor)
+        assert dict(result) == expected